@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Author BGM Config Compiler
+Validates author_bgm_config.json and compiles its overrides into a sorted,
+mount_id-keyed table, so the plugin can binary-search the override for a
+mount instead of scanning the list on every mount event.
+
+Checks:
+    errors    (nothing is written)
+        - missing/ill-typed fields, mount_id outside uint, bgm_id outside ushort
+        - bgm_id not in xiv_bgm_en.csv
+        - bgm_name not matching that track's Title / Alt Title / Special Mode Title
+        - the same mount_id mapped to two different BGMs
+        - the same mount_name used with two different mount_ids
+    warnings
+        - mount_name not found in mount_sources_complete.json (by name,
+          since the scraped IDs are placeholders)
+        - an override repeated verbatim (kept once)
+
+Layout (little-endian):
+
+    Header (16 bytes)
+        magic           4s   b"BMAC"
+        version         u16
+        record_size     u16
+        record_count    u32
+        records_offset  u32
+
+    Records (sorted by mount_id)
+        mount_id        u32
+        bgm_id          u16
+        reserved        u16
+
+Usage:
+    python3 author_config_compiler.py [author_bgm_config.json] [output.bin]
+"""
+
+import bisect
+import json
+import struct
+import sys
+
+from bgm_catalog import INPUT_FILE as BGM_CSV, load_bgm_csv
+from mount_binary_db import normalize_name
+
+# ==========================
+# CONFIG
+# ==========================
+MAGIC = b"BMAC"
+FORMAT_VERSION = 1
+INPUT_FILE = "author_bgm_config.json"
+OUTPUT_FILE = "author_bgm_config.bin"
+MOUNT_DB_FILE = "mount_sources_complete.json"
+
+HEADER = struct.Struct("<4sHHII")
+RECORD = struct.Struct("<IHH")
+
+MAX_MOUNT_ID = 0xFFFFFFFF   # MountBGMOverride.MountId is a uint
+MAX_BGM_ID = 0xFFFF         # MountBGMOverride.BgmId is a ushort
+
+# ==========================
+# VALIDATION
+# ==========================
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_overrides(overrides, tracks, mount_names):
+    """Check every override; returns (table {mount_id: bgm_id}, errors, warnings)"""
+    tracks_by_id = {track["id"]: track for track in tracks}
+    table = {}
+    seen = {}               # mount_id -> first override
+    ids_by_name = {}        # normalized mount_name -> mount_id
+    errors = []
+    warnings = []
+
+    for position, override in enumerate(overrides, 1):
+        label = f"#{position} ({override.get('mount_name', '?')})"
+        mount_id = override.get("mount_id")
+        bgm_id = override.get("bgm_id")
+
+        if not _is_int(mount_id) or not 0 <= mount_id <= MAX_MOUNT_ID:
+            errors.append(f"{label}: mount_id {mount_id!r} is not a uint")
+            continue
+        if not _is_int(bgm_id) or not 0 <= bgm_id <= MAX_BGM_ID:
+            errors.append(f"{label}: bgm_id {bgm_id!r} is not a ushort")
+            continue
+
+        track = tracks_by_id.get(bgm_id)
+        if track is None:
+            errors.append(f"{label}: bgm_id {bgm_id} is not in {BGM_CSV}")
+        else:
+            titles = {normalize_name(track[field])
+                      for field in ("title", "alt_title", "special_mode_title") if track[field]}
+            bgm_name = override.get("bgm_name", "")
+            if normalize_name(bgm_name) not in titles:
+                errors.append(f"{label}: bgm_name '{bgm_name}' does not match "
+                              f"BGM {bgm_id} '{track['title']}'")
+
+        mount_name = normalize_name(override.get("mount_name", ""))
+        if mount_names is not None and mount_name not in mount_names:
+            warnings.append(f"{label}: mount_name not found in {MOUNT_DB_FILE}")
+        other_id = ids_by_name.setdefault(mount_name, mount_id)
+        if mount_name and other_id != mount_id:
+            errors.append(f"{label}: mount_name also used with mount_id {other_id}")
+
+        first = seen.get(mount_id)
+        if first is None:
+            seen[mount_id] = override
+            table[mount_id] = bgm_id
+        elif first.get("bgm_id") == bgm_id:
+            warnings.append(f"{label}: duplicate override for mount_id {mount_id}, kept once")
+        else:
+            errors.append(f"{label}: mount_id {mount_id} already mapped to BGM {first.get('bgm_id')}")
+
+    return table, errors, warnings
+
+
+def load_mount_names(path=MOUNT_DB_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            mounts = json.load(f)["mounts"]
+    except (OSError, ValueError, KeyError):
+        return None
+    return {normalize_name(m["name"]) for m in mounts.values()}
+
+
+# ==========================
+# WRITER
+# ==========================
+
+def build_table(table):
+    """Serialize {mount_id: bgm_id} as records sorted by mount_id"""
+    records = b"".join(RECORD.pack(mount_id, table[mount_id], 0) for mount_id in sorted(table))
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, len(table), HEADER.size)
+    return header + records
+
+
+def write_table(table, output_file=OUTPUT_FILE):
+    data = build_table(table)
+    with open(output_file, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ==========================
+# READER
+# ==========================
+
+class AuthorBgmTable:
+    """Reference reader: one read, binary search by mount_id"""
+
+    def __init__(self, data):
+        magic, version, record_size, self.count, records_offset = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a BetterMountBGM author BGM table")
+        records = [RECORD.unpack_from(data, records_offset + i * record_size) for i in range(self.count)]
+        self.mount_ids = [record[0] for record in records]
+        self.bgm_ids = [record[1] for record in records]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def get(self, mount_id):
+        index = bisect.bisect_left(self.mount_ids, mount_id)
+        if index < self.count and self.mount_ids[index] == mount_id:
+            return self.bgm_ids[index]
+        return None
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else INPUT_FILE
+    output_file = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_FILE
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        overrides = json.load(f).get("mount_bgm_overrides", [])
+
+    tracks, problems = load_bgm_csv(BGM_CSV)
+    if problems:
+        print(f"❌ {len(problems)} problems in {BGM_CSV}, run bgm_catalog.py for details")
+        sys.exit(1)
+    mount_names = load_mount_names()
+    if mount_names is None:
+        print(f"⚠️  {MOUNT_DB_FILE} not found, skipping mount name checks")
+
+    table, errors, warnings = validate_overrides(overrides, tracks, mount_names)
+
+    for warning in warnings:
+        print(f"  ⚠️  {warning}")
+    if errors:
+        print(f"❌ {len(errors)} errors in {input_file}:")
+        for error in errors:
+            print(f"  - {error}")
+        sys.exit(1)
+
+    size = write_table(table, output_file)
+    print(f"✅ {len(table)} overrides validated ({len(warnings)} warnings)")
+    print(f"📁 Saved to: {output_file} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
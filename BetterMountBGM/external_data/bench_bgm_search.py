@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+BGM search index parity check + benchmark
+
+Runs a set of picker queries against the real catalog twice: once with the
+naive scan the plugin does today (substring test on every track) and once
+through the trigram index. Checks both return the same tracks and reports
+the per-query speedup.
+
+Usage:
+    python3 bench_bgm_search.py [xiv_bgm_en.csv] [--repeat N] [--queries a b ...]
+"""
+
+import argparse
+import sys
+import time
+
+from bgm_catalog import INPUT_FILE, load_bgm_csv
+from bgm_search_index import BgmSearchIndex, build_index, search_texts
+
+DEFAULT_QUERIES = [
+    "gridania", "ul'dah", "battle", "theme", "the", "boss", "leves",
+    "fc workshop", "eureka", "moogle", "mount", "dungeon", "20", "xx", "zzq",
+]
+
+
+def naive_scan(texts, text):
+    """What the picker does today; texts are pre-lowered so only the scan is timed"""
+    needle = text.lower()
+    return [track_id for track_id, strings in texts
+            if any(needle in t for t in strings)]
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("csv_file", nargs="?", default=INPUT_FILE)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    args = parser.parse_args()
+
+    tracks, problems = load_bgm_csv(args.csv_file)
+    if problems:
+        print(f"❌ {len(problems)} problems in {args.csv_file}")
+        sys.exit(1)
+
+    build_time, data = timed(lambda: build_index(tracks), 1)
+    index = BgmSearchIndex(data, tracks)
+    texts = [(track["id"], search_texts(track)) for track in tracks]
+    print(f"🎵 {len(tracks)} tracks, {index.trigram_count} trigrams, "
+          f"{len(data):,} bytes, built in {build_time * 1000:.1f} ms\n")
+
+    print(f"{'query':<16}{'hits':>6}{'scan (us)':>12}{'index (us)':>12}{'speedup':>10}  parity")
+    ok = True
+    total_scan = total_index = 0.0
+    for query in args.queries:
+        scan_time, expected = timed(lambda: naive_scan(texts, query), args.repeat)
+        index_time, result = timed(lambda: index.query(query), args.repeat)
+        same = result == expected
+        ok = ok and same
+        total_scan += scan_time
+        total_index += index_time
+        print(f"{query:<16}{len(expected):>6}{scan_time * 1e6:>12.0f}{index_time * 1e6:>12.0f}"
+              f"{scan_time / index_time:>9.1f}x  {'✅' if same else '❌ DIFFERS'}")
+
+    print(f"\n{'total':<22}{total_scan * 1e6:>12.0f}{total_index * 1e6:>12.0f}"
+          f"{total_scan / total_index:>9.1f}x")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Mount text index parity check + latency benchmark
+
+Answers a set of queries over mount_sources_complete.json twice: by scanning
+and tokenizing every mount's description and acquired_by text, and through
+the inverted index. Checks both return the same mounts and reports latency.
+
+Usage:
+    python3 bench_mount_search.py [mount_sources_complete.json] [--repeat N] [--queries ...]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from mount_text_index import INPUT_FILE, TEXT_FIELDS, MountTextIndex, build_index, tokenize
+
+DEFAULT_QUERIES = [
+    "Gold Saucer MGP", "Allagan", "achievement", "treasure map", "Frontline PvP",
+    "Moogle Treasure Trove", "Mog Station", "Eureka", "wolf marks", "the of",
+]
+
+
+def naive_scan(mounts, text):
+    """Scan every mount's text, tokenizing it on the fly"""
+    terms = set(tokenize(text))
+    if not terms:
+        return []
+    hits = []
+    for key, mount in mounts.items():
+        tokens = set()
+        for field in TEXT_FIELDS:
+            tokens.update(tokenize(mount.get(field, "")))
+        if terms <= tokens:
+            hits.append(key)
+    return sorted(hits, key=int)
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("json_file", nargs="?", default=INPUT_FILE)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    args = parser.parse_args()
+
+    with open(args.json_file, 'r', encoding='utf-8') as f:
+        mounts = json.load(f)["mounts"]
+
+    build_time, data = timed(lambda: build_index(mounts), 1)
+    load_time, index = timed(lambda: MountTextIndex(data), args.repeat)
+    described = sum(1 for m in mounts.values() if m.get("description"))
+    print(f"🐎 {len(mounts)} mounts ({described} with descriptions), {index.term_count} terms, "
+          f"{len(data):,} bytes")
+    print(f"   built in {build_time * 1000:.1f} ms, loaded in {load_time * 1000:.2f} ms\n")
+
+    print(f"{'query':<24}{'hits':>6}{'scan (us)':>12}{'index (us)':>12}{'speedup':>10}  parity")
+    ok = True
+    total_scan = total_index = 0.0
+    for query in args.queries:
+        scan_time, expected = timed(lambda: naive_scan(mounts, query), args.repeat)
+        index_time, result = timed(lambda: index.query(query), args.repeat)
+        same = result == expected
+        ok = ok and same
+        total_scan += scan_time
+        total_index += index_time
+        print(f"{query:<24}{len(expected):>6}{scan_time * 1e6:>12.0f}{index_time * 1e6:>12.0f}"
+              f"{scan_time / max(index_time, 1e-9):>9.1f}x  {'✅' if same else '❌ DIFFERS'}")
+
+    print(f"\n{'total':<30}{total_scan * 1e6:>12.0f}{total_index * 1e6:>12.0f}"
+          f"{total_scan / max(total_index, 1e-9):>9.1f}x")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
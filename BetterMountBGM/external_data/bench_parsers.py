@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Parser backend parity check + benchmark
+
+Runs the Mounts-table and description extraction on saved wiki pages with
+every available parser backend and with the streaming parsers (row by row
+for the table, stopping at the first </blockquote> for mount pages), checks
+that each one produces exactly the same JSON as the original full
+'html.parser' tree, and reports the speedup and the share of each mount page
+the streaming path had to read.
+
+Usage:
+    python3 bench_parsers.py mounts_wiki.html [mount_page.html ...] [--repeat N]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from bs4 import BeautifulSoup
+
+from html_backend import available_backends, find_description_blockquote, find_mount_table
+from mount_pipeline import MOUNT_TABLE_HEADERS, clean_text, extract_mount_data
+from stream_parse import PAGE_CHUNK_SIZE, find_blockquote_streamed, iter_table_rows
+
+
+def legacy_mount_table(content):
+    """The original lookup: full tree, then every table's headers"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for table in soup.find_all('table'):
+        header_text = ' '.join([h.get_text() for h in table.find_all('th')])
+        if all(h in header_text for h in MOUNT_TABLE_HEADERS):
+            return table
+    return None
+
+
+def legacy_blockquote(content):
+    return BeautifulSoup(content, 'html.parser').find('blockquote')
+
+
+def table_to_json(table):
+    return rows_to_json(table.find_all('tr')[1:])
+
+
+def rows_to_json(rows):
+    records = [extract_mount_data(row, {}) for row in rows]
+    return json.dumps([r for r in records if r], ensure_ascii=False, sort_keys=True)
+
+
+def chunks(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+def blockquote_to_text(blockquote):
+    if not blockquote:
+        return ""
+    text = blockquote.get_text(separator="\n")
+    return clean_text(re.sub(r'—\s*In-game description.*$', '', text, flags=re.I))
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("mounts_html")
+    parser.add_argument("mount_pages", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.mounts_html, 'rb') as f:
+        mounts_html = f.read()
+    pages = []
+    for path in args.mount_pages:
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+
+    def run_legacy():
+        table_json = table_to_json(legacy_mount_table(mounts_html))
+        return table_json, [blockquote_to_text(legacy_blockquote(p)) for p in pages]
+
+    baseline_time, baseline = timed(run_legacy, args.repeat)
+    print(f"{'backend':<22}{'time (ms)':>12}{'speedup':>10}  parity")
+    print(f"{'legacy html.parser':<22}{baseline_time * 1000:>12.1f}{1.0:>9.2f}x  -")
+
+    ok = True
+    for backend in available_backends():
+        def run(backend=backend):
+            table_json = table_to_json(find_mount_table(mounts_html, MOUNT_TABLE_HEADERS, backend))
+            return table_json, [blockquote_to_text(find_description_blockquote(p, backend)) for p in pages]
+
+        elapsed, result = timed(run, args.repeat)
+        same = result == baseline
+        ok = ok and same
+        print(f"{backend:<22}{elapsed * 1000:>12.1f}{baseline_time / elapsed:>9.2f}x  "
+              f"{'✅ identical' if same else '❌ DIFFERS'}")
+
+    read = []
+
+    def run_stream():
+        table_json = rows_to_json(iter_table_rows([mounts_html.decode("utf-8")], MOUNT_TABLE_HEADERS))
+        read.clear()
+        texts = []
+        for page in pages:
+            blockquote, nbytes = find_blockquote_streamed(chunks(page, PAGE_CHUNK_SIZE))
+            read.append(nbytes)
+            texts.append(blockquote_to_text(blockquote))
+        return table_json, texts
+
+    elapsed, result = timed(run_stream, args.repeat)
+    same = result == baseline
+    ok = ok and same
+    print(f"{'stream (partial)':<22}{elapsed * 1000:>12.1f}{baseline_time / elapsed:>9.2f}x  "
+          f"{'✅ identical' if same else '❌ DIFFERS'}")
+    if pages:
+        total = sum(len(p) for p in pages)
+        print(f"\n📉 Streaming read {sum(read):,} of {total:,} mount page bytes "
+              f"({sum(read) / total:.0%})")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
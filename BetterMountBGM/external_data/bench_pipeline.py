@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Scraping pipeline benchmark on recorded fixtures
+
+Uses a fixture archive written by `mount_pipeline.py --record` (see
+wiki_fixtures.py), so results do not depend on the live wiki:
+
+- table location per parser backend, row extraction (rows/s), clean_text
+  (calls/s), description parsing full and streamed (pages/s) and JSON
+  emission (MB/s), each with its tracemalloc peak memory
+- end-to-end builds: mount_pipeline.py runs in a scratch directory with
+  --replay against the archive served with simulated latency / errors,
+  with the stage breakdown from its run_metrics.json
+
+Every run is appended as one JSON line to the results file, so backends,
+modes and revisions can be compared over time.
+
+Usage:
+    python3 bench_pipeline.py wiki_fixtures.zip [--repeat N]
+                              [--modes base,html,stream] [--latency-ms 50]
+                              [--jitter-ms 20] [--error-rate 0.0]
+                              [--output bench_pipeline_results.jsonl]
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from html_backend import available_backends, find_description_blockquote, find_mount_table
+from mount_pipeline import (MOUNT_TABLE_HEADERS, MOUNTS_URL, blockquote_description,
+                            clean_text, database_header, extract_mount_data, parse_mount_page)
+from run_metrics import METRICS_FILE
+from stream_parse import PAGE_CHUNK_SIZE, find_blockquote_streamed
+from wiki_fixtures import FaultInjector, fixture_key, load_fixtures, start_server
+
+# ==========================
+# CONFIG
+# ==========================
+RESULTS_FILE = "bench_pipeline_results.jsonl"
+HERE = os.path.dirname(os.path.abspath(__file__))
+PIPELINE = os.path.join(HERE, "mount_pipeline.py")
+
+E2E_MODES = {
+    "base": ["--no-descriptions"],          # Mounts page only
+    "stream-table": ["--stream"],           # Rows written while the page downloads
+    "html": ["--backend", "html"],          # One mount page per description, process pool
+    "stream": ["--backend", "stream"],      # Mount pages read up to the description
+    "api": ["--backend", "api"],            # Batched api.php (needs recorded api.php traffic)
+}
+DEFAULT_MODES = "base,html,stream"
+
+# ==========================
+# MEASUREMENT
+# ==========================
+
+def measure(fn, repeat):
+    """(best seconds over `repeat` runs, result, tracemalloc peak bytes of one extra run)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, result, peak
+
+
+def stage_result(seconds, peak, items=None, unit=None, nbytes=None):
+    result = {"seconds": round(seconds, 6), "peak_memory_bytes": peak}
+    if items is not None:
+        result["items"] = items
+        result[f"{unit}_per_second"] = round(items / seconds, 1) if seconds else None
+    if nbytes is not None:
+        result["bytes"] = nbytes
+        result["mb_per_second"] = round(nbytes / seconds / 1e6, 2) if seconds else None
+    return result
+
+
+def chunks(data, size):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+# ==========================
+# MICRO BENCHMARKS
+# ==========================
+
+def bench_stages(fixtures, repeat):
+    """Per-stage timings on the recorded Mounts page and mount pages"""
+    entry = fixtures.get(fixture_key(MOUNTS_URL))
+    if entry is None:
+        raise SystemExit(f"❌ {fixture_key(MOUNTS_URL)} is not in the archive")
+    mounts_html = entry["content"]
+    stages = {}
+
+    for backend in available_backends():
+        seconds, table, peak = measure(
+            lambda backend=backend: find_mount_table(mounts_html, MOUNT_TABLE_HEADERS, backend), repeat)
+        if table is None:
+            raise SystemExit("❌ Mount table not found in the recorded Mounts page")
+        stages[f"locate_table[{backend}]"] = stage_result(seconds, peak, nbytes=len(mounts_html))
+
+    rows = table.find_all('tr')[1:]
+
+    def extract():
+        type_icons = {}
+        records = [extract_mount_data(row, type_icons) for row in rows]
+        return {str(i): r for i, r in enumerate((r for r in records if r), 1)}
+
+    seconds, mounts, peak = measure(extract, repeat)
+    stages["extract_rows"] = stage_result(seconds, peak, len(rows), "rows")
+
+    cell_texts = [td.get_text() for row in rows for td in row.find_all('td')]
+    seconds, _, peak = measure(lambda: [clean_text(text) for text in cell_texts], repeat)
+    stages["clean_text"] = stage_result(seconds, peak, len(cell_texts), "calls")
+
+    pages = []
+    for mount in mounts.values():
+        page = fixtures.get(fixture_key(mount["wiki_url"])) if mount["wiki_url"] else None
+        if page is not None and page["status"] == 200:
+            pages.append(page["content"])
+    page_bytes = sum(len(p) for p in pages)
+
+    if pages:
+        for backend in available_backends():
+            seconds, _, peak = measure(
+                lambda backend=backend: [blockquote_description(find_description_blockquote(p, backend))
+                                         for p in pages], repeat)
+            result = stage_result(seconds, peak, len(pages), "pages", page_bytes)
+            stages[f"parse_description[{backend}]"] = result
+
+        seconds, _, peak = measure(lambda: [parse_mount_page(p) for p in pages], repeat)
+        stages["parse_mount_page"] = stage_result(seconds, peak, len(pages), "pages", page_bytes)
+
+        def streamed():
+            read = 0
+            for page in pages:
+                blockquote, nbytes = find_blockquote_streamed(chunks(page, PAGE_CHUNK_SIZE))
+                blockquote_description(blockquote)
+                read += nbytes
+            return read
+
+        seconds, read, peak = measure(streamed, repeat)
+        stages["parse_description[stream]"] = stage_result(seconds, peak, len(pages), "pages", read)
+
+    def emit():
+        output = database_header()
+        output["total_mounts"] = len(mounts)
+        output["mounts"] = mounts
+        buffer = io.StringIO()
+        json.dump(output, buffer, indent=2, ensure_ascii=False)
+        return len(buffer.getvalue().encode('utf-8'))
+
+    seconds, size, peak = measure(emit, repeat)
+    stages["emit_json"] = stage_result(seconds, peak, len(mounts), "mounts", size)
+    return stages
+
+
+# ==========================
+# END TO END
+# ==========================
+
+def bench_end_to_end(archive, modes, faults):
+    """Time full mount_pipeline.py runs replayed against the served archive"""
+    server, url = start_server(archive, faults=faults)
+    results = {}
+    try:
+        for mode in modes:
+            before = dict(faults.stats)
+            with tempfile.TemporaryDirectory() as scratch:
+                command = [sys.executable, PIPELINE, "--replay", url] + E2E_MODES[mode]
+                start = time.perf_counter()
+                done = subprocess.run(command, cwd=scratch, capture_output=True, text=True)
+                seconds = time.perf_counter() - start
+                metrics_path = os.path.join(scratch, METRICS_FILE)
+                metrics = {}
+                if os.path.exists(metrics_path):
+                    with open(metrics_path, 'r', encoding='utf-8') as f:
+                        metrics = json.load(f)
+            results[mode] = {
+                "seconds": round(seconds, 3),
+                "ok": done.returncode == 0,
+                "requests": {k: faults.stats[k] - before[k] for k in before},
+                "stages": metrics.get("stages", {}),
+            }
+            status = "✅" if done.returncode == 0 else "❌"
+            print(f"   {status} {mode:<14}{seconds:>8.2f}s  {results[mode]['requests']}")
+            if done.returncode:
+                print("      " + "\n      ".join(done.stderr.strip().splitlines()[-5:]))
+    finally:
+        server.shutdown()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_stages(stages):
+    print(f"{'stage':<32}{'time (ms)':>10}{'rate':>20}{'peak mem':>12}")
+    for name, result in stages.items():
+        rate = next((f"{v:,.0f} {k[:-len('_per_second')]}/s" for k, v in result.items()
+                     if k.endswith("_per_second") and k != "mb_per_second" and v is not None), "")
+        if not rate and result.get("mb_per_second") is not None:
+            rate = f"{result['mb_per_second']:.1f} MB/s"
+        print(f"{name:<32}{result['seconds'] * 1000:>10.1f}{rate:>20}"
+              f"{result['peak_memory_bytes'] / 1024:>9,.0f} KiB")
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("archive", help="fixture archive from mount_pipeline.py --record")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--modes", default=DEFAULT_MODES,
+                        help=f"end-to-end modes, comma separated, from {', '.join(E2E_MODES)} "
+                             "('' skips end-to-end runs; default: %(default)s)")
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--jitter-ms", type=float, default=20)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default=RESULTS_FILE, help="JSON lines file the run is appended to")
+    args = parser.parse_args()
+
+    modes = [m for m in args.modes.split(",") if m]
+    unknown = [m for m in modes if m not in E2E_MODES]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+
+    fixtures = load_fixtures(args.archive)
+    print(f"🗃️  {args.archive}: {len(fixtures)} recorded responses\n")
+    stages = bench_stages(fixtures, args.repeat)
+    print_stages(stages)
+
+    end_to_end = {}
+    if modes:
+        print(f"\n🛰️  End to end (latency {args.latency_ms:g}±{args.jitter_ms:g} ms, "
+              f"error rate {args.error_rate:g}):")
+        faults = FaultInjector(args.latency_ms, args.jitter_ms, args.error_rate, seed=args.seed)
+        end_to_end = bench_end_to_end(args.archive, modes, faults)
+
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "backends": available_backends(),
+        "archive": os.path.basename(args.archive),
+        "repeat": args.repeat,
+        "network": {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms,
+                    "error_rate": args.error_rate, "seed": args.seed},
+        "stages": stages,
+        "end_to_end": end_to_end,
+    }
+    with open(args.output, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+    print(f"\n📁 Appended to: {args.output}")
+
+    sys.exit(0 if all(r["ok"] for r in end_to_end.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
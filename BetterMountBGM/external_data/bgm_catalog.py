@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+BGM Catalog Compiler
+Parses xiv_bgm_en.csv with a real CSV reader (about 150 rows have quoted
+commas, e.g. "Leves, FC Workshop", which a plain Split(',') cuts apart),
+validates the track IDs and writes a pre-parsed binary catalog the plugin
+can load with a single read and no per-line parsing.
+
+Validation:
+    - every row has the 6 expected columns
+    - IDs are integers in ushort range (0..65535), like BGMInfo.ID
+    - IDs are unique
+
+Layout (little-endian):
+
+    Header (32 bytes)
+        magic           4s   b"BGMC"
+        version         u16
+        field_count     u16  string columns per row (5)
+        row_count       u32
+        string_count    u32
+        ids_offset      u32  -> ID column
+        rows_offset     u32  -> string ID rows
+        strings_offset  u32  -> string table
+        reserved        4x
+
+    ID column
+        id              u16 * row_count, sorted ascending (binary-searchable),
+                        padded to a 4-byte boundary
+
+    Rows (row i belongs to ids[i])
+        title, alt_title, special_mode_title, locations, comments
+                        u32 string IDs
+
+    String table
+        offsets         u32 * (string_count + 1)   byte offsets into blob
+        blob            UTF-8 bytes
+      Same interning as mount_binary_db: every distinct string is stored
+      once and string 0 is always "".
+
+Usage:
+    python3 bgm_catalog.py [xiv_bgm_en.csv] [output.bin]
+"""
+
+import bisect
+import csv
+import struct
+import sys
+
+from mount_binary_db import StringTable
+
+# ==========================
+# CONFIG
+# ==========================
+MAGIC = b"BGMC"
+FORMAT_VERSION = 1
+INPUT_FILE = "xiv_bgm_en.csv"
+OUTPUT_FILE = "xiv_bgm_en.bin"
+MAX_ID = 0xFFFF             # BGMInfo.ID is a ushort
+
+HEADER = struct.Struct("<4sHHIIIII4x")
+
+CSV_COLUMNS = ("ID", "Title", "Alt Title", "Special Mode Title", "Locations", "Comments")
+STRING_FIELDS = ("title", "alt_title", "special_mode_title", "locations", "comments")
+ROW = struct.Struct(f"<{len(STRING_FIELDS)}I")
+
+# ==========================
+# PARSE + VALIDATE
+# ==========================
+
+def load_bgm_csv(path=INPUT_FILE):
+    """Parse the catalog CSV; returns (tracks sorted by ID, list of problems)"""
+    tracks = {}
+    problems = []
+
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or tuple(h.strip() for h in header) != CSV_COLUMNS:
+            problems.append(f"unexpected header: {header}")
+
+        for row in reader:
+            line = reader.line_num
+            if not any(cell.strip() for cell in row):
+                continue
+            if len(row) != len(CSV_COLUMNS):
+                problems.append(f"line {line}: expected {len(CSV_COLUMNS)} columns, got {len(row)}")
+                continue
+
+            raw_id = row[0].strip()
+            if not raw_id.isdigit():
+                problems.append(f"line {line}: ID '{raw_id}' is not a number")
+                continue
+            track_id = int(raw_id)
+            if track_id > MAX_ID:
+                problems.append(f"line {line}: ID {track_id} does not fit in a ushort")
+                continue
+            if track_id in tracks:
+                problems.append(f"line {line}: duplicate ID {track_id}")
+                continue
+
+            track = {"id": track_id}
+            track.update(zip(STRING_FIELDS, row[1:]))
+            tracks[track_id] = track
+
+    return [tracks[track_id] for track_id in sorted(tracks)], problems
+
+
+# ==========================
+# WRITER
+# ==========================
+
+def build_catalog(tracks):
+    """Serialize tracks (sorted by ID) to bytes"""
+    strings = StringTable()
+    row_bytes = bytearray()
+    for track in tracks:
+        row_bytes += ROW.pack(*(strings.add(track.get(field, "")) for field in STRING_FIELDS))
+
+    id_bytes = struct.pack(f"<{len(tracks)}H", *(track["id"] for track in tracks))
+    id_bytes += b"\0" * (-len(id_bytes) % 4)
+    string_bytes = strings.to_bytes()
+
+    ids_offset = HEADER.size
+    rows_offset = ids_offset + len(id_bytes)
+    strings_offset = rows_offset + len(row_bytes)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(STRING_FIELDS), len(tracks), len(strings.strings),
+        ids_offset, rows_offset, strings_offset,
+    )
+    return header + id_bytes + bytes(row_bytes) + string_bytes
+
+
+def write_catalog(tracks, output_file=OUTPUT_FILE):
+    data = build_catalog(tracks)
+    with open(output_file, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ==========================
+# READER
+# ==========================
+
+class BgmCatalog:
+    """Reference reader: one read, binary search by ID"""
+
+    def __init__(self, data):
+        (magic, version, field_count, self.row_count, self.string_count,
+         self.ids_offset, self.rows_offset, self.strings_offset) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION or field_count != len(STRING_FIELDS):
+            raise ValueError("not a BetterMountBGM BGM catalog")
+        self.data = data
+        self.ids = struct.unpack_from(f"<{self.row_count}H", data, self.ids_offset)
+        self.blob_offset = self.strings_offset + (self.string_count + 1) * 4
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def string(self, sid):
+        start, end = struct.unpack_from("<II", self.data, self.strings_offset + sid * 4)
+        return self.data[self.blob_offset + start:self.blob_offset + end].decode("utf-8")
+
+    def track(self, index):
+        sids = ROW.unpack_from(self.data, self.rows_offset + index * ROW.size)
+        track = {"id": self.ids[index]}
+        track.update((field, self.string(sid)) for field, sid in zip(STRING_FIELDS, sids))
+        return track
+
+    def get(self, track_id):
+        index = bisect.bisect_left(self.ids, track_id)
+        if index < self.row_count and self.ids[index] == track_id:
+            return self.track(index)
+        return None
+
+    def __iter__(self):
+        for index in range(self.row_count):
+            yield self.track(index)
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else INPUT_FILE
+    output_file = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_FILE
+
+    print(f"🎵 Reading {input_file}...")
+    tracks, problems = load_bgm_csv(input_file)
+
+    if problems:
+        print(f"❌ {len(problems)} problems found:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+
+    size = write_catalog(tracks, output_file)
+    catalog = BgmCatalog.load(output_file)
+    quoted = sum(1 for track in tracks if any(',' in track[field] for field in STRING_FIELDS))
+
+    print(f"✅ {catalog.row_count} tracks (IDs {catalog.ids[0]}-{catalog.ids[-1]}), "
+          f"{quoted} with embedded commas")
+    print(f"📁 Saved to: {output_file} ({size:,} bytes, {catalog.string_count} unique strings)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+BGM Search Index Builder
+Prebuilds a trigram index over xiv_bgm_en.csv for the BGM picker, so a search
+only has to verify the few tracks that contain every trigram of the query
+instead of scanning every Title/Locations string on each keystroke.
+
+Indexed text per track: Title, Alt Title, Special Mode Title, Locations and
+the ID as a decimal string (the picker also matches on the ID). Text is lower
+cased, and trigrams never span two fields.
+
+Layout (little-endian):
+
+    Header (24 bytes)
+        magic           4s   b"BGMT"
+        version         u16
+        entry_size      u16
+        trigram_count   u32
+        entries_offset  u32  -> trigram table
+        keys_offset     u32  -> trigram key blob
+        postings_offset u32  -> posting lists
+
+    Trigram table (sorted by key bytes, binary-searchable)
+        key_offset      u32  into the key blob
+        key_length      u16  UTF-8 length of the trigram
+        reserved        u16
+        posting_offset  u32  into the postings blob
+        posting_count   u32  number of track IDs
+
+    Keys      UTF-8 trigrams
+    Postings  per trigram, sorted track IDs stored as LEB128 varints: the
+              first ID as-is, then the gap to the previous ID
+
+Candidates from the index are a superset of the matches (trigrams can occur
+in a different order), so query() re-checks each one with a substring test.
+Queries shorter than 3 characters have no trigram and fall back to a scan.
+
+Usage:
+    python3 bgm_search_index.py [xiv_bgm_en.csv] [output.bin]
+"""
+
+import bisect
+import struct
+import sys
+
+from bgm_catalog import INPUT_FILE, load_bgm_csv
+
+# ==========================
+# CONFIG
+# ==========================
+MAGIC = b"BGMT"
+FORMAT_VERSION = 1
+OUTPUT_FILE = "xiv_bgm_search.bin"
+GRAM = 3
+
+HEADER = struct.Struct("<4sHHIIII")
+ENTRY = struct.Struct("<IHHII")
+
+SEARCH_FIELDS = ("title", "alt_title", "special_mode_title", "locations")
+
+# ==========================
+# HELPERS
+# ==========================
+
+def search_texts(track):
+    """Lower-cased strings a track can be found by"""
+    texts = [track.get(field, "").lower() for field in SEARCH_FIELDS]
+    texts.append(str(track["id"]))
+    return [text for text in texts if text]
+
+
+def trigrams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+def encode_varint(value, out):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, pos):
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_postings(ids):
+    out = bytearray()
+    previous = 0
+    for track_id in ids:
+        encode_varint(track_id - previous, out)
+        previous = track_id
+    return out
+
+
+def decode_postings(data, pos, count):
+    ids = []
+    track_id = 0
+    for _ in range(count):
+        gap, pos = decode_varint(data, pos)
+        track_id += gap
+        ids.append(track_id)
+    return ids
+
+
+# ==========================
+# BUILD
+# ==========================
+
+def build_postings(tracks):
+    """trigram -> sorted list of track IDs"""
+    postings = {}
+    for track in tracks:
+        grams = set()
+        for text in search_texts(track):
+            grams |= trigrams(text)
+        for gram in grams:
+            postings.setdefault(gram, []).append(track["id"])
+    for ids in postings.values():
+        ids.sort()
+    return postings
+
+
+def build_index(tracks):
+    """Serialize the trigram index to bytes"""
+    postings = build_postings(tracks)
+    keyed = sorted((gram.encode("utf-8"), ids) for gram, ids in postings.items())
+
+    entries = bytearray()
+    keys = bytearray()
+    blob = bytearray()
+    for key, ids in keyed:
+        entries += ENTRY.pack(len(keys), len(key), 0, len(blob), len(ids))
+        keys += key
+        blob += encode_postings(ids)
+
+    entries_offset = HEADER.size
+    keys_offset = entries_offset + len(entries)
+    postings_offset = keys_offset + len(keys)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, ENTRY.size, len(keyed),
+        entries_offset, keys_offset, postings_offset,
+    )
+    return header + bytes(entries) + bytes(keys) + bytes(blob)
+
+
+def write_index(tracks, output_file=OUTPUT_FILE):
+    data = build_index(tracks)
+    with open(output_file, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ==========================
+# READER / QUERY
+# ==========================
+
+class BgmSearchIndex:
+    """Reference reader: binary search on trigrams, intersect posting lists"""
+
+    def __init__(self, data, tracks):
+        (magic, version, self.entry_size, self.trigram_count,
+         self.entries_offset, self.keys_offset, self.postings_offset) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a BetterMountBGM BGM search index")
+        self.data = data
+        self.tracks = {track["id"]: track for track in tracks}
+        self.texts = {track["id"]: search_texts(track) for track in tracks}
+        self.keys = [self.key(i) for i in range(self.trigram_count)]
+
+    @classmethod
+    def load(cls, path, tracks):
+        with open(path, 'rb') as f:
+            return cls(f.read(), tracks)
+
+    def entry(self, index):
+        return ENTRY.unpack_from(self.data, self.entries_offset + index * self.entry_size)
+
+    def key(self, index):
+        key_offset, key_length, _, _, _ = self.entry(index)
+        start = self.keys_offset + key_offset
+        return bytes(self.data[start:start + key_length])
+
+    def postings(self, gram):
+        key = gram.encode("utf-8")
+        index = bisect.bisect_left(self.keys, key)
+        if index == self.trigram_count or self.keys[index] != key:
+            return []
+        _, _, _, posting_offset, count = self.entry(index)
+        return decode_postings(self.data, self.postings_offset + posting_offset, count)
+
+    def candidates(self, needle):
+        """Track IDs containing every trigram of `needle` (None = no trigram to use)"""
+        grams = trigrams(needle)
+        if not grams:
+            return None
+        lists = sorted((self.postings(gram) for gram in grams), key=len)
+        result = set(lists[0])
+        for ids in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(ids)
+        return sorted(result)
+
+    def query(self, text):
+        """IDs of tracks whose indexed text contains `text` (case-insensitive)"""
+        needle = text.lower()
+        if not needle:
+            return sorted(self.tracks)
+        ids = self.candidates(needle)
+        if ids is None:
+            ids = sorted(self.tracks)
+        return [track_id for track_id in ids
+                if any(needle in t for t in self.texts[track_id])]
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else INPUT_FILE
+    output_file = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_FILE
+
+    tracks, problems = load_bgm_csv(input_file)
+    if problems:
+        print(f"❌ {len(problems)} problems in {input_file}, run bgm_catalog.py for details")
+        sys.exit(1)
+
+    size = write_index(tracks, output_file)
+    index = BgmSearchIndex.load(output_file, tracks)
+
+    print(f"✅ Indexed {len(tracks)} tracks, {index.trigram_count} trigrams")
+    print(f"📁 Saved to: {output_file} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
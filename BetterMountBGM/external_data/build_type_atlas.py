@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Mount Type Icon Atlas Builder
+Packs every mount-type icon into one atlas PNG plus a type -> UV manifest,
+so the plugin can load a single texture instead of ~40 separate files.
+
+Icons are looked up (first match wins) in:
+    type_icons/replaced/   - hand-fixed replacements
+    ../images/types/       - the icons the plugin ships today
+    type_icons/            - raw downloads from mount_n_image_web_scrap.py
+                             (hash-named, resolved through manifest.json)
+
+Identical source files (e.g. the deep dungeon icon used by several types)
+are packed once and share a cell.
+
+Requirements:
+    pip install pillow
+
+Usage:
+    python3 build_type_atlas.py [--size 64]
+
+Output:
+    ../images/type_atlas.png - The atlas texture
+    type_atlas.json          - type -> pixel rect + UV rect manifest
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# ==========================
+# CONFIG
+# ==========================
+HERE = os.path.dirname(os.path.abspath(__file__))
+ICON_SIZE = 64              # Every icon is normalized to ICON_SIZE x ICON_SIZE
+PADDING = 2                 # Transparent gutter around each cell (avoids bleeding)
+FALLBACK_TYPE = "Unknown"
+
+SEARCH_DIRS = [
+    os.path.join(HERE, "type_icons", "replaced"),
+    os.path.join(HERE, "..", "images", "types"),
+    os.path.join(HERE, "type_icons"),
+]
+TYPE_ICONS_FILE = os.path.join(HERE, "type_icons.json")
+DOWNLOAD_MANIFEST = os.path.join(HERE, "type_icons", "manifest.json")
+ATLAS_FILE = os.path.join(HERE, "..", "images", "type_atlas.png")
+MANIFEST_FILE = os.path.join(HERE, "type_atlas.json")
+
+# Wiki type -> icon file, same mapping as ConfigWindow's type icon switch
+TYPE_ICON_FILES = {
+    "Main Scenario": "Main_scenario_icon1.png",
+    "Quests": "Quests_icon1.png",
+    "Premium": "Premium_icon1.png",
+    "Campaigns": "Campaigns_icon1.png",
+    "Limited": "Limited_icon1.png",
+    "Seasonal Event": "Seasonal_events_icon1.png",
+    "Gold Saucer": "Gold_saucer_icon1.png",
+    "Gil": "Gil_icon1.png",
+    "Treasure Hunt": "Treasure_hunt_icon1.png",
+    "Dungeons": "Dungeons_icon1.png",
+    "V&C Dungeons": "Variant_and_criterion_dungeons_icon1.png",
+    "Trials": "Trials_icon1.png",
+    "Raids": "Raids_icon1.png",
+    "Chaotic Alliance Raid": "Chaotic_alliance_raid_icon1.png",
+    "Achievements": "Achievements_icon1.png",
+    "Achievement Certificates": "Achievement_currency_icon1.png",
+    "Deep Dungeon": "Deep_dungeons_icon1.png",
+    "FATE": "Fates_icon1.png",
+    "Shared FATEs": "Shared_fates_icon1.png",
+    "PvP": "Pvp_icon1.png",
+    "PvP (Ranked)": "Pvp_icon1.png",
+    "Crafting": "Crafting_icon1.png",
+    "Gathering": "Gathering_icon1.png",
+    "The Hunt": "The_hunt_icon1.png",
+    "Occult Crescent": "Occult_crescent_icon1.png",
+    "Bozja": "Bozja_icon1.png",
+    "Ishgardian Restoration": "Ishgardian_restoration_icon1.png",
+    "Cosmic Exploration": "Cosmic_exploration_icon1.png",
+    "Heaven-on-High": "Deep_dungeons_icon1.png",
+    "Eureka": "Eureka_icon1.png",
+    "Eureka Orthos": "Deep_dungeons_icon1.png",
+    "Palace of the Dead": "Deep_dungeons_icon1.png",
+    "Pilgrim's Traverse": "Deep_dungeons_icon1.png",
+    "Custom Deliveries": "Custom_deliveries_icon1.png",
+    "Faux Hollows": "Faux_hollows_icon1.png",
+    "Wondrous Tails": "Wondrous_tails_icon1.png",
+    "Allied Societies": "Allied_society_quests_icon1.png",
+    "Island Sanctuary": "Island_sanctuary_icon1.png",
+    FALLBACK_TYPE: "Unknown_Icon.png",
+}
+
+# ==========================
+# HELPERS
+# ==========================
+
+def find_icon(filename):
+    """Return the first existing path for an icon file name"""
+    for folder in SEARCH_DIRS:
+        path = os.path.join(folder, filename)
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+    return None
+
+
+def collect_type_icons():
+    """type -> source PNG path, using TYPE_ICON_FILES then scraped type_icons.json"""
+    wanted = dict(TYPE_ICON_FILES)
+
+    if os.path.exists(TYPE_ICONS_FILE):
+        with open(TYPE_ICONS_FILE, 'r', encoding='utf-8') as f:
+            for type_name, icon in json.load(f).items():
+                wanted.setdefault(type_name, icon['filename'])
+
+    # Downloaded icons are stored under their content hash
+    downloaded = {}
+    if os.path.exists(DOWNLOAD_MANIFEST):
+        with open(DOWNLOAD_MANIFEST, 'r', encoding='utf-8') as f:
+            for entry in json.load(f).values():
+                downloaded[entry['source_filename']] = entry['file']
+
+    sources = {}
+    for type_name, filename in wanted.items():
+        path = find_icon(filename)
+        if not path and filename in downloaded:
+            path = find_icon(downloaded[filename])
+        if path:
+            sources[type_name] = path
+        else:
+            print(f"  ⚠️  No icon for {type_name} ({filename}), using {FALLBACK_TYPE}")
+
+    return sources
+
+
+def normalize_icon(path, size):
+    """Load an icon as RGBA and fit it, centered, into a size x size square"""
+    with Image.open(path) as img:
+        img = img.convert("RGBA")
+        img.thumbnail((size, size), Image.LANCZOS)
+        cell = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        cell.paste(img, ((size - img.width) // 2, (size - img.height) // 2))
+        return cell
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+# ==========================
+# ATLAS
+# ==========================
+
+def build_atlas(sources, size=ICON_SIZE, padding=PADDING):
+    """Pack unique icons into a square-ish grid; returns (atlas, manifest)"""
+    # Deduplicate identical files so shared icons occupy one cell
+    cells = {}
+    type_cells = {}
+    for type_name, path in sorted(sources.items()):
+        digest = file_digest(path)
+        if digest not in cells:
+            cells[digest] = path
+        type_cells[type_name] = digest
+
+    order = list(cells)
+    columns = max(1, math.ceil(math.sqrt(len(order))))
+    rows = max(1, math.ceil(len(order) / columns))
+    stride = size + padding * 2
+    width, height = columns * stride, rows * stride
+
+    atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    rects = {}
+    for index, digest in enumerate(order):
+        x = (index % columns) * stride + padding
+        y = (index // columns) * stride + padding
+        atlas.paste(normalize_icon(cells[digest], size), (x, y))
+        rects[digest] = {
+            "x": x, "y": y, "w": size, "h": size,
+            "u0": round(x / width, 6),
+            "v0": round(y / height, 6),
+            "u1": round((x + size) / width, 6),
+            "v1": round((y + size) / height, 6),
+        }
+
+    manifest = {
+        "atlas": os.path.basename(ATLAS_FILE),
+        "width": width,
+        "height": height,
+        "icon_size": size,
+        "fallback": FALLBACK_TYPE,
+        "types": {type_name: rects[digest] for type_name, digest in sorted(type_cells.items())},
+    }
+    return atlas, manifest
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Mount Type Icon Atlas Builder")
+    parser.add_argument("--size", type=int, default=ICON_SIZE,
+                        help="edge length each icon is normalized to (default: %(default)s)")
+    args = parser.parse_args()
+
+    if Image is None:
+        print("❌ Pillow is required: pip install pillow")
+        return
+
+    print("🖼️  Collecting type icons...")
+    sources = collect_type_icons()
+    if FALLBACK_TYPE not in sources:
+        print(f"❌ Fallback icon for '{FALLBACK_TYPE}' not found")
+        return
+
+    atlas, manifest = build_atlas(sources, args.size)
+
+    os.makedirs(os.path.dirname(ATLAS_FILE), exist_ok=True)
+    atlas.save(ATLAS_FILE, optimize=True)
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    unique = len({(r['x'], r['y']) for r in manifest['types'].values()})
+    print(f"✅ Packed {len(manifest['types'])} types ({unique} unique icons) "
+          f"into {manifest['width']}x{manifest['height']}")
+    print(f"📁 Saved to: {os.path.normpath(ATLAS_FILE)}")
+    print(f"📁 Saved to: {MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+HTML parser backend shared by the wiki scrapers.
+
+The scrapers only ever need two things out of a page: the Mounts table and
+the first <blockquote> of a mount page. Instead of building a full
+'html.parser' tree and walking every table, these helpers
+
+- use lxml as the BeautifulSoup tree builder when it is installed
+  (falling back to the pure-Python 'html.parser'), and
+- only build the elements they need via a SoupStrainer.
+
+The returned objects are regular BeautifulSoup tags, so the existing row and
+description extraction code works unchanged on every backend.
+
+Optional:
+    pip install lxml
+"""
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# ==========================
+# CONFIG
+# ==========================
+PARSER_BACKEND = "auto"     # "auto", "lxml" or "html.parser"
+BACKENDS = ("lxml", "html.parser")
+
+
+def available_backends():
+    """Backends usable in this environment, fastest first"""
+    return [b for b in BACKENDS if b != "lxml" or HAS_LXML]
+
+
+def parser_name(backend=None):
+    """Resolve a backend setting to a BeautifulSoup feature name"""
+    backend = backend or PARSER_BACKEND
+    if backend == "auto":
+        return "lxml" if HAS_LXML else "html.parser"
+    if backend == "lxml" and not HAS_LXML:
+        raise RuntimeError("lxml backend requested but lxml is not installed")
+    return backend
+
+
+def make_soup(content, parse_only=None, backend=None):
+    """Parse HTML with the configured backend"""
+    return BeautifulSoup(content, parser_name(backend), parse_only=parse_only)
+
+
+def find_mount_table(content, required_headers=("Name", "Seats"), backend=None):
+    """Return the first <table> whose headers contain all `required_headers`"""
+    soup = make_soup(content, SoupStrainer('table'), backend)
+
+    for table in soup.find_all('table'):
+        header_text = ' '.join(h.get_text() for h in table.find_all('th'))
+        if all(h in header_text for h in required_headers):
+            return table
+
+    return None
+
+
+def find_description_blockquote(content, backend=None):
+    """Return the first <blockquote> of a mount page, or None"""
+    soup = make_soup(content, SoupStrainer('blockquote'), backend)
+    return soup.find('blockquote')
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk HTTP cache shared by the wiki scrapers.
+
+Responses are stored under `.http_cache/` keyed by URL, together with their
+ETag / Last-Modified validators. A cached entry younger than CACHE_MAX_AGE is
+served straight from disk; an older one is revalidated with a conditional GET
+(If-None-Match / If-Modified-Since), so an unchanged page costs a 304 instead
+of a full download.
+
+Requests that do go out use the shared pooled, retrying client
+(http_client.py), so every scraper stage shares keep-alive connections as
+well as the cache.
+
+Usage:
+    from http_cache import cached_get, print_cache_stats
+
+    response = cached_get(url, timeout=30)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content, 'html.parser')
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+
+from http_client import get as http_get
+
+# ==========================
+# CONFIG
+# ==========================
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache")
+CACHE_MAX_AGE = 3600        # Seconds a cached response is served without revalidation
+CACHE_ENABLED = True        # Set False to always hit the network
+
+CACHE_STATS = {
+    "hits": 0,              # Served from disk, no request sent
+    "revalidated": 0,       # Conditional GET answered with 304
+    "misses": 0,            # Full download (new or changed URL)
+    "stale": 0,             # Network failed, stale copy served instead
+}
+_stats_lock = threading.Lock()
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response backed by the disk cache"""
+
+    def __init__(self, url, status_code, content, headers, cache_status):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.cache_status = cache_status
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+# ==========================
+# STORAGE
+# ==========================
+
+def _cache_paths(url):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(CACHE_DIR, key[:2], key)
+    return base + ".json", base + ".body"
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_entry(url):
+    """Return (metadata, body) for a cached URL, or (None, None)"""
+    meta_path, body_path = _cache_paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    return meta, body
+
+
+def store_entry(url, response):
+    """Persist a 200 response together with its validators"""
+    meta_path, body_path = _cache_paths(url)
+    os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+    meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_type": response.headers.get("Content-Type"),
+        "fetched_at": time.time(),
+    }
+    _write_atomic(body_path, response.content)
+    _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+    return meta
+
+
+def touch_entry(url, meta):
+    """Mark a revalidated entry as fresh again"""
+    meta_path, _ = _cache_paths(url)
+    meta["fetched_at"] = time.time()
+    _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+
+def _count(stat):
+    with _stats_lock:
+        CACHE_STATS[stat] += 1
+
+
+def _from_entry(url, meta, body, cache_status):
+    headers = {"Content-Type": meta.get("content_type") or ""}
+    return CachedResponse(url, 200, body, headers, cache_status)
+
+
+# ==========================
+# PUBLIC API
+# ==========================
+
+def set_cache_enabled(enabled):
+    """Turn the disk cache on or off for this process (record / replay runs bypass it)"""
+    global CACHE_ENABLED
+    CACHE_ENABLED = enabled
+
+
+def cached_get(url, timeout=30, rate_limiter=None, max_age=None):
+    """GET a URL through the disk cache.
+
+    `rate_limiter` (a HostRateLimiter) is only consulted when a request
+    actually goes out, so fresh cache hits never wait for a token. If the
+    network still fails after the client's retries, a cached copy is served.
+    """
+    if max_age is None:
+        max_age = CACHE_MAX_AGE
+
+    meta, body = load_entry(url) if CACHE_ENABLED else (None, None)
+
+    if meta is not None and time.time() - meta.get("fetched_at", 0) < max_age:
+        _count("hits")
+        return _from_entry(url, meta, body, "hit")
+
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = http_get(url, headers=headers, timeout=timeout, rate_limiter=rate_limiter)
+    except requests.RequestException:
+        if meta is not None:
+            _count("stale")
+            return _from_entry(url, meta, body, "stale")
+        raise
+
+    if response.status_code >= 500 and meta is not None:
+        _count("stale")
+        return _from_entry(url, meta, body, "stale")
+
+    if response.status_code == 304 and meta is not None:
+        touch_entry(url, meta)
+        _count("revalidated")
+        return _from_entry(url, meta, body, "revalidated")
+
+    _count("misses")
+    if response.status_code == 200 and CACHE_ENABLED:
+        store_entry(url, response)
+
+    return CachedResponse(
+        url, response.status_code, response.content, response.headers, "miss"
+    )
+
+
+def print_cache_stats():
+    """Print a one-line summary of cache effectiveness for this run"""
+    total = sum(CACHE_STATS.values())
+    if not total:
+        return
+    print(
+        f"🗄️  HTTP cache: {CACHE_STATS['hits']} hits, "
+        f"{CACHE_STATS['revalidated']} revalidated (304), "
+        f"{CACHE_STATS['misses']} downloaded"
+        + (f", {CACHE_STATS['stale']} stale fallbacks" if CACHE_STATS['stale'] else "")
+    )
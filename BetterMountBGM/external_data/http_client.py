@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the wiki scrapers.
+
+One connection-pooled requests.Session serves every request (Mounts page,
+mount pages, api.php batches, icons), so hundreds of requests reuse a few
+keep-alive connections instead of paying a TCP + TLS handshake each.
+
+Transient failures are retried: connection errors, timeouts and 429 / 5xx
+responses, with exponential backoff and full jitter. A Retry-After header
+(seconds or HTTP date) takes precedence over the computed delay.
+
+Every attempt is timed; print_request_stats() summarizes the run.
+
+For offline runs (see wiki_fixtures.py) every request can be sent to a local
+stand-in server with use_stand_in(), and every final response can be handed
+to a recorder with set_recorder(). Recording reads every body in full, so
+stream=True responses are downloaded completely before the caller reads
+them, and REQUEST_STATS["bytes"] counts the whole body.
+
+Usage:
+    from http_client import get, print_request_stats
+
+    response = get(url, timeout=30, rate_limiter=limiter)
+    response.raise_for_status()
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+# ==========================
+# CONFIG
+# ==========================
+POOL_SIZE = 16              # Keep-alive connections kept per host
+MAX_RETRIES = 4             # Extra attempts after the first one
+BACKOFF_BASE = 0.5          # Seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_MAX = 30.0          # Upper bound for a computed backoff
+RETRY_AFTER_MAX = 120.0     # Upper bound for a server-provided Retry-After
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+STAND_IN_URL = None         # Base URL every request is redirected to (replay)
+RECORDER = None             # Receives (url, response) for every final response (record)
+
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+
+TIMINGS = []                # (url, status or exception name, seconds, attempt) per attempt
+REQUEST_STATS = {
+    "requests": 0,          # Calls to get()
+    "attempts": 0,          # HTTP attempts, retries included
+    "retries": 0,
+    "failures": 0,          # Calls that gave up with an exception
+    "bytes": 0,             # Body bytes received (streamed bodies: as far as they were read)
+}
+_stats_lock = threading.Lock()
+
+# ==========================
+# HELPERS
+# ==========================
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff for the given retry number (0-based)"""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def retry_after_delay(response):
+    """Seconds requested by a Retry-After header, or None"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        delay = float(value)
+    else:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, min(RETRY_AFTER_MAX, delay))
+
+
+def _record(url, outcome, seconds, attempt):
+    with _stats_lock:
+        TIMINGS.append((url, outcome, seconds, attempt))
+        REQUEST_STATS["attempts"] += 1
+        if attempt:
+            REQUEST_STATS["retries"] += 1
+
+
+def _target(url):
+    """URL actually requested: the stand-in server's host when one is set"""
+    if not STAND_IN_URL:
+        return url
+    parts = urlsplit(url)
+    base = urlsplit(STAND_IN_URL)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+
+# ==========================
+# PUBLIC API
+# ==========================
+
+def use_stand_in(base_url):
+    """Send every request to `base_url` (keeping path and query), or None for the real hosts"""
+    global STAND_IN_URL
+    STAND_IN_URL = base_url
+
+
+def set_recorder(recorder):
+    """Hand every final response to `recorder.record(url, response)`, or None to stop"""
+    global RECORDER
+    RECORDER = recorder
+
+
+def count_bytes(nbytes):
+    """Add body bytes read from a stream=True response to REQUEST_STATS"""
+    with _stats_lock:
+        REQUEST_STATS["bytes"] += nbytes
+
+
+def count_streamed(response, nbytes):
+    """count_bytes() for a stream=True response, unless get() already counted its whole body"""
+    if not getattr(response, "body_counted", False):
+        count_bytes(nbytes)
+
+
+def get(url, headers=None, timeout=30, stream=False, rate_limiter=None, max_retries=MAX_RETRIES):
+    """GET `url` over the pooled session, retrying transient failures.
+
+    `rate_limiter` (a HostRateLimiter) is acquired before every attempt.
+    The last response is returned even if its status is still retryable.
+    """
+    with _stats_lock:
+        REQUEST_STATS["requests"] += 1
+
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire(url)
+
+        start = time.perf_counter()
+        try:
+            response = SESSION.get(_target(url), headers=headers, timeout=timeout, stream=stream)
+        except RETRY_EXCEPTIONS as e:
+            _record(url, type(e).__name__, time.perf_counter() - start, attempt)
+            if attempt == max_retries:
+                with _stats_lock:
+                    REQUEST_STATS["failures"] += 1
+                raise
+            delay = backoff_delay(attempt)
+        else:
+            _record(url, response.status_code, time.perf_counter() - start, attempt)
+            if response.status_code not in RETRY_STATUSES or attempt == max_retries:
+                if RECORDER is not None:
+                    # Reads the whole body, even for stream=True
+                    RECORDER.record(url, response)
+                if not stream or RECORDER is not None:
+                    count_bytes(len(response.content))
+                    response.body_counted = True
+                return response
+            delay = retry_after_delay(response)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            response.close()
+
+        time.sleep(delay)
+
+
+def print_request_stats():
+    """Print request count, retries and latency percentiles for this run"""
+    if not TIMINGS:
+        return
+    latencies = sorted(seconds for _, _, seconds, _ in TIMINGS)
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    print(
+        f"🌐 HTTP: {REQUEST_STATS['requests']} requests, {REQUEST_STATS['bytes'] / 1024:,.0f} KiB, "
+        f"{REQUEST_STATS['retries']} retries"
+        + (f", {REQUEST_STATS['failures']} failed" if REQUEST_STATS['failures'] else "")
+        + f", latency p50 {percentile(0.5):.0f} ms / p95 {percentile(0.95):.0f} ms"
+        f" / max {latencies[-1] * 1000:.0f} ms"
+    )
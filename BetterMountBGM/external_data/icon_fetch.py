@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Parallel, content-addressed type icon downloader.
+
+Icons are fetched concurrently through the shared pooled, retrying client
+(http_client.py) and stored as `<sha256 prefix>.<ext>`, so the same image
+published under several file names is kept once. `manifest.json` in the icon folder maps each type to its file:
+
+    {
+      "Gil": {
+        "file": "3f1c0d9a2b7e4c51.png",
+        "sha256": "...",
+        "size": 4120,
+        "source_url": "https://.../Gil_icon1.png",
+        "source_filename": "Gil_icon1.png"
+      }
+    }
+
+On a re-run, any type whose source URL is unchanged and whose file is still
+present (right size, valid image header) is skipped without a request. If a
+refetch fails, the type keeps its previous entry as long as that file is
+still valid, so a transient error never drops an icon from the manifest.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import get as http_get
+
+# ==========================
+# CONFIG
+# ==========================
+MAX_WORKERS = 8             # Icon downloads kept in flight
+HASH_PREFIX = 16            # Hex digits of the sha256 used in file names
+MANIFEST_NAME = "manifest.json"
+
+IMAGE_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",
+    b"GIF87a", b"GIF89a",
+    b"\xff\xd8\xff",
+    b"RIFF",
+)
+
+_write_lock = threading.Lock()
+
+# ==========================
+# HELPERS
+# ==========================
+
+def full_size_url(img_url):
+    """Strip MediaWiki thumbnail sizing from an image URL"""
+    # Example: /thumb/c/c4/Gold_saucer_icon1.png/40px-Gold_saucer_icon1.png
+    # Becomes: /c/c4/Gold_saucer_icon1.png
+    return re.sub(r'/thumb(/.*?)/\d+px-.*?$', r'\1', img_url)
+
+
+def load_manifest(folder):
+    path = os.path.join(folder, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(folder, manifest):
+    path = os.path.join(folder, MANIFEST_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_valid_icon(path, size):
+    """Cheap validity check: expected size and a known image signature"""
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        with open(path, 'rb') as f:
+            head = f.read(8)
+    except OSError:
+        return False
+    return head.startswith(IMAGE_SIGNATURES)
+
+
+def _store(folder, content, source_filename):
+    """Write content under its hash name unless an identical file exists"""
+    digest = hashlib.sha256(content).hexdigest()
+    ext = os.path.splitext(source_filename)[1].lower() or ".png"
+    filename = f"{digest[:HASH_PREFIX]}{ext}"
+    path = os.path.join(folder, filename)
+
+    with _write_lock:
+        if not is_valid_icon(path, len(content)):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+    return filename, digest
+
+
+# ==========================
+# DOWNLOAD
+# ==========================
+
+def _fetch_one(type_name, icon_info, folder, rate_limiter):
+    url = full_size_url(icon_info['url'])
+    try:
+        response = http_get(url, timeout=10, rate_limiter=rate_limiter)
+        response.raise_for_status()
+        content = response.content
+        if not content.startswith(IMAGE_SIGNATURES):
+            raise ValueError("response is not an image")
+    except Exception as e:
+        print(f"  ⚠️  Failed to download {icon_info['filename']}: {e}")
+        return type_name, None, e
+
+    filename, digest = _store(folder, content, icon_info['filename'])
+    return type_name, {
+        "file": filename,
+        "sha256": digest,
+        "size": len(content),
+        "source_url": url,
+        "source_filename": icon_info['filename'],
+    }, None
+
+
+def download_icons(type_icons, folder, max_workers=MAX_WORKERS, rate_limiter=None, failures=None):
+    """Download type icons into `folder`; returns (manifest, downloaded, skipped).
+
+    Icons that could not be downloaded are added to `failures` (type -> exception) if given;
+    their previous manifest entry is kept while its file is still valid.
+    """
+    os.makedirs(folder, exist_ok=True)
+    previous = load_manifest(folder)
+    manifest = {}
+    pending = []
+
+    for type_name, icon_info in type_icons.items():
+        entry = previous.get(type_name)
+        if (entry and entry.get("source_url") == full_size_url(icon_info['url'])
+                and is_valid_icon(os.path.join(folder, entry["file"]), entry["size"])):
+            manifest[type_name] = entry
+        else:
+            pending.append((type_name, icon_info))
+
+    skipped = len(manifest)
+    downloaded = 0
+
+    if pending:
+        print(f"  📥 Downloading {len(pending)} icons ({skipped} already present)...")
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_fetch_one, type_name, icon_info, folder, rate_limiter)
+                for type_name, icon_info in pending
+            ]
+            for future in futures:
+                type_name, entry, error = future.result()
+                if entry:
+                    manifest[type_name] = entry
+                    downloaded += 1
+                    continue
+                old = previous.get(type_name)
+                if old and is_valid_icon(os.path.join(folder, old["file"]), old["size"]):
+                    manifest[type_name] = old
+                if failures is not None:
+                    failures[type_name] = error
+
+    save_manifest(folder, manifest)
+    return manifest, downloaded, skipped
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Incremental rebuild helpers for the mount scrapers.
+
+Each table row is fingerprinted (hash of its cell texts and name link) and the
+fingerprint is stored on the record as `row_hash`. On the next run, rows whose
+fingerprint is unchanged reuse the previous record - including its
+`description` - so only new or changed rows need their detail page fetched.
+"""
+
+import hashlib
+import json
+import os
+
+TABLE_FIELDS = (
+    "name", "type", "acquired_by", "patch", "seats",
+    "obtainable", "cash_shop", "market_board",
+)
+
+
+def row_fingerprint(cols, href=""):
+    """Stable hash of a table row's cell contents and link"""
+    h = hashlib.sha1()
+    for col in cols:
+        h.update(' '.join(col.get_text().split()).encode("utf-8"))
+        h.update(b"\x1f")
+    h.update((href or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_previous(path):
+    """Load the mounts of a previous build, or {} if there is none"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("mounts", {})
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Could not read previous build {path}: {e}")
+        return {}
+
+
+def _same_table_data(old, new):
+    return all(old.get(k) == new.get(k) for k in TABLE_FIELDS)
+
+
+def merge_previous(mounts, previous):
+    """Reuse unchanged records from a previous build.
+
+    Mutates `mounts` in place and returns (to_fetch, report) where `to_fetch`
+    lists the mounts that still need their detail page and `report` holds the
+    added / changed / removed mount names.
+    """
+    by_hash = {}
+    by_name = {}
+    for old in previous.values():
+        if old.get("row_hash"):
+            by_hash[old["row_hash"]] = old
+        by_name[old.get("name", "").lower()] = old
+
+    report = {"added": [], "changed": [], "removed": [], "unchanged": 0}
+    to_fetch = []
+
+    for mount in mounts.values():
+        key = mount["name"].lower()
+        old = by_hash.get(mount.get("row_hash"))
+        if old is None:
+            # Builds from before row hashes existed: compare the table fields
+            legacy = by_name.get(key)
+            if legacy and not legacy.get("row_hash") and _same_table_data(legacy, mount):
+                old = legacy
+
+        if old is not None and "description" in old:
+            mount["description"] = old["description"]
+            report["unchanged"] += 1
+            continue
+
+        to_fetch.append(mount)
+        if key in by_name:
+            report["changed"].append(mount["name"])
+        else:
+            report["added"].append(mount["name"])
+
+    current = {m["name"].lower() for m in mounts.values()}
+    report["removed"] = sorted(
+        old["name"] for name, old in by_name.items() if name not in current
+    )
+    return to_fetch, report
+
+
+def print_change_report(report):
+    """Print the added / changed / removed summary of an incremental run"""
+    print("\n🔁 Incremental rebuild:")
+    print(f"   Unchanged: {report['unchanged']}")
+    for label in ("added", "changed", "removed"):
+        names = report[label]
+        print(f"   {label.capitalize()}: {len(names)}")
+        for name in names:
+            print(f"     - {name}")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Compact binary companion to mount_sources_complete.json.
+
+The plugin can load this file with a single read and look a mount up by name
+in constant time, instead of deserializing the pretty-printed JSON and
+scanning every record.
+
+Layout (little-endian):
+
+    Header (40 bytes)
+        magic           4s   b"BMDB"
+        version         u16
+        record_size     u16
+        record_count    u32
+        string_count    u32
+        strings_offset  u32  -> string table
+        records_offset  u32  -> fixed-width records
+        index_offset    u32  -> name hash index
+        bucket_count    u32  (power of two)
+        reserved        8x
+
+    String table
+        offsets         u32 * (string_count + 1)   byte offsets into blob
+        blob            UTF-8 bytes
+      Every distinct string (names, types, patches, acquired_by text,
+      descriptions, URLs) is stored once; records refer to it by ID.
+      String 0 is always "".
+
+    Records (record_size bytes each, record i at records_offset + i * record_size)
+        name, type, acquired_by, patch, description, wiki_url   u32 string IDs
+        seats           u8
+        flags           u8   bit0 obtainable, bit1 cash_shop, bit2 market_board
+        reserved        u16
+
+    Name index (bucket_count buckets of 8 bytes, open addressing, linear probing)
+        hash            u32  FNV-1a 32 of normalize_name(name) as UTF-8
+        record          u32  record index + 1 (0 = empty bucket)
+
+Usage:
+    python3 mount_binary_db.py [mount_sources_complete.json] [output.bin]
+"""
+
+import json
+import struct
+import sys
+
+# ==========================
+# CONFIG
+# ==========================
+MAGIC = b"BMDB"
+FORMAT_VERSION = 1
+OUTPUT_FILE = "mount_sources_complete.bin"
+
+HEADER = struct.Struct("<4sHHIIIIII8x")
+RECORD = struct.Struct("<IIIIIIBBH")
+BUCKET = struct.Struct("<II")
+
+STRING_FIELDS = ("name", "type", "acquired_by", "patch", "description", "wiki_url")
+FLAG_FIELDS = ("obtainable", "cash_shop", "market_board")
+
+# ==========================
+# HELPERS
+# ==========================
+
+def normalize_name(name):
+    """Lookup key: trimmed, single-spaced, lower case"""
+    return ' '.join(name.split()).lower()
+
+
+def fnv1a_32(data):
+    h = 0x811C9DC5
+    for byte in data:
+        h ^= byte
+        h = (h * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def name_hash(name):
+    return fnv1a_32(normalize_name(name).encode("utf-8"))
+
+
+class StringTable:
+    """Interns strings and serializes them as offsets + one UTF-8 blob"""
+
+    def __init__(self):
+        self.ids = {"": 0}
+        self.strings = [""]
+
+    def add(self, value):
+        value = value or ""
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = len(self.strings)
+            self.ids[value] = sid
+            self.strings.append(value)
+        return sid
+
+    def to_bytes(self):
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+
+
+# ==========================
+# WRITER
+# ==========================
+
+def build_binary_db(mounts):
+    """Serialize the `mounts` dict of the JSON database to bytes"""
+    records = list(mounts.values())
+    strings = StringTable()
+    record_bytes = bytearray()
+
+    for mount in records:
+        sids = [strings.add(mount.get(field, "")) for field in STRING_FIELDS]
+        flags = sum(1 << bit for bit, field in enumerate(FLAG_FIELDS) if mount.get(field))
+        seats = max(0, min(255, int(mount.get("seats", 1))))
+        record_bytes += RECORD.pack(*sids, seats, flags, 0)
+
+    bucket_count = 1
+    while bucket_count < max(1, len(records)) * 2:
+        bucket_count *= 2
+    buckets = [(0, 0)] * bucket_count
+    for index, mount in enumerate(records):
+        h = name_hash(mount["name"])
+        slot = h & (bucket_count - 1)
+        while buckets[slot][1]:
+            if normalize_name(records[buckets[slot][1] - 1]["name"]) == normalize_name(mount["name"]):
+                break   # Keep the first record for duplicate names
+            slot = (slot + 1) & (bucket_count - 1)
+        else:
+            buckets[slot] = (h, index + 1)
+
+    string_bytes = strings.to_bytes()
+    strings_offset = HEADER.size
+    records_offset = strings_offset + len(string_bytes)
+    index_offset = records_offset + len(record_bytes)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, RECORD.size, len(records), len(strings.strings),
+        strings_offset, records_offset, index_offset, bucket_count,
+    )
+    index_bytes = b"".join(BUCKET.pack(*bucket) for bucket in buckets)
+    return header + string_bytes + bytes(record_bytes) + index_bytes
+
+
+def write_binary_db(mounts, output_file=OUTPUT_FILE):
+    data = build_binary_db(mounts)
+    with open(output_file, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ==========================
+# READER
+# ==========================
+
+class BinaryMountDB:
+    """Reference reader: one read, O(1) lookups by name"""
+
+    def __init__(self, data):
+        (magic, version, self.record_size, self.record_count, self.string_count,
+         self.strings_offset, self.records_offset, self.index_offset,
+         self.bucket_count) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a BetterMountBGM binary mount database")
+        self.data = data
+        self.blob_offset = self.strings_offset + (self.string_count + 1) * 4
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def string(self, sid):
+        start, end = struct.unpack_from("<II", self.data, self.strings_offset + sid * 4)
+        return self.data[self.blob_offset + start:self.blob_offset + end].decode("utf-8")
+
+    def record(self, index):
+        values = RECORD.unpack_from(self.data, self.records_offset + index * self.record_size)
+        mount = {field: self.string(sid) for field, sid in zip(STRING_FIELDS, values)}
+        mount["seats"] = values[6]
+        for bit, field in enumerate(FLAG_FIELDS):
+            mount[field] = bool(values[7] & (1 << bit))
+        return mount
+
+    def find_index(self, name):
+        h = name_hash(name)
+        key = normalize_name(name)
+        mask = self.bucket_count - 1
+        slot = h & mask
+        for _ in range(self.bucket_count):
+            bucket_hash, record = BUCKET.unpack_from(self.data, self.index_offset + slot * BUCKET.size)
+            if record == 0:
+                return None
+            if bucket_hash == h:
+                name_sid = struct.unpack_from("<I", self.data, self.records_offset + (record - 1) * self.record_size)[0]
+                if normalize_name(self.string(name_sid)) == key:
+                    return record - 1
+            slot = (slot + 1) & mask
+        return None
+
+    def get(self, name):
+        index = self.find_index(name)
+        return None if index is None else self.record(index)
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else "mount_sources_complete.json"
+    output_file = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_FILE
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        mounts = json.load(f)["mounts"]
+
+    size = write_binary_db(mounts, output_file)
+    db = BinaryMountDB.load(output_file)
+
+    print(f"📁 Saved to: {output_file} ({size:,} bytes, "
+          f"{db.record_count} mounts, {db.string_count} unique strings)")
+
+
+if __name__ == "__main__":
+    main()
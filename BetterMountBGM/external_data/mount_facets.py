@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Facet summary and per-type partitions of the mount database.
+
+    mount_facets.json   precomputed counts and memberships:
+        types           type -> mount count
+        patches         expansion bucket ("2.x", "3.x", ...) -> mount count
+        flags           obtainable / unobtainable / cash_shop / market_board counts
+        members         type -> sorted mount keys
+        shards          type -> shard file (only with partitioning)
+
+    mount_types/        optional, one file per acquisition type, each in the
+                        mount_sources_complete.json layout with just that
+                        type's mounts
+
+The type filter list and "is this mount of type X" both become lookups in
+the summary instead of walks over the whole database, and a UI showing one
+type can load only that type's shard.
+
+Usage:
+    python3 mount_facets.py [mount_sources_complete.json] [--partition-types]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+
+# ==========================
+# CONFIG
+# ==========================
+INPUT_FILE = "mount_sources_complete.json"
+FACETS_FILE = "mount_facets.json"
+TYPES_FOLDER = "mount_types"
+UNKNOWN_PATCH = "Unknown"
+
+FLAG_FIELDS = ("obtainable", "cash_shop", "market_board")
+
+# ==========================
+# HELPERS
+# ==========================
+
+def patch_bucket(patch):
+    """Expansion bucket of a patch string: "6.35" -> "6.x" """
+    match = re.match(r"\s*(\d+)\.", patch or "")
+    return f"{match.group(1)}.x" if match else UNKNOWN_PATCH
+
+
+def _bucket_order(item):
+    """Sort key for patch buckets: numeric expansion order ("2.x" < "10.x"), Unknown last"""
+    bucket = item[0]
+    major = bucket.split(".", 1)[0]
+    return (not major.isdigit(), int(major) if major.isdigit() else 0, bucket)
+
+
+def type_slug(type_name, taken):
+    """File-system safe, unique shard name for a type"""
+    base = re.sub(r"[^a-z0-9]+", "_", type_name.lower()).strip("_") or "unknown"
+    slug = base
+    n = 2
+    while slug in taken:
+        slug = f"{base}_{n}"
+        n += 1
+    taken.add(slug)
+    return slug
+
+
+def _sorted_keys(keys):
+    return sorted(keys, key=lambda key: (not key.isdigit(), int(key) if key.isdigit() else 0, key))
+
+
+# ==========================
+# FACETS
+# ==========================
+
+def build_facets(mounts):
+    """Counts and type memberships for the mounts dict"""
+    types = {}
+    patches = {}
+    members = {}
+    flags = {field: 0 for field in FLAG_FIELDS}
+
+    for key, mount in mounts.items():
+        type_name = mount.get("type", "")
+        types[type_name] = types.get(type_name, 0) + 1
+        bucket = patch_bucket(mount.get("patch"))
+        patches[bucket] = patches.get(bucket, 0) + 1
+        members.setdefault(type_name, []).append(key)
+        for field in FLAG_FIELDS:
+            if mount.get(field):
+                flags[field] += 1
+
+    flags["unobtainable"] = len(mounts) - flags["obtainable"]
+    return {
+        "total_mounts": len(mounts),
+        "types": dict(sorted(types.items())),
+        "patches": dict(sorted(patches.items(), key=_bucket_order)),
+        "flags": flags,
+        "members": {type_name: _sorted_keys(keys) for type_name, keys in sorted(members.items())},
+    }
+
+
+def write_type_shards(header, mounts, members, folder=TYPES_FOLDER):
+    """One database file per type; returns type -> relative shard path"""
+    os.makedirs(folder, exist_ok=True)
+    shards = {}
+    taken = set()
+    for type_name, keys in members.items():
+        filename = f"{type_slug(type_name, taken)}.json"
+        output = dict(header)
+        output["type"] = type_name
+        output["total_mounts"] = len(keys)
+        output["mounts"] = {key: mounts[key] for key in keys}
+        with open(os.path.join(folder, filename), 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+        shards[type_name] = f"{folder}/{filename}"
+
+    # Drop shards of types that no longer exist
+    written = {os.path.basename(path) for path in shards.values()}
+    for path in glob.glob(os.path.join(folder, "*.json")):
+        if os.path.basename(path) not in written:
+            os.remove(path)
+    return shards
+
+
+def write_facets(header, mounts, partition=False, facets_file=FACETS_FILE, types_folder=TYPES_FOLDER):
+    """Write the facet summary (and type shards); returns the summary"""
+    facets = build_facets(mounts)
+    if partition:
+        facets["shards"] = write_type_shards(header, mounts, facets["members"], types_folder)
+
+    output = dict(header)
+    output.pop("note", None)
+    output.update(facets)
+    with open(facets_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    return facets
+
+
+def print_facets(facets):
+    print(f"🧮 Facets: {len(facets['types'])} types, "
+          f"{', '.join(f'{bucket} {count}' for bucket, count in facets['patches'].items())}")
+    if "shards" in facets:
+        print(f"   {len(facets['shards'])} type shards in {TYPES_FOLDER}/")
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Mount facet summary / per-type partitions")
+    parser.add_argument("input_file", nargs="?", default=INPUT_FILE)
+    parser.add_argument("--partition-types", action="store_true",
+                        help=f"also write one shard per type into {TYPES_FOLDER}/")
+    args = parser.parse_args()
+
+    with open(args.input_file, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+    mounts = database.pop("mounts")
+    database.pop("total_mounts", None)
+
+    facets = write_facets(database, mounts, args.partition_types)
+    print_facets(facets)
+    print(f"📁 Saved to: {FACETS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
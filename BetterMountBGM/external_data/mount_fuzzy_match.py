@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Fuzzy resolution of wiki mount names the Mount sheet join could not match.
+
+Names that differ from the game's Singular by punctuation, a leading article
+or a small rename are looked up in a BK-tree built over the fuzzy keys of
+the still-unclaimed game rows. The tree uses the triangle inequality to skip
+whole subtrees, so a query computes edit distances for only part of the
+game names instead of every one of them.
+
+Every unresolved wiki name gets a ranked candidate list (distance, RowId).
+A candidate is accepted when it is the single best one and its distance is
+within ACCEPT_DISTANCE (and small relative to the name length). Accepted
+matches are written to mount_aliases.json, which mount_sheet_join.py applies
+on later runs with a plain dictionary lookup.
+
+Usage:
+    python3 mount_fuzzy_match.py Mount.csv [mount_sources_complete.json] [--accept]
+"""
+
+import argparse
+import json
+import re
+
+from mount_sheet_join import (
+    ALIASES_FILE, INPUT_FILE, join_key, join_mounts, load_aliases, load_mount_sheet,
+)
+
+# ==========================
+# CONFIG
+# ==========================
+MAX_DISTANCE = 4            # Candidates farther than this are not reported
+MAX_CANDIDATES = 5          # Candidates kept per unresolved name
+ACCEPT_DISTANCE = 2         # Best candidate accepted up to this distance...
+ACCEPT_RATIO = 0.25         # ...and at most this fraction of the name length
+
+ARTICLES = ("the ", "a ", "an ")
+
+# ==========================
+# HELPERS
+# ==========================
+
+def fuzzy_key(name):
+    """join_key without punctuation or a leading article"""
+    key = re.sub(r"[^\w ]+", "", join_key(name))
+    key = ' '.join(key.split())
+    for article in ARTICLES:
+        if key.startswith(article):
+            return key[len(article):]
+    return key
+
+
+def levenshtein(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree over strings with Levenshtein distance"""
+
+    def __init__(self, distance=levenshtein):
+        self.distance = distance
+        self.root = None            # [key, values, {distance: child}]
+        self.comparisons = 0        # Distance computations made by search()
+
+    def add(self, key, value):
+        if self.root is None:
+            self.root = [key, [value], {}]
+            return
+        node = self.root
+        while True:
+            d = self.distance(key, node[0])
+            if d == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [key, [value], {}]
+                return
+            node = child
+
+    def search(self, key, max_distance):
+        """[(distance, value)] within max_distance, closest first"""
+        results = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            d = self.distance(key, node[0])
+            self.comparisons += 1
+            if d <= max_distance:
+                results.extend((d, value) for value in node[1])
+            for child_distance, child in node[2].items():
+                if d - max_distance <= child_distance <= d + max_distance:
+                    stack.append(child)
+        results.sort(key=lambda item: item[0])
+        return results
+
+
+# ==========================
+# RESOLUTION
+# ==========================
+
+def build_tree(game_rows):
+    tree = BKTree()
+    for row in game_rows:
+        tree.add(fuzzy_key(row["singular"]), row)
+    return tree
+
+
+def suggest_matches(unmatched_wiki, game_rows, max_distance=MAX_DISTANCE):
+    """Ranked candidates for each unresolved wiki name; returns (suggestions, tree)"""
+    tree = build_tree(game_rows)
+    suggestions = []
+    for entry in unmatched_wiki:
+        hits = tree.search(fuzzy_key(entry["name"]), max_distance)
+        hits.sort(key=lambda hit: (hit[0], hit[1]["row_id"]))
+        suggestions.append({
+            "key": entry["key"],
+            "name": entry["name"],
+            "candidates": [
+                {"row_id": row["row_id"], "name": row["singular"], "distance": d}
+                for d, row in hits[:MAX_CANDIDATES]
+            ],
+        })
+    return suggestions, tree
+
+
+def accepted_matches(suggestions):
+    """wiki name -> RowId for unambiguous, close enough best candidates"""
+    accepted = {}
+    for suggestion in suggestions:
+        candidates = suggestion["candidates"]
+        if not candidates:
+            continue
+        best = candidates[0]
+        tied = len(candidates) > 1 and candidates[1]["distance"] == best["distance"]
+        limit = min(ACCEPT_DISTANCE, int(len(fuzzy_key(suggestion["name"])) * ACCEPT_RATIO))
+        if not tied and best["distance"] <= limit:
+            accepted[suggestion["name"]] = best["row_id"]
+    return accepted
+
+
+def save_aliases(new_aliases, path=ALIASES_FILE):
+    """Merge accepted matches into the alias table"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            aliases = json.load(f)
+    except (OSError, ValueError):
+        aliases = {}
+    aliases.update(new_aliases)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(aliases, f, indent=2, ensure_ascii=False, sort_keys=True)
+    return len(aliases)
+
+
+def resolve_unmatched(report, sheet, accept=False):
+    """Add fuzzy candidates to a join report; returns the newly accepted aliases"""
+    unclaimed = {entry["row_id"] for entry in report["unmatched_game"]}
+    game_rows = [row for row in sheet if row["row_id"] in unclaimed]
+    suggestions, tree = suggest_matches(report["unmatched_wiki"], game_rows)
+    report["fuzzy_candidates"] = suggestions
+
+    accepted = accepted_matches(suggestions)
+    brute_force = len(suggestions) * len(game_rows)
+    print(f"🔎 Fuzzy matched {len(suggestions)} unresolved names against {len(game_rows)} game rows "
+          f"({tree.comparisons} distance checks, {brute_force} brute force)")
+    for suggestion in suggestions:
+        best = suggestion["candidates"][0] if suggestion["candidates"] else None
+        mark = "✅" if suggestion["name"] in accepted else "❔"
+        if best:
+            print(f"   {mark} {suggestion['name']} -> {best['name']} (#{best['row_id']}, distance {best['distance']})")
+        else:
+            print(f"   ❌ {suggestion['name']}: no candidate within {MAX_DISTANCE}")
+
+    if accept and accepted:
+        total = save_aliases(accepted)
+        print(f"📁 Saved {len(accepted)} new aliases to: {ALIASES_FILE} ({total} total)")
+    return accepted if accept else {}
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy wiki -> Mount sheet name resolution")
+    parser.add_argument("mount_sheet")
+    parser.add_argument("input_file", nargs="?", default=INPUT_FILE)
+    parser.add_argument("--accept", action="store_true",
+                        help=f"write unambiguous close matches to {ALIASES_FILE}")
+    args = parser.parse_args()
+
+    with open(args.input_file, 'r', encoding='utf-8') as f:
+        mounts = json.load(f)["mounts"]
+    sheet = load_mount_sheet(args.mount_sheet)
+
+    _, report = join_mounts(mounts, sheet, load_aliases())
+    if not report["unmatched_wiki"]:
+        print("✅ Every wiki mount already resolves to a RowId")
+        return
+    resolve_unmatched(report, sheet, args.accept)
+
+
+if __name__ == "__main__":
+    main()
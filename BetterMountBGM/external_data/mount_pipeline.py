@@ -0,0 +1,866 @@
+#!/usr/bin/env python3
+"""
+FFXIV Mount Scraping Pipeline
+One fetch and one parse of the wiki Mounts page produce every artifact:
+
+    fetch -> locate table -> extract rows -> enrich -> emit
+
+- fetch          Mounts page through the shared session + disk cache
+                 (or a saved HTML file)
+- locate table   Find the Mounts table with the configured parser backend
+- extract rows   One record per table row, plus the type -> icon list
+- enrich         In-game descriptions from the mount pages (downloaded by
+                 threads and parsed in a process pool; --backend stream
+                 reads each only up to the description, --backend api asks
+                 the MediaWiki API with an HTML fallback), each
+                 one checkpointed to a journal so --resume can pick up an
+                 interrupted run (see scrape_journal.py)
+- emit           mount_sources_complete.json, its compact indexed companion
+                 mount_sources_complete.bin (see mount_binary_db.py),
+                 the hot/cold split mount_sources_core.json +
+                 mount_details/ shards (see mount_split.py),
+                 the facet summary mount_facets.json (and, with
+                 --partition-types, one shard per type, see
+                 mount_facets.py),
+                 the description/acquisition full-text index
+                 mount_sources_index.bin (see mount_text_index.py),
+                 type_icons.json,
+                 with --mount-sheet, the RowId-keyed
+                 mount_sources_by_rowid.json (see mount_sheet_join.py,
+                 names it cannot match go through mount_fuzzy_match.py) and,
+                 optionally, the type icons (downloaded in parallel, stored
+                 by content hash, see icon_fetch.py)
+
+With --stream the first three stages run incrementally instead: the page is
+fed to a streaming parser as it downloads and each row is written out as
+soon as its </tr> closes (no description stage), keeping memory flat.
+
+Every run ends with a per-stage timing table and writes run_metrics.json:
+stage wall times, HTTP latency histogram, bytes downloaded, cache hit
+ratio, retries and every failed row / page / icon with its reason (see
+run_metrics.py).
+
+mount_web_scrap.py, mount_n_image_web_scrap.py and
+mount_n_type_image_n_description_web_scrap.py are thin entry points over
+this module. They pass --json-only, so they keep writing just
+mount_sources_complete.json (and the icon folder) like before, with the
+records in their original schema (see legacy_record()).
+
+Requirements:
+    pip install beautifulsoup4 requests
+
+Usage:
+    python3 mount_pipeline.py [--incremental] [--resume] [--backend html|stream|api]
+                              [--no-descriptions] [--download-icons] [--json-only]
+                              [--partition-types]
+                              [--mount-sheet [Mount.csv] [--accept-fuzzy]]
+                              [--from-file mounts_wiki.html]
+                              [--stream [--jsonl]]
+                              [--record fixtures.zip | --replay http://127.0.0.1:8765]
+                              [--metrics run_metrics.json]
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date
+from urllib.parse import urljoin
+
+from html_backend import find_description_blockquote, find_mount_table
+from http_cache import cached_get, set_cache_enabled
+from http_client import set_recorder, use_stand_in
+from icon_fetch import download_icons
+from incremental import load_previous, merge_previous, print_change_report, row_fingerprint
+from mount_binary_db import write_binary_db
+from mount_facets import print_facets, write_facets
+from mount_fuzzy_match import resolve_unmatched
+from mount_sheet_join import (
+    MOUNT_SHEET_FILE, join_mounts, load_aliases, load_mount_sheet, print_join_report, write_join,
+)
+from mount_split import CORE_FILE, DETAILS_FOLDER, write_split
+from mount_text_index import write_index as write_text_index
+from rate_limit import HostRateLimiter
+from run_metrics import METRICS_FILE, RunMetrics, error_reason
+from scrape_journal import ScrapeJournal
+from stream_parse import (
+    JsonlWriter, StreamingJsonWriter, iter_table_rows, stream_blockquote, stream_file, stream_url,
+)
+from throughput import StageCounter, print_stage_report
+from wiki_api import fetch_descriptions_api
+from wiki_fixtures import FixtureRecorder
+
+# ==========================
+# CONFIG
+# ==========================
+MAX_WORKERS = 8             # Description requests kept in flight
+PARSE_WORKERS = os.cpu_count() or 1  # Processes parsing mount pages (0 = on the fetch threads)
+REQUESTS_PER_SECOND = 8.0   # Per-host request rate for mount pages
+REQUEST_BURST = 2           # Requests allowed back-to-back before throttling
+DESCRIPTION_BACKEND = "html"  # "html" (one page per mount), "stream" (one page per mount,
+                              # read up to the description) or "api" (batched api.php; its
+                              # wikitext heuristics are only checked on the test fixtures)
+FETCH_REVISION_IDS = False  # Store each page's revision ID (api backend only)
+
+MOUNTS_URL = "https://ffxiv.consolegameswiki.com/wiki/Mounts"
+BASE_URL = "https://ffxiv.consolegameswiki.com"
+MOUNT_TABLE_HEADERS = ('Name', 'Acquired By', 'Seats')
+
+OUTPUT_FILE = "mount_sources_complete.json"
+JSONL_FILE = "mount_sources_complete.jsonl"
+BINARY_FILE = "mount_sources_complete.bin"
+TEXT_INDEX_FILE = "mount_sources_index.bin"
+TYPE_ICONS_FILE = "type_icons.json"
+ICONS_FOLDER = "type_icons"
+FALLBACK_HTML = "mounts_wiki.html"  # Used when the Mounts page cannot be fetched
+
+# Cache to avoid refetching descriptions
+DESCRIPTION_CACHE = {}
+REVISION_IDS = {}
+
+# Shared by every worker thread so the wiki sees one polite client
+RATE_LIMITER = HostRateLimiter(REQUESTS_PER_SECOND, REQUEST_BURST)
+
+# Stage timings and failures of this run, written to run_metrics.json
+METRICS = RunMetrics()
+
+# ==========================
+# HELPERS
+# ==========================
+
+def clean_text(text):
+    """Clean and normalize text from wiki"""
+    if not text:
+        return ""
+    # Remove extra whitespace
+    text = ' '.join(text.split())
+    # Remove wiki markup
+    text = re.sub(r'\[.*?\]', '', text)
+    return text.strip()
+
+
+def _flag(cell, title_hint):
+    """Wiki uses "1", a title tooltip or a check image for true"""
+    return bool(
+        clean_text(cell.get_text()) == '1' or
+        title_hint in cell.get('title', '').lower() or
+        cell.find('img', alt=re.compile(r'yes|check|true', re.I))
+    )
+
+
+# ==========================
+# STAGE 1: FETCH
+# ==========================
+
+def fetch_page(url=None, from_file=None):
+    """Return the raw Mounts page, from the wiki or a saved HTML file"""
+    if from_file:
+        print(f"📥 Reading from {from_file}...")
+        with open(from_file, 'rb') as f:
+            return f.read()
+
+    url = url or MOUNTS_URL
+    print(f"📥 Fetching data from {url}...")
+    try:
+        response = cached_get(url, timeout=30)
+        response.raise_for_status()
+        print("✅ Page fetched successfully")
+        return response.content
+    except Exception as e:
+        print(f"❌ Error fetching page: {e}")
+        METRICS.fail("fetch", url, error_reason(e))
+        if os.path.exists(FALLBACK_HTML):
+            print(f"⚠️  Falling back to saved page {FALLBACK_HTML}")
+            return fetch_page(from_file=FALLBACK_HTML)
+        raise
+
+
+# ==========================
+# STAGE 2: LOCATE TABLE
+# ==========================
+
+def locate_table(content):
+    """Find the Mounts table in the page"""
+    # The table has headers: Icon | Name | Icon | Type | Acquired By | Obtainable | Cash | MB | Seats | Patch
+    print("🔍 Searching for mounts table...")
+    mount_table = find_mount_table(content, MOUNT_TABLE_HEADERS)
+    if not mount_table:
+        raise RuntimeError("Mount table not found")
+    print("✅ Found mounts table")
+    return mount_table
+
+
+# ==========================
+# STAGE 3: EXTRACT ROWS
+# ==========================
+
+def _row_label(row):
+    """Short text of a row to identify it in failure reports"""
+    return clean_text(row.get_text(" "))[:60] or "(empty row)"
+
+
+def extract_mount_data(row, type_icons, metrics=None):
+    """Extract mount data from a table row and collect type icons.
+
+    Returns None for rows that are not mounts (section headers, spacers).
+    Rows that look like mounts but cannot be read also return None, and
+    their reason goes to `metrics` (a RunMetrics) when one is given.
+    """
+    def skip(reason):
+        if metrics is not None:
+            metrics.fail("extract_rows", _row_label(row), reason)
+        return None
+
+    try:
+        cols = row.find_all('td')
+
+        # Column indices:
+        # 0: Icon (empty)
+        # 1: Name (with link)
+        # 2: Icon (type)
+        # 3: Acquisition Type
+        # 4: Acquired By
+        # 5: Obtainable?
+        # 6: Cash Shop?
+        # 7: Market Board?
+        # 8: Seats
+        # 9: Patch
+        if len(cols) < 10:
+            return None     # Section header or spacer row
+
+        # Name + URL
+        name_link = cols[1].find('a')
+        href = name_link.get('href', '') if name_link else ''
+        name = clean_text((name_link or cols[1]).get_text())
+        if not name:
+            if name_link is None:
+                return None     # Empty row
+            return skip("no name")
+        mount_url = urljoin(BASE_URL, href) if href else ""
+
+        # Type
+        mount_type = clean_text(cols[3].get_text())
+
+        # Type icon (column 2, separate from the type text)
+        type_img = cols[2].find('img')
+        if type_img and type_img.get('src'):
+            img_src = type_img['src']
+            full_img_src = re.sub(
+                r'/thumb(/[^/]+/[^/]+/[^/]+\.png)/\d+px-.*',
+                r'\1',
+                img_src
+            ) if '/thumb/' in img_src else img_src
+
+            if mount_type and mount_type not in type_icons:
+                type_icons[mount_type] = {
+                    "url": urljoin(BASE_URL, full_img_src),
+                    "filename": full_img_src.split('/')[-1]
+                }
+
+        # Seats
+        try:
+            seats = int(clean_text(cols[8].get_text()))
+        except ValueError:
+            seats = 1
+
+        return {
+            "name": name,
+            "type": mount_type,
+            "acquired_by": clean_text(cols[4].get_text()),
+            "patch": clean_text(cols[9].get_text()),
+            "seats": seats,
+            "obtainable": _flag(cols[5], 'currently obtainable'),
+            "cash_shop": _flag(cols[6], 'online store'),
+            "market_board": _flag(cols[7], 'market board'),
+            "wiki_url": mount_url,
+            "row_hash": row_fingerprint(cols, href)
+        }
+
+    except Exception as e:
+        print(f"Error processing row: {e}")
+        return skip(f"{type(e).__name__}: {e}")
+
+
+def extract_rows(mount_table, metrics=None):
+    """Return (mounts keyed by sequential ID, type -> icon info)"""
+    rows = mount_table.find_all('tr')[1:]  # Skip header row
+
+    mounts = {}
+    type_icons = {}
+    mount_id = 1
+    failed = 0
+
+    print(f"📊 Processing {len(rows)} rows...")
+
+    for row in rows:
+        mount = extract_mount_data(row, type_icons, metrics)
+        if mount:
+            mounts[str(mount_id)] = mount
+            mount_id += 1
+        else:
+            failed += 1
+
+    print(f"✅ Successfully extracted {len(mounts)} mounts")
+    if failed > 0:
+        print(f"⚠️  Failed to extract {failed} rows")
+
+    return mounts, type_icons
+
+
+# ==========================
+# STAGE 4: ENRICH
+# ==========================
+
+def blockquote_description(blockquote):
+    """Description text of the in-game description blockquote ("" if there is none)"""
+    if not blockquote:
+        return ""
+    text = blockquote.get_text(separator="\n")
+    text = re.sub(r'—\s*In-game description.*$', '', text, flags=re.I)
+    return clean_text(text)
+
+
+def parse_mount_page(content):
+    """Extract the page fields from raw mount page bytes.
+
+    Runs in the parse process pool; returns (fields, seconds spent parsing).
+    """
+    start = time.perf_counter()
+    description = blockquote_description(find_description_blockquote(content))
+    return {"description": description}, time.perf_counter() - start
+
+
+def fetch_mount_page(mount_url, journal=None):
+    """Download a mount page; returns its bytes, or None on a (retryable) failure"""
+    try:
+        response = cached_get(mount_url, timeout=15, rate_limiter=RATE_LIMITER)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"  ⚠️  Failed to fetch description: {mount_url} ({e})")
+        METRICS.fail("descriptions", mount_url, error_reason(e))
+        if journal is not None:
+            journal.record_failed(mount_url, e)
+        return None
+    return response.content
+
+
+def _store_description(mount_url, description, journal=None):
+    DESCRIPTION_CACHE[mount_url] = description
+    if journal is not None:
+        journal.record_ok(mount_url, description)
+
+
+def fetch_mount_description(mount_url, journal=None):
+    """Fetch and cache in-game description from individual mount page.
+
+    Returns None when the page could not be fetched; that is retryable and is
+    neither cached nor stored as an empty description.
+    """
+    if mount_url in DESCRIPTION_CACHE:
+        return DESCRIPTION_CACHE[mount_url]
+
+    content = fetch_mount_page(mount_url, journal)
+    if content is None:
+        return None
+
+    fields, _ = parse_mount_page(content)
+    _store_description(mount_url, fields["description"], journal)
+    return fields["description"]
+
+
+def _start_parse_pool(parse_workers):
+    """Process pool for page parsing, or None to parse on the fetch threads"""
+    if parse_workers <= 0:
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=parse_workers)
+    except (OSError, NotImplementedError, ImportError) as e:
+        print(f"  ℹ️  Process pool unavailable ({e}), parsing on the fetch threads")
+        return None
+
+
+def fetch_and_parse_pages(mount_urls, journal=None, max_workers=MAX_WORKERS, parse_workers=PARSE_WORKERS):
+    """Producer/consumer HTML path: fetch threads feed raw pages to a parse process pool.
+
+    Returns {url: description or None}; prints per-stage throughput.
+    """
+    descriptions = {}
+    parse_pool = _start_parse_pool(parse_workers)
+    fetch_stats = StageCounter("fetch", max_workers)
+    parse_stats = StageCounter("parse", parse_workers if parse_pool else max_workers)
+
+    def fetch(url):
+        start = time.perf_counter()
+        content = fetch_mount_page(url, journal)
+        fetch_stats.add(time.perf_counter() - start, len(content or b""), start, failed=content is None)
+        if content is None or parse_pool is not None:
+            return content
+        fields, seconds = parse_mount_page(content)
+        parse_stats.add(seconds)
+        return fields
+
+    def parsed(future):
+        if not future.exception():
+            parse_stats.add(future.result()[1])
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as fetchers:
+            fetching = {fetchers.submit(fetch, url): url for url in mount_urls}
+            parsing = {}
+            for future in as_completed(fetching):
+                url, result = fetching[future], future.result()
+                if result is None:
+                    descriptions[url] = None
+                elif parse_pool is None:
+                    _store_description(url, result["description"], journal)
+                    descriptions[url] = result["description"]
+                else:
+                    job = parse_pool.submit(parse_mount_page, result)
+                    job.add_done_callback(parsed)
+                    parsing[job] = url
+
+            for job in as_completed(parsing):
+                url = parsing[job]
+                fields, _ = job.result()
+                _store_description(url, fields["description"], journal)
+                descriptions[url] = fields["description"]
+    finally:
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    print_stage_report([fetch_stats, parse_stats])
+    METRICS.add_counters([fetch_stats, parse_stats])
+    return descriptions
+
+
+def stream_mount_descriptions(mount_urls, journal=None, max_workers=MAX_WORKERS):
+    """Partial-read HTML path: each page is read only up to its description.
+
+    Bypasses the disk cache (a cut-off body cannot be cached). Returns
+    {url: description or None}.
+    """
+    stats = StageCounter("stream", max_workers)
+
+    def fetch(url):
+        start = time.perf_counter()
+        try:
+            blockquote, read = stream_blockquote(url, timeout=15, rate_limiter=RATE_LIMITER)
+        except Exception as e:
+            stats.add(time.perf_counter() - start, 0, start, failed=True)
+            print(f"  ⚠️  Failed to fetch description: {url} ({e})")
+            METRICS.fail("descriptions", url, error_reason(e))
+            if journal is not None:
+                journal.record_failed(url, e)
+            return None
+        description = blockquote_description(blockquote)
+        stats.add(time.perf_counter() - start, read, start)
+        _store_description(url, description, journal)
+        return description
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        descriptions = dict(zip(mount_urls, pool.map(fetch, mount_urls)))
+
+    print_stage_report([stats])
+    METRICS.add_counters([stats])
+    return descriptions
+
+
+def fetch_descriptions(mount_urls, backend=DESCRIPTION_BACKEND, max_workers=MAX_WORKERS,
+                       journal=None, parse_workers=PARSE_WORKERS):
+    """Fetch descriptions for many mount pages, keyed by URL (None = failed)"""
+    unique_urls = [url for url in dict.fromkeys(mount_urls) if url]
+    if not unique_urls:
+        return {}
+
+    descriptions = {}
+    if backend == "api":
+        found, unique_urls = fetch_descriptions_api(
+            unique_urls, clean_text, rate_limiter=RATE_LIMITER
+        )
+        for url, page in found.items():
+            DESCRIPTION_CACHE[url] = descriptions[url] = page["description"]
+            REVISION_IDS[url] = page["revid"]
+            if journal is not None:
+                journal.record_ok(url, page["description"], page["revid"])
+        if not unique_urls:
+            return descriptions
+        print(f"  {len(unique_urls)} pages not covered by the API, falling back to HTML")
+
+    for url in [url for url in unique_urls if url in DESCRIPTION_CACHE]:
+        descriptions[url] = DESCRIPTION_CACHE[url]
+    unique_urls = [url for url in unique_urls if url not in DESCRIPTION_CACHE]
+    if not unique_urls:
+        return descriptions
+
+    if backend == "stream":
+        print(f"Streaming {len(unique_urls)} descriptions ({max_workers} workers, "
+              f"reading each page up to its description)...")
+        descriptions.update(stream_mount_descriptions(unique_urls, journal, max_workers))
+        return descriptions
+
+    print(f"Fetching {len(unique_urls)} descriptions ({max_workers} fetch workers, "
+          f"{parse_workers or 'no'} parse processes)...")
+    descriptions.update(fetch_and_parse_pages(unique_urls, journal, max_workers, parse_workers))
+    return descriptions
+
+
+def enrich_descriptions(mounts, previous=None, backend=DESCRIPTION_BACKEND, journal=None,
+                        parse_workers=PARSE_WORKERS):
+    """Fill in `description` (and `revision_id`); returns the incremental report"""
+    report = None
+    to_fetch = list(mounts.values())
+    if previous is not None:
+        to_fetch, report = merge_previous(mounts, previous)
+
+    if journal is not None and journal.entries:
+        remaining = []
+        for mount in to_fetch:
+            entry = journal.completed(mount['wiki_url'])
+            if entry is None:
+                remaining.append(mount)
+                continue
+            mount['description'] = entry['description']
+            if FETCH_REVISION_IDS and 'revision_id' in entry:
+                mount['revision_id'] = entry['revision_id']
+        print(f"⏯️  Resumed {len(to_fetch) - len(remaining)} descriptions from {journal.path}, "
+              f"{len(remaining)} left to fetch")
+        to_fetch = remaining
+
+    descriptions = fetch_descriptions((m['wiki_url'] for m in to_fetch), backend,
+                                      journal=journal, parse_workers=parse_workers)
+    failed = 0
+    for mount in to_fetch:
+        description = descriptions.get(mount['wiki_url'], "")
+        if description is None:
+            # No description key, so --resume / --incremental fetch it again
+            mount.pop('description', None)
+            failed += 1
+            continue
+        mount['description'] = description
+        if FETCH_REVISION_IDS and mount['wiki_url'] in REVISION_IDS:
+            mount['revision_id'] = REVISION_IDS[mount['wiki_url']]
+
+    if failed:
+        print(f"⚠️  {failed} descriptions could not be fetched, they are retried on the next --resume run")
+    return report
+
+
+# ==========================
+# STAGE 5: EMIT
+# ==========================
+
+def database_header():
+    """Top-level fields of mount_sources_complete.json"""
+    return {
+        "version": "1.1.1",
+        "last_updated": date.today().isoformat(),
+        "source": MOUNTS_URL,
+        "note": "Complete mount database for FFXIV. IDs are sequential placeholders - use mount NAME for matching with in-game data.",
+    }
+
+
+def legacy_record(mount, descriptions=True):
+    """A record in the original scrapers' schema for --json-only.
+
+    row_hash is build bookkeeping and is dropped; wiki_url stays only next to
+    a description, as in the description scraper's output. --incremental
+    still works on such records: merge_previous() compares their table fields.
+    """
+    dropped = ("row_hash",) if descriptions else ("row_hash", "wiki_url")
+    return {key: value for key, value in mount.items() if key not in dropped}
+
+
+def emit_database(mounts, output_file=OUTPUT_FILE):
+    """Write the mount database consumed by the plugin"""
+    output = database_header()
+    output["total_mounts"] = len(mounts)
+    output["mounts"] = mounts
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+    print(f"\n📁 Saved to: {output_file}")
+
+
+def emit_binary_database(mounts, output_file=BINARY_FILE):
+    """Write the string-table + hash-indexed binary copy of the database"""
+    size = write_binary_db(mounts, output_file)
+    print(f"📁 Saved to: {output_file} ({size:,} bytes)")
+
+
+def emit_split_database(mounts):
+    """Write the lean core table and the lazily read detail shards"""
+    core_size, shards = write_split(database_header(), mounts)
+    print(f"📁 Saved to: {CORE_FILE} ({core_size:,} bytes) + {DETAILS_FOLDER}/ ({shards} shards)")
+
+
+def emit_facets(mounts, partition=False):
+    """Write the facet summary and, optionally, one shard per type"""
+    facets = write_facets(database_header(), mounts, partition)
+    print_facets(facets)
+
+
+def emit_text_index(mounts, output_file=TEXT_INDEX_FILE):
+    """Write the inverted index over description and acquired_by text"""
+    size = write_text_index(mounts, output_file)
+    print(f"📁 Saved to: {output_file} ({size:,} bytes)")
+
+
+def emit_rowid_database(mounts, sheet_file=MOUNT_SHEET_FILE, accept_fuzzy=False):
+    """Join to the game's Mount sheet and write the RowId-keyed database"""
+    sheet = load_mount_sheet(sheet_file)
+    rowid_mounts, report = join_mounts(mounts, sheet, load_aliases())
+
+    if report["unmatched_wiki"]:
+        accepted = resolve_unmatched(report, sheet, accept_fuzzy)
+        if accepted:
+            # Accepted matches are aliases now, join again to apply them
+            suggestions = report["fuzzy_candidates"]
+            rowid_mounts, report = join_mounts(mounts, sheet, load_aliases())
+            report["fuzzy_candidates"] = [s for s in suggestions if s["name"] not in accepted]
+
+    write_join(database_header(), rowid_mounts, report)
+    print_join_report(report, len(mounts))
+
+
+def emit_type_icons(type_icons, output_file=TYPE_ICONS_FILE):
+    """Write the type -> icon URL/filename list"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(type_icons, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+    print(f"📁 Saved to: {output_file}")
+
+
+def download_type_icons(type_icons, icons_folder=ICONS_FOLDER):
+    """Download every type icon into `icons_folder` (hash-named, deduplicated)"""
+    print(f"\n🖼️  Fetching {len(type_icons)} unique type icons...")
+
+    failures = {}
+    manifest, downloaded, skipped = download_icons(
+        type_icons, icons_folder, rate_limiter=RATE_LIMITER, failures=failures
+    )
+    for type_name, error in failures.items():
+        METRICS.fail("icons", type_name, error_reason(error))
+
+    unique_files = len({entry['file'] for entry in manifest.values()})
+    print(f"✅ {len(manifest)}/{len(type_icons)} icons in '{icons_folder}/' "
+          f"({downloaded} downloaded, {skipped} already present, {unique_files} unique files)")
+    return downloaded
+
+
+def print_statistics(mounts, type_icons):
+    """Summary of the emitted database"""
+    obtainable = sum(1 for m in mounts.values() if m['obtainable'])
+    cash_shop = sum(1 for m in mounts.values() if m['cash_shop'])
+    market_board = sum(1 for m in mounts.values() if m['market_board'])
+
+    print(f"📊 Total mounts: {len(mounts)}")
+    print(f"\n📈 Statistics:")
+    print(f"   Obtainable: {obtainable}")
+    print(f"   Unobtainable: {len(mounts) - obtainable}")
+    print(f"   Cash Shop: {cash_shop}")
+    print(f"   Market Board: {market_board}")
+
+    unique_types = set(m['type'] for m in mounts.values())
+    print(f"\n📋 Unique Types ({len(unique_types)}):")
+    for type_name in sorted(unique_types):
+        icon_file = type_icons.get(type_name, {}).get('filename', 'No icon')
+        print(f"   - {type_name}: {icon_file}")
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def run_pipeline(args):
+    """Run every stage once and return (mounts, type_icons)"""
+    previous = load_previous(OUTPUT_FILE) if args.incremental else None
+
+    with METRICS.stage("fetch"):
+        content = fetch_page(from_file=args.from_file)
+    with METRICS.stage("locate_table"):
+        mount_table = locate_table(content)
+    with METRICS.stage("extract_rows"):
+        mounts, type_icons = extract_rows(mount_table, METRICS)
+
+    report = None
+    journal = None
+    if args.descriptions:
+        journal = ScrapeJournal(resume=args.resume)
+        try:
+            with METRICS.stage("descriptions"):
+                report = enrich_descriptions(mounts, previous, args.backend, journal, args.parse_workers)
+        except BaseException:
+            journal.close()
+            print(f"\n💾 Progress saved to {journal.path}, continue with --resume")
+            raise
+
+    with METRICS.stage("serialize"):
+        if args.json_only:
+            emit_database({key: legacy_record(m, args.descriptions) for key, m in mounts.items()})
+        else:
+            emit_database(mounts)
+        if journal is not None:
+            if journal.failed_urls():
+                journal.close()     # Keep it: --resume retries only the failures
+            else:
+                journal.discard()
+        if not args.json_only:
+            emit_binary_database(mounts)
+            emit_split_database(mounts)
+            emit_facets(mounts, args.partition_types)
+            emit_text_index(mounts)
+    if args.mount_sheet:
+        with METRICS.stage("join"):
+            emit_rowid_database(mounts, args.mount_sheet, args.accept_fuzzy)
+    if not args.json_only:
+        with METRICS.stage("serialize"):
+            emit_type_icons(type_icons)
+    if args.download_icons and type_icons:
+        with METRICS.stage("icons"):
+            download_type_icons(type_icons)
+
+    if report is not None:
+        print_change_report(report)
+
+    return mounts, type_icons
+
+
+def run_streaming(args):
+    """Stream rows from the download straight into the output file"""
+    if args.from_file:
+        print(f"📥 Streaming from {args.from_file}...")
+        chunks = stream_file(args.from_file)
+    else:
+        print(f"📥 Streaming data from {MOUNTS_URL}...")
+        chunks = stream_url(MOUNTS_URL)
+
+    type_icons = {}
+    output_file = JSONL_FILE if args.jsonl else OUTPUT_FILE
+    writer = JsonlWriter(output_file) if args.jsonl else StreamingJsonWriter(output_file, database_header())
+
+    with METRICS.stage("stream_rows"), writer:
+        for row in iter_table_rows(chunks, MOUNT_TABLE_HEADERS):
+            mount = extract_mount_data(row, type_icons, METRICS)
+            if mount:
+                writer.write(str(writer.count + 1), legacy_record(mount, False) if args.json_only else mount)
+        if not writer.count:
+            # Raised inside the block so the previous output file is kept
+            raise RuntimeError("Mount table not found")
+
+    print(f"✅ Streamed {writer.count} mounts")
+    print(f"\n📁 Saved to: {output_file}")
+    if not args.json_only:
+        with METRICS.stage("serialize"):
+            emit_type_icons(type_icons)
+    if args.download_icons and type_icons:
+        with METRICS.stage("icons"):
+            download_type_icons(type_icons)
+
+    return writer.count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="FFXIV Mount Scraping Pipeline")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"only re-process rows that changed since the last {OUTPUT_FILE}")
+    parser.add_argument("--resume", action="store_true",
+                        help="reuse the descriptions journaled by an interrupted run")
+    parser.add_argument("--backend", choices=("html", "stream", "api"), default=DESCRIPTION_BACKEND,
+                        help="where descriptions come from (default: %(default)s)")
+    parser.add_argument("--parse-workers", type=int, default=PARSE_WORKERS, metavar="N",
+                        help="processes parsing mount pages, 0 parses on the fetch threads "
+                             "(default: %(default)s)")
+    parser.add_argument("--no-descriptions", dest="descriptions", action="store_false",
+                        help="skip the description stage (base database only)")
+    parser.add_argument("--download-icons", action="store_true",
+                        help=f"download type icons into {ICONS_FOLDER}/")
+    parser.add_argument("--json-only", action="store_true",
+                        help=f"write only {OUTPUT_FILE} (plus --download-icons / --mount-sheet output), "
+                             "the output set of the original scrapers")
+    parser.add_argument("--partition-types", action="store_true",
+                        help="write one database shard per acquisition type")
+    parser.add_argument("--mount-sheet", nargs="?", const=MOUNT_SHEET_FILE, metavar="CSV",
+                        help=f"join to a Mount sheet export (default: {MOUNT_SHEET_FILE}) "
+                             "and write the RowId-keyed database")
+    parser.add_argument("--accept-fuzzy", action="store_true",
+                        help="with --mount-sheet, save close fuzzy matches as aliases")
+    parser.add_argument("--record", metavar="ARCHIVE",
+                        help="save every response into a fixture archive (see wiki_fixtures.py); "
+                             "bodies are read in full, so --backend stream downloads whole pages")
+    parser.add_argument("--replay", metavar="URL",
+                        help="send every request to a local stand-in server, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--metrics", metavar="JSON",
+                        help=f"where to write the run metrics (default: {METRICS_FILE}, "
+                             "none with --json-only)")
+    parser.add_argument("--from-file", metavar="HTML",
+                        help="parse a saved Mounts page instead of fetching it")
+    parser.add_argument("--stream", action="store_true",
+                        help="parse and write rows while the page downloads (implies --no-descriptions)")
+    parser.add_argument("--jsonl", action="store_true",
+                        help=f"with --stream, write one record per line to {JSONL_FILE}")
+    args = parser.parse_args(argv)
+    if args.stream and args.descriptions:
+        print("ℹ️  --stream skips the description stage")
+    if args.stream and args.incremental:
+        parser.error("--incremental cannot be combined with --stream")
+    if args.resume and (args.stream or not args.descriptions):
+        parser.error("--resume needs the description stage")
+    if args.stream and (args.mount_sheet or args.partition_types):
+        parser.error("--mount-sheet and --partition-types cannot be combined with --stream")
+    if args.json_only and args.partition_types:
+        parser.error("--partition-types cannot be combined with --json-only")
+    if args.metrics is None and not args.json_only:
+        args.metrics = METRICS_FILE
+    return args
+
+
+def configure_transport(args):
+    """Point the HTTP client at a stand-in server and/or start recording; returns the recorder"""
+    recorder = None
+    if args.replay:
+        use_stand_in(args.replay)
+        set_cache_enabled(False)
+        print(f"🛰️  Replaying against {args.replay}")
+    if args.record:
+        recorder = FixtureRecorder(args.record)
+        set_recorder(recorder)
+        set_cache_enabled(False)
+    return recorder
+
+
+def finish_recording(recorder):
+    if recorder is None:
+        return
+    set_recorder(None)
+    responses, bodies = recorder.close()
+    print(f"📁 Saved to: {recorder.path} ({responses} responses, {bodies} distinct bodies)")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    recorder = configure_transport(args)
+
+    print("=" * 60)
+    print("FFXIV Mount Scraping Pipeline")
+    print("=" * 60)
+    print()
+
+    if args.stream:
+        run_streaming(args)
+    else:
+        mounts, type_icons = run_pipeline(args)
+    finish_recording(recorder)
+
+    if not args.stream:
+        print_statistics(mounts, type_icons)
+    METRICS.print_summary()
+    if args.metrics:
+        print(f"📁 Saved to: {METRICS.write(args.metrics)}")
+    print("\n✅ Done!")
+
+
+if __name__ == "__main__":
+    main()
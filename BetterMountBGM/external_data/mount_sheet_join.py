@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Join of the scraped wiki mounts to the game's Mount sheet.
+
+The wiki database is keyed by sequential placeholders, so the plugin has to
+match mounts by name (case-insensitively, and the game writes some names in
+lower case, e.g. "air-wheeler A9"). This stage resolves every wiki row to
+its Mount sheet RowId once, offline, and writes a RowId-keyed copy of the
+database so the plugin can look mounts up by ID.
+
+Input: a CSV export of the Mount sheet with (at least) the columns
+    RowId (or "#"/"key"), Singular, Order, RideBGM
+Extra header/type rows, as written by SaintCoinach-style exporters, are
+skipped. Rows with an empty Singular are ignored.
+
+Each wiki name is resolved by, in order:
+    exact       name == Singular
+    normalized  same join_key() (case folded, whitespace collapsed,
+                typographic quotes and dashes unified)
+    alias       mount_aliases.json: {"wiki name": RowId}
+An alias is only consulted when the name itself matches no row, so a stale
+alias cannot override a correct match. Aliases whose RowId is not in the
+sheet are reported as dangling; those overridden by a name match pointing
+at another row are reported as stale.
+
+Output:
+    mount_sources_by_rowid.json - same layout as mount_sources_complete.json,
+                                  "mounts" keyed by RowId, each record adding
+                                  row_id, game_name, order, ride_bgm, match
+    mount_join_report.json      - unmatched wiki rows, game rows without a
+                                  wiki entry, ambiguous names, collisions,
+                                  dangling and stale aliases
+
+Usage:
+    python3 mount_sheet_join.py Mount.csv [mount_sources_complete.json]
+"""
+
+import csv
+import json
+import sys
+
+from mount_binary_db import normalize_name
+
+# ==========================
+# CONFIG
+# ==========================
+MOUNT_SHEET_FILE = "Mount.csv"
+INPUT_FILE = "mount_sources_complete.json"
+OUTPUT_FILE = "mount_sources_by_rowid.json"
+REPORT_FILE = "mount_join_report.json"
+ALIASES_FILE = "mount_aliases.json"
+
+ID_COLUMNS = ("RowId", "#", "key", "ID")
+PUNCTUATION_MAP = str.maketrans({
+    "‘": "'", "’": "'", "ʼ": "'",
+    "–": "-", "—": "-", "‐": "-", "‑": "-",
+    " ": " ",
+})
+
+# ==========================
+# HELPERS
+# ==========================
+
+def join_key(name):
+    """Normalized match key: unified punctuation, single spaces, case folded"""
+    return normalize_name((name or "").translate(PUNCTUATION_MAP)).casefold()
+
+
+def _int_or_raw(value):
+    value = (value or "").strip()
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def load_mount_sheet(path=MOUNT_SHEET_FILE):
+    """Parse the Mount sheet export; returns [{row_id, singular, order, ride_bgm}]"""
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.reader(f))
+
+    header_index = next((i for i, row in enumerate(rows[:10])
+                         if "Singular" in (cell.strip() for cell in row)), None)
+    if header_index is None:
+        raise ValueError(f"{path}: no header row with a 'Singular' column")
+
+    header = [cell.strip() for cell in rows[header_index]]
+    column = {name: i for i, name in enumerate(header)}
+    id_column = next((column[name] for name in ID_COLUMNS if name in column), 0)
+
+    def cell(row, name):
+        i = column.get(name)
+        return row[i] if i is not None and i < len(row) else ""
+
+    sheet = []
+    for row in rows[header_index + 1:]:
+        if id_column >= len(row) or not row[id_column].strip().isdigit():
+            continue    # Type rows, blank lines
+        singular = cell(row, "Singular").strip()
+        if not singular:
+            continue
+        sheet.append({
+            "row_id": int(row[id_column]),
+            "singular": singular,
+            "order": _int_or_raw(cell(row, "Order")) or 0,
+            "ride_bgm": _int_or_raw(cell(row, "RideBGM")) or 0,
+        })
+    return sheet
+
+
+def load_aliases(path=ALIASES_FILE):
+    """wiki name -> RowId table, keyed by join_key"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            aliases = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {join_key(name): int(row_id) for name, row_id in aliases.items()}
+
+
+def _preferred(rows):
+    """Among game rows sharing a name, prefer listed ones (Order >= 0), then the lowest RowId"""
+    return min(rows, key=lambda r: (not (isinstance(r["order"], int) and r["order"] >= 0), r["row_id"]))
+
+
+# ==========================
+# JOIN
+# ==========================
+
+def join_mounts(mounts, sheet, aliases=None):
+    """Resolve wiki mounts to RowIds; returns (rowid_mounts, report)"""
+    aliases = aliases or {}
+    by_row_id = {row["row_id"]: row for row in sheet}
+    by_exact = {}
+    by_key = {}
+    for row in sheet:
+        by_exact.setdefault(row["singular"], []).append(row)
+        by_key.setdefault(join_key(row["singular"]), []).append(row)
+
+    resolved = {}
+    report = {"matched": {"exact": 0, "normalized": 0, "alias": 0},
+              "unmatched_wiki": [], "unmatched_game": [], "ambiguous": [], "collisions": [],
+              "dangling_aliases": [
+                  {"name": name_key, "row_id": row_id}
+                  for name_key, row_id in sorted(aliases.items()) if row_id not in by_row_id
+              ],
+              "stale_aliases": []}
+
+    for key, mount in mounts.items():
+        name = mount["name"]
+        name_key = join_key(name)
+        candidates, method = by_exact.get(name), "exact"
+        if not candidates:
+            candidates, method = by_key.get(name_key), "normalized"
+        if not candidates and aliases.get(name_key) in by_row_id:
+            candidates, method = [by_row_id[aliases[name_key]]], "alias"
+        if not candidates:
+            report["unmatched_wiki"].append({"key": key, "name": name})
+            continue
+
+        row = _preferred(candidates)
+        if method != "alias" and name_key in aliases and aliases[name_key] != row["row_id"]:
+            report["stale_aliases"].append({"name": name, "alias_row_id": aliases[name_key],
+                                            "matched_row_id": row["row_id"]})
+        if len(candidates) > 1:
+            report["ambiguous"].append({"name": name, "row_ids": sorted(r["row_id"] for r in candidates),
+                                        "chosen": row["row_id"]})
+        if row["row_id"] in resolved:
+            report["collisions"].append({"row_id": row["row_id"], "kept": resolved[row["row_id"]]["name"],
+                                         "dropped": name})
+            continue
+
+        record = dict(mount)
+        record.update({
+            "row_id": row["row_id"],
+            "game_name": row["singular"],
+            "order": row["order"],
+            "ride_bgm": row["ride_bgm"],
+            "match": method,
+        })
+        resolved[row["row_id"]] = record
+        report["matched"][method] += 1
+
+    report["unmatched_game"] = [
+        {"row_id": row["row_id"], "name": row["singular"]}
+        for row in sheet if row["row_id"] not in resolved
+    ]
+    rowid_mounts = {str(row_id): resolved[row_id] for row_id in sorted(resolved)}
+    return rowid_mounts, report
+
+
+def write_join(header, rowid_mounts, report, output_file=OUTPUT_FILE, report_file=REPORT_FILE):
+    output = dict(header)
+    output["note"] = "Mount database keyed by the game's Mount sheet RowId."
+    output["total_mounts"] = len(rowid_mounts)
+    output["mounts"] = rowid_mounts
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def print_join_report(report, total):
+    matched = report["matched"]
+    print(f"🔗 Joined {sum(matched.values())}/{total} wiki mounts to Mount sheet rows "
+          f"({matched['exact']} exact, {matched['normalized']} normalized, {matched['alias']} alias)")
+    if report["unmatched_wiki"]:
+        print(f"   ⚠️  {len(report['unmatched_wiki'])} wiki mounts unmatched")
+        for entry in report["unmatched_wiki"][:10]:
+            print(f"      - {entry['name']}")
+    if report["ambiguous"]:
+        print(f"   ⚠️  {len(report['ambiguous'])} names matched several rows (lowest listed RowId kept)")
+    if report["collisions"]:
+        print(f"   ⚠️  {len(report['collisions'])} wiki mounts resolved to an already used RowId")
+    if report["dangling_aliases"]:
+        print(f"   ⚠️  {len(report['dangling_aliases'])} aliases point to RowIds missing from the sheet")
+        for entry in report["dangling_aliases"][:10]:
+            print(f"      - {entry['name']} -> #{entry['row_id']}")
+    if report["stale_aliases"]:
+        print(f"   ⚠️  {len(report['stale_aliases'])} aliases disagree with a name match (name match kept)")
+    print(f"   ℹ️  {len(report['unmatched_game'])} sheet rows have no wiki entry")
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+    sheet_file = sys.argv[1]
+    input_file = sys.argv[2] if len(sys.argv) > 2 else INPUT_FILE
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+    mounts = database.pop("mounts")
+
+    rowid_mounts, report = join_mounts(mounts, load_mount_sheet(sheet_file), load_aliases())
+    write_join(database, rowid_mounts, report)
+
+    print_join_report(report, len(mounts))
+    print(f"📁 Saved to: {OUTPUT_FILE}")
+    print(f"📁 Saved to: {REPORT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Hot/cold split of the mount database.
+
+    mount_sources_core.json   the columns the mount table renders (the
+                              MountSourceInfo fields: name, type,
+                              acquired_by, patch, seats and the flags), in
+                              the same layout as mount_sources_complete.json
+    mount_details/            everything else per mount (description,
+                              wiki_url, row_hash, ...) in detail shards:
+        shard_000.jsonl ...   one JSON object per line, shards capped at
+                              SHARD_MAX_BYTES
+        index.json            mount key -> [shard, byte offset, byte length]
+
+The plugin can load the small core file up front and read one mount's
+details with a single seek + read when its row is expanded.
+
+Usage:
+    python3 mount_split.py [mount_sources_complete.json]
+"""
+
+import glob
+import json
+import os
+import sys
+
+# ==========================
+# CONFIG
+# ==========================
+INPUT_FILE = "mount_sources_complete.json"
+CORE_FILE = "mount_sources_core.json"
+DETAILS_FOLDER = "mount_details"
+DETAILS_INDEX = "index.json"
+SHARD_MAX_BYTES = 64 * 1024     # A shard is closed once it reaches this size
+
+CORE_FIELDS = ("name", "type", "acquired_by", "patch", "seats", "obtainable", "cash_shop", "market_board")
+
+# ==========================
+# WRITER
+# ==========================
+
+def split_record(mount):
+    """Return (core, detail) halves of one mount record"""
+    core = {field: mount[field] for field in CORE_FIELDS if field in mount}
+    detail = {field: value for field, value in mount.items() if field not in CORE_FIELDS}
+    return core, detail
+
+
+def shard_name(number):
+    return f"shard_{number:03d}.jsonl"
+
+
+def write_detail_shards(details, folder=DETAILS_FOLDER, shard_max_bytes=SHARD_MAX_BYTES):
+    """Write {key: detail} into size-capped shards plus the offset index"""
+    os.makedirs(folder, exist_ok=True)
+    index = {}
+    shard = 0
+    offset = 0
+    f = open(os.path.join(folder, shard_name(shard)), 'wb')
+    try:
+        for key, detail in details.items():
+            line = (json.dumps(detail, ensure_ascii=False) + "\n").encode("utf-8")
+            if offset and offset + len(line) > shard_max_bytes:
+                f.close()
+                shard += 1
+                offset = 0
+                f = open(os.path.join(folder, shard_name(shard)), 'wb')
+            f.write(line)
+            index[key] = [shard, offset, len(line)]
+            offset += len(line)
+    finally:
+        f.close()
+
+    # Drop shards left over from a previous, larger run
+    for path in glob.glob(os.path.join(folder, "shard_*.jsonl")):
+        if os.path.basename(path) > shard_name(shard):
+            os.remove(path)
+
+    with open(os.path.join(folder, DETAILS_INDEX), 'w', encoding='utf-8') as f:
+        json.dump({"shards": shard + 1, "mounts": index}, f, separators=(",", ":"))
+    return shard + 1
+
+
+def write_split(header, mounts, core_file=CORE_FILE, details_folder=DETAILS_FOLDER):
+    """Write the core file and the detail shards; returns (core bytes, shard count)"""
+    core = {}
+    details = {}
+    for key, mount in mounts.items():
+        core[key], detail = split_record(mount)
+        if detail:
+            details[key] = detail
+
+    output = dict(header)
+    output["details"] = f"{details_folder}/{DETAILS_INDEX}"
+    output["total_mounts"] = len(core)
+    output["mounts"] = core
+    with open(core_file, 'w', encoding='utf-8') as f:
+        json.dump(output, f, separators=(",", ":"), ensure_ascii=False)
+
+    shards = write_detail_shards(details, details_folder)
+    return os.path.getsize(core_file), shards
+
+
+# ==========================
+# READER
+# ==========================
+
+class MountDetails:
+    """Reference reader: loads the index once, reads one record per lookup"""
+
+    def __init__(self, folder=DETAILS_FOLDER):
+        self.folder = folder
+        with open(os.path.join(folder, DETAILS_INDEX), 'r', encoding='utf-8') as f:
+            self.index = json.load(f)["mounts"]
+
+    def get(self, key):
+        entry = self.index.get(str(key))
+        if entry is None:
+            return None
+        shard, offset, length = entry
+        with open(os.path.join(self.folder, shard_name(shard)), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else INPUT_FILE
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        database = json.load(f)
+    mounts = database.pop("mounts")
+    database.pop("total_mounts", None)
+
+    core_size, shards = write_split(database, mounts)
+    print(f"📁 Saved to: {CORE_FILE} ({core_size:,} bytes, "
+          f"{os.path.getsize(input_file):,} in {input_file})")
+    print(f"📁 Saved to: {DETAILS_FOLDER}/ ({shards} shards)")
+
+
+if __name__ == "__main__":
+    main()
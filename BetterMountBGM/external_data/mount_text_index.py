@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Full-text inverted index over mount descriptions and acquisition text.
+
+Written next to mount_sources_complete.json by the pipeline, so a query like
+"Gold Saucer MGP" or "Allagan" is answered by intersecting a few posting
+lists instead of scanning every description and acquired_by string.
+
+Text is case folded and split into word tokens (apostrophes inside a word
+are kept, so "Ul'dah" stays one token); stop words and 1-character tokens
+are dropped. Queries AND their terms together.
+
+Layout (little-endian), same shape as the BGM trigram index:
+
+    Header (24 bytes)
+        magic           4s   b"BMTI"
+        version         u16
+        entry_size      u16
+        term_count      u32
+        entries_offset  u32  -> term table
+        keys_offset     u32  -> term blob
+        postings_offset u32  -> posting lists
+
+    Term table (sorted by term bytes, binary-searchable)
+        key_offset      u32  into the term blob
+        key_length      u16  UTF-8 length of the term
+        reserved        u16
+        posting_offset  u32  into the postings blob
+        posting_count   u32  number of mounts
+
+    Terms     UTF-8
+    Postings  per term, sorted mount keys (the numeric keys of the "mounts"
+              object) as LEB128 varints: the first as-is, then the gaps
+
+Usage:
+    python3 mount_text_index.py [mount_sources_complete.json] [output.bin]
+    python3 mount_text_index.py --query "gold saucer mgp"
+"""
+
+import argparse
+import bisect
+import json
+import re
+import struct
+
+from bgm_search_index import decode_postings, encode_postings
+
+# ==========================
+# CONFIG
+# ==========================
+MAGIC = b"BMTI"
+FORMAT_VERSION = 1
+INPUT_FILE = "mount_sources_complete.json"
+OUTPUT_FILE = "mount_sources_index.bin"
+
+HEADER = struct.Struct("<4sHHIIII")
+ENTRY = struct.Struct("<IHHII")
+
+TEXT_FIELDS = ("description", "acquired_by")
+
+TOKEN_RE = re.compile(r"\w+(?:['’]\w+)*")
+STOP_WORDS = frozenset("""
+    a an and are as at be by for from has have in into is it its of on or
+    that the their this to was were which while with you your
+""".split())
+
+# ==========================
+# TOKENIZER
+# ==========================
+
+def tokenize(text):
+    """Case-folded word tokens, stop words and single characters removed"""
+    return [
+        token for token in (t.replace("’", "'") for t in TOKEN_RE.findall(text.casefold()))
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
+
+
+def mount_terms(mount):
+    terms = set()
+    for field in TEXT_FIELDS:
+        terms.update(tokenize(mount.get(field, "")))
+    return terms
+
+
+# ==========================
+# BUILD
+# ==========================
+
+def build_postings(mounts):
+    """term -> sorted list of mount keys"""
+    postings = {}
+    for key, mount in mounts.items():
+        for term in mount_terms(mount):
+            postings.setdefault(term, []).append(int(key))
+    for keys in postings.values():
+        keys.sort()
+    return postings
+
+
+def build_index(mounts):
+    """Serialize the inverted index to bytes"""
+    keyed = sorted((term.encode("utf-8"), keys) for term, keys in build_postings(mounts).items())
+
+    entries = bytearray()
+    terms = bytearray()
+    blob = bytearray()
+    for term, keys in keyed:
+        entries += ENTRY.pack(len(terms), len(term), 0, len(blob), len(keys))
+        terms += term
+        blob += encode_postings(keys)
+
+    entries_offset = HEADER.size
+    keys_offset = entries_offset + len(entries)
+    postings_offset = keys_offset + len(terms)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, ENTRY.size, len(keyed),
+        entries_offset, keys_offset, postings_offset,
+    )
+    return header + bytes(entries) + bytes(terms) + bytes(blob)
+
+
+def write_index(mounts, output_file=OUTPUT_FILE):
+    data = build_index(mounts)
+    with open(output_file, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+# ==========================
+# READER / QUERY
+# ==========================
+
+class MountTextIndex:
+    """Reference reader: binary search on terms, intersect posting lists"""
+
+    def __init__(self, data):
+        (magic, version, self.entry_size, self.term_count,
+         self.entries_offset, self.keys_offset, self.postings_offset) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("not a BetterMountBGM mount text index")
+        self.data = data
+        self.terms = [self.term(i) for i in range(self.term_count)]
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def entry(self, index):
+        return ENTRY.unpack_from(self.data, self.entries_offset + index * self.entry_size)
+
+    def term(self, index):
+        key_offset, key_length, _, _, _ = self.entry(index)
+        start = self.keys_offset + key_offset
+        return bytes(self.data[start:start + key_length])
+
+    def postings(self, term):
+        key = term.encode("utf-8")
+        index = bisect.bisect_left(self.terms, key)
+        if index == self.term_count or self.terms[index] != key:
+            return []
+        _, _, _, posting_offset, count = self.entry(index)
+        return decode_postings(self.data, self.postings_offset + posting_offset, count)
+
+    def query(self, text):
+        """Sorted keys (as strings) of mounts containing every term of `text`"""
+        terms = set(tokenize(text))
+        if not terms:
+            return []
+        lists = sorted((self.postings(term) for term in terms), key=len)
+        result = set(lists[0])
+        for keys in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(keys)
+        return [str(key) for key in sorted(result)]
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Mount description/acquisition text index")
+    parser.add_argument("input_file", nargs="?", default=INPUT_FILE)
+    parser.add_argument("output_file", nargs="?", default=OUTPUT_FILE)
+    parser.add_argument("--query", metavar="TEXT",
+                        help="search an existing index instead of building one")
+    args = parser.parse_args()
+
+    with open(args.input_file, 'r', encoding='utf-8') as f:
+        mounts = json.load(f)["mounts"]
+
+    if args.query is not None:
+        index = MountTextIndex.load(args.output_file)
+        keys = index.query(args.query)
+        print(f"🔍 {len(keys)} mounts match '{args.query}'")
+        for key in keys:
+            print(f"   - {mounts[key]['name']}")
+        return
+
+    size = write_index(mounts, args.output_file)
+    index = MountTextIndex.load(args.output_file)
+    print(f"✅ Indexed {len(mounts)} mounts, {index.term_count} terms")
+    print(f"📁 Saved to: {args.output_file} ({size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
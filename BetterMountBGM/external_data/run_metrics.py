@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Run metrics for the scraping pipeline.
+
+RunMetrics collects, for one pipeline run:
+
+    stages      wall time per stage (fetch, locate table, row extraction,
+                descriptions, serialize, icons), as StageCounters
+    throughput  the worker pool counters of the description stage
+    http        requests, retries, bytes downloaded and a latency histogram
+                built from http_client.TIMINGS (one entry per attempt)
+    cache       http_cache.CACHE_STATS and the hit ratio
+    failures    every row, page or icon that failed, with its reason
+
+At the end of a run write() saves it as run_metrics.json and print_summary()
+shows where the time went.
+
+Usage:
+    metrics = RunMetrics()
+    with metrics.stage("fetch"):
+        content = fetch_page()
+    metrics.fail("extract_rows", row_text, "5 cells, expected 10")
+    metrics.write()
+    metrics.print_summary()
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from http_cache import CACHE_STATS, print_cache_stats
+from http_client import REQUEST_STATS, TIMINGS, print_request_stats
+from throughput import StageCounter
+
+# ==========================
+# CONFIG
+# ==========================
+METRICS_FILE = "run_metrics.json"
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)  # Histogram upper bounds
+MAX_FAILURE_EXAMPLES = 5    # Items listed per failure reason in the summary
+
+# ==========================
+# HELPERS
+# ==========================
+
+def error_reason(error):
+    """Short, groupable reason for an exception: "HTTPError 404", "ConnectTimeout", "ValueError: ..." """
+    response = getattr(error, "response", None)
+    if response is not None:
+        return f"{type(error).__name__} {response.status_code}"
+    if isinstance(error, OSError):     # Connection errors carry the URL in their message
+        return type(error).__name__
+    return f"{type(error).__name__}: {error}"
+
+
+def latency_histogram(latencies_ms, buckets=LATENCY_BUCKETS_MS):
+    """[{"le_ms": bound, "count": n}, ...]; the last bucket (le_ms None) is unbounded"""
+    counts = [0] * (len(buckets) + 1)
+    for ms in latencies_ms:
+        i = 0
+        while i < len(buckets) and ms > buckets[i]:
+            i += 1
+        counts[i] += 1
+    bounds = list(buckets) + [None]
+    return [{"le_ms": bound, "count": count} for bound, count in zip(bounds, counts)]
+
+
+def http_summary(timings=TIMINGS, stats=REQUEST_STATS):
+    """Request counts, bytes, latency percentiles and histogram"""
+    latencies = sorted(seconds * 1000 for _, _, seconds, _ in timings)
+    outcomes = {}
+    for _, outcome, _, _ in timings:
+        outcomes[str(outcome)] = outcomes.get(str(outcome), 0) + 1
+
+    def percentile(p):
+        return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 1)
+
+    summary = dict(stats)
+    summary["outcomes"] = dict(sorted(outcomes.items()))
+    if latencies:
+        summary["latency_ms"] = {
+            "mean": round(sum(latencies) / len(latencies), 1),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "max": round(latencies[-1], 1),
+        }
+        summary["latency_histogram"] = latency_histogram(latencies)
+    return summary
+
+
+def cache_summary(stats=CACHE_STATS):
+    """Cache counters plus the share of requests answered without a full download"""
+    summary = dict(stats)
+    lookups = stats["hits"] + stats["revalidated"] + stats["misses"]
+    summary["hit_ratio"] = round((stats["hits"] + stats["revalidated"]) / lookups, 3) if lookups else None
+    return summary
+
+
+# ==========================
+# METRICS
+# ==========================
+
+class RunMetrics:
+    """Stage timings, HTTP / cache figures and failures of one run"""
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc)
+        self.start = time.perf_counter()
+        self.stages = {}
+        self.throughput = []
+        self.failures = []
+
+    @contextmanager
+    def stage(self, name):
+        """Time the block as (one more run of) stage `name`"""
+        counter = self.stages.setdefault(name, StageCounter(name))
+        start = time.perf_counter()
+        try:
+            yield counter
+        finally:
+            counter.add(time.perf_counter() - start, started=start)
+
+    def add_counters(self, counters):
+        """Keep the worker pool counters of a stage (see throughput.py)"""
+        self.throughput.extend(counters)
+
+    def fail(self, stage, item, reason):
+        self.failures.append({"stage": stage, "item": item, "reason": reason})
+
+    def failure_counts(self):
+        """{(stage, reason): count}, most common first"""
+        counts = {}
+        for failure in self.failures:
+            key = (failure["stage"], failure["reason"])
+            counts[key] = counts.get(key, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def as_dict(self):
+        wall = time.perf_counter() - self.start
+        return {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "wall_seconds": round(wall, 3),
+            "stages": {
+                name: {
+                    "seconds": round(c.busy, 4),
+                    "share": round(c.busy / wall, 3) if wall else None,
+                    "runs": c.items,
+                }
+                for name, c in self.stages.items()
+            },
+            "throughput": {c.name: c.as_dict() for c in self.throughput},
+            "http": http_summary(),
+            "cache": cache_summary(),
+            "failures": {
+                "count": len(self.failures),
+                "by_reason": [
+                    {"stage": stage, "reason": reason, "count": count}
+                    for (stage, reason), count in self.failure_counts().items()
+                ],
+                "items": self.failures,
+            },
+        }
+
+    def write(self, path=METRICS_FILE):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    def print_summary(self):
+        """Stage table, HTTP / cache lines and failures"""
+        wall = time.perf_counter() - self.start
+        print(f"\n⏱️  Run time by stage ({wall:.2f}s total):")
+        for name, c in self.stages.items():
+            share = c.busy / wall if wall else 0
+            print(f"   {name:<14}{c.busy:>8.2f}s {share:>5.0%}  {'█' * round(share * 30)}")
+        print_request_stats()
+        print_cache_stats()
+
+        if self.failures:
+            print(f"⚠️  {len(self.failures)} failures:")
+            for (stage, reason), count in self.failure_counts().items():
+                items = [f["item"] for f in self.failures if (f["stage"], f["reason"]) == (stage, reason)]
+                more = f", +{count - MAX_FAILURE_EXAMPLES} more" if count > MAX_FAILURE_EXAMPLES else ""
+                print(f"   {stage}: {reason} x{count} "
+                      f"({', '.join(map(str, items[:MAX_FAILURE_EXAMPLES]))}{more})")
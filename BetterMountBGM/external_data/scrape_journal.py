@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for the description stage.
+
+Every mount page the pipeline processes is appended to a JSONL journal and
+fsync'd before moving on, so an interrupted build keeps all finished work:
+
+    {"url": "...", "status": "ok", "description": "...", "revision_id": 123}
+    {"url": "...", "status": "failed", "error": "ConnectionError(...)"}
+
+A failed fetch is journaled as retryable instead of as an empty description.
+`mount_pipeline.py --resume` replays the journal (the last line for a URL
+wins, a torn final line from a crash is ignored), fetches only the URLs
+that are missing or failed, and the journal is deleted once the final JSON
+has been written. A torn line is cut off before resuming, so new entries
+always start on a line of their own.
+"""
+
+import json
+import os
+import threading
+
+# ==========================
+# CONFIG
+# ==========================
+JOURNAL_FILE = "mount_sources_complete.journal.jsonl"
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+
+# ==========================
+# JOURNAL
+# ==========================
+
+def replay_journal(path=JOURNAL_FILE):
+    """Return {url: last entry} from an existing journal, or {}"""
+    entries = {}
+    if not os.path.exists(path):
+        return entries
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue    # Torn write from an interrupted run
+            if entry.get("url"):
+                entries[entry["url"]] = entry
+    return entries
+
+
+def truncate_torn_line(path):
+    """Cut a partial last line left by a crash; returns the bytes removed"""
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb+') as f:
+        data = f.read()
+        if not data or data.endswith(b"\n"):
+            return 0
+        keep = data.rfind(b"\n") + 1
+        f.truncate(keep)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(data) - keep
+
+
+class ScrapeJournal:
+    """Append-only, fsync'd JSONL journal shared by the fetch workers"""
+
+    def __init__(self, path=JOURNAL_FILE, resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = replay_journal(path) if resume else {}
+        if resume:
+            truncate_torn_line(path)
+        self.f = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def completed(self, url):
+        """Journaled description for `url`, or None if it still has to be fetched"""
+        entry = self.entries.get(url)
+        if entry and entry.get("status") == STATUS_OK:
+            return entry
+        return None
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self.lock:
+            self.f.write(line)
+            self.f.flush()
+            os.fsync(self.f.fileno())
+            self.entries[entry["url"]] = entry
+
+    def record_ok(self, url, description, revision_id=None):
+        entry = {"url": url, "status": STATUS_OK, "description": description}
+        if revision_id is not None:
+            entry["revision_id"] = revision_id
+        self._append(entry)
+
+    def record_failed(self, url, error):
+        self._append({"url": url, "status": STATUS_FAILED, "error": repr(error)})
+
+    def failed_urls(self):
+        return [url for url, entry in self.entries.items() if entry.get("status") == STATUS_FAILED]
+
+    def close(self):
+        if not self.f.closed:
+            self.f.close()
+
+    def discard(self):
+        """Drop the journal once its contents are in the final JSON"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
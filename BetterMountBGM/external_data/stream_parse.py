@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Streaming parse of the wiki Mounts table.
+
+The response body is fed chunk by chunk into an incremental
+html.parser.HTMLParser. Only the row currently being read is kept in memory,
+as a tiny node tree that answers the handful of BeautifulSoup calls
+extract_mount_data makes (find, find_all, get, get_text), so each row is
+yielded as soon as its </tr> closes - before the download has finished.
+
+Records can then go straight to JsonlWriter or StreamingJsonWriter, keeping
+peak memory flat however large the table grows. Both write to a sibling
+.tmp file that only replaces the real one when close() is reached without
+an error, so a failed run never leaves a truncated database behind.
+
+Mount detail pages get the same treatment in partial form: the page is
+streamed into BlockquoteStreamParser, and reading stops (and the connection
+is closed) as soon as the first <blockquote> - the in-game description - has
+been closed, so the rest of the page is never downloaded or parsed.
+"""
+
+import codecs
+import json
+import os
+from html.parser import HTMLParser
+
+from http_client import count_streamed, get as http_get
+
+# ==========================
+# CONFIG
+# ==========================
+CHUNK_SIZE = 16 * 1024      # Bytes read from the socket/file per feed()
+PAGE_CHUNK_SIZE = 4 * 1024  # Smaller reads for detail pages, so reading stops soon after </blockquote>
+
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+}
+
+# ==========================
+# ROW NODES
+# ==========================
+
+class Node:
+    """Minimal element with the BeautifulSoup API used on table rows"""
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = dict(attrs)
+        self.children = []
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def get_text(self, separator=""):
+        parts = []
+        self._collect_text(parts)
+        return separator.join(parts)
+
+    def _collect_text(self, parts):
+        for child in self.children:
+            if isinstance(child, Node):
+                child._collect_text(parts)
+            else:
+                parts.append(child)
+
+    def _iter_descendants(self):
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child._iter_descendants()
+
+    def find_all(self, name, **attrs):
+        return [
+            node for node in self._iter_descendants()
+            if node.name == name and _attrs_match(node, attrs)
+        ]
+
+    def find(self, name, **attrs):
+        for node in self._iter_descendants():
+            if node.name == name and _attrs_match(node, attrs):
+                return node
+        return None
+
+
+def _append_text(parent, data, merge):
+    """Add text to a node, joining it to a preceding string like BeautifulSoup does"""
+    if merge and parent.children and isinstance(parent.children[-1], str):
+        parent.children[-1] += data
+    else:
+        parent.children.append(data)
+
+
+def _attrs_match(node, attrs):
+    for key, expected in attrs.items():
+        value = node.attrs.get(key)
+        if value is None:
+            return False
+        if hasattr(expected, 'search'):
+            if not expected.search(value):
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+# ==========================
+# PARSER
+# ==========================
+
+class MountTableStreamParser(HTMLParser):
+    """Incremental parser that collects finished rows of the Mounts table"""
+
+    def __init__(self, required_headers):
+        super().__init__(convert_charrefs=True)
+        self.required_headers = required_headers
+        self.table_depth = 0
+        self.candidate_depth = None     # Table whose header row is being checked
+        self.active_depth = None        # Table confirmed to be the Mounts table
+        self.done = False               # Mounts table already read to its end
+        self.row = None                 # Node tree of the row being read
+        self.stack = []
+        self.finished = []              # Rows completed since the last drain
+        self.text_break = False         # A comment ended the previous string
+
+    # -- table tracking ----------------------------------------------------
+
+    def _in_target_table(self):
+        depth = self.active_depth or self.candidate_depth
+        return depth is not None and self.table_depth == depth
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'table':
+            self.table_depth += 1
+            if not self.done and self.active_depth is None and self.candidate_depth is None:
+                self.candidate_depth = self.table_depth
+
+        if tag == 'tr' and self._in_target_table():
+            if self.row is not None:
+                # Previous <tr> was never closed
+                self._finish_row()
+            self.row = Node('tr', attrs)
+            self.stack = [self.row]
+            return
+
+        if self.row is not None:
+            node = Node(tag, attrs)
+            self.stack[-1].children.append(node)
+            if tag not in VOID_TAGS:
+                self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        if self.row is not None:
+            self.stack[-1].children.append(Node(tag, attrs))
+
+    def handle_endtag(self, tag):
+        if tag == 'table' and self.row is not None and self._in_target_table():
+            # Last <tr> was never closed
+            self._finish_row()
+
+        if self.row is not None:
+            if tag == 'tr' and self._in_target_table():
+                self._finish_row()
+                return
+            # Pop up to the matching open tag, tolerating unclosed children
+            for i in range(len(self.stack) - 1, 0, -1):
+                if self.stack[i].name == tag:
+                    del self.stack[i:]
+                    break
+
+        if tag == 'table':
+            if self.table_depth == self.active_depth:
+                self.active_depth = None
+                self.done = True
+            elif self.table_depth == self.candidate_depth:
+                self.candidate_depth = None
+            self.table_depth -= 1
+
+    def handle_data(self, data):
+        # Text can arrive split across feed() chunks
+        if self.row is not None:
+            _append_text(self.stack[-1], data, not self.text_break)
+        self.text_break = False
+
+    def handle_comment(self, data):
+        self.text_break = True
+
+    # -- rows ----------------------------------------------------------------
+
+    def _finish_row(self):
+        row = self.row
+        self.row = None
+        self.stack = []
+
+        if self.active_depth is None:
+            # First row of a candidate table: its <th> cells decide
+            header_text = ' '.join(th.get_text() for th in row.find_all('th'))
+            if all(h in header_text for h in self.required_headers):
+                self.active_depth = self.candidate_depth
+            self.candidate_depth = None
+            return
+
+        self.finished.append(row)
+
+    def drain(self):
+        rows, self.finished = self.finished, []
+        return rows
+
+
+def iter_table_rows(chunks, required_headers):
+    """Yield Mounts-table rows (header row skipped) from an iterable of text chunks"""
+    parser = MountTableStreamParser(required_headers)
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.drain()
+    parser.close()
+    yield from parser.drain()
+
+
+class BlockquoteStreamParser(HTMLParser):
+    """Incremental parser that keeps only the first <blockquote> of a page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = None        # Node tree of the blockquote
+        self.stack = []
+        self.done = False       # Blockquote closed, nothing more to read
+        self.text_break = False # A comment ended the previous string
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self.root is None:
+            if tag == 'blockquote':
+                self.root = Node(tag, attrs)
+                self.stack = [self.root]
+            return
+        node = Node(tag, attrs)
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        if self.stack and not self.done:
+            self.stack[-1].children.append(Node(tag, attrs))
+
+    def handle_endtag(self, tag):
+        if not self.stack or self.done:
+            return
+        # Pop up to the matching open tag, tolerating unclosed children
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].name == tag:
+                del self.stack[i:]
+                break
+        if not self.stack:
+            self.done = True
+
+    def handle_data(self, data):
+        if self.stack and not self.done:
+            _append_text(self.stack[-1], data, not self.text_break)
+        self.text_break = False
+
+    def handle_comment(self, data):
+        self.text_break = True
+
+
+def find_blockquote_streamed(byte_chunks, encoding="utf-8"):
+    """Feed byte chunks until the first blockquote closes; returns (Node or None, bytes read)"""
+    parser = BlockquoteStreamParser()
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    read = 0
+    for chunk in byte_chunks:
+        read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+    return parser.root, read
+
+
+# ==========================
+# SOURCES
+# ==========================
+
+def _decode(byte_chunks, encoding="utf-8"):
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _counted(response, byte_chunks):
+    for chunk in byte_chunks:
+        count_streamed(response, len(chunk))
+        yield chunk
+
+
+def stream_url(url, timeout=30, chunk_size=CHUNK_SIZE):
+    """Yield decoded text chunks of a page while it downloads"""
+    with http_get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        yield from _decode(_counted(response, response.iter_content(chunk_size)))
+
+
+def stream_blockquote(url, timeout=30, rate_limiter=None, chunk_size=PAGE_CHUNK_SIZE):
+    """Download a page only up to its first </blockquote>; returns (Node or None, bytes read)"""
+    with http_get(url, timeout=timeout, stream=True, rate_limiter=rate_limiter) as response:
+        response.raise_for_status()
+        blockquote, read = find_blockquote_streamed(response.iter_content(chunk_size))
+        count_streamed(response, read)
+        return blockquote, read
+
+
+def stream_file(path, chunk_size=CHUNK_SIZE):
+    """Yield decoded text chunks of a saved page"""
+    with open(path, 'rb') as f:
+        yield from _decode(iter(lambda: f.read(chunk_size), b""))
+
+
+# ==========================
+# WRITERS
+# ==========================
+
+class _AtomicWriter:
+    """Writes `path + ".tmp"`; close() moves it onto `path`, abort() drops it"""
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.f = open(self.tmp_path, 'w', encoding='utf-8')
+        self.count = 0
+
+    def _commit(self):
+        self.f.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """Discard everything written; the file at `path` is left untouched"""
+        if not self.f.closed:
+            self.f.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is not None:
+            self.abort()
+        elif not self.f.closed:
+            self.close()
+
+
+class JsonlWriter(_AtomicWriter):
+    """One JSON record per line, flushed as it arrives"""
+
+    def write(self, key, record):
+        self.f.write(json.dumps({"id": key, **record}, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def close(self, **_):
+        self._commit()
+
+
+class StreamingJsonWriter(_AtomicWriter):
+    """Writes the mount database layout one record at a time.
+
+    `total_mounts` is only known at the end, so it is written after the
+    `mounts` object; key order does not matter to the plugin's deserializer.
+    """
+
+    def __init__(self, path, header):
+        super().__init__(path)
+        self.f.write("{\n")
+        for key, value in header.items():
+            self.f.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+        self.f.write('  "mounts": {')
+
+    def write(self, key, record):
+        body = json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        self.f.write(("," if self.count else "") + f"\n    {json.dumps(key)}: {body}")
+        self.count += 1
+
+    def close(self, **footer):
+        footer.setdefault("total_mounts", self.count)
+        self.f.write("\n  }" if self.count else "}")
+        for key, value in footer.items():
+            self.f.write(f",\n  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}")
+        self.f.write("\n}\n")
+        self._commit()
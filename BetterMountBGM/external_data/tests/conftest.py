@@ -0,0 +1,177 @@
+"""
+Shared fixtures for the scraper tests.
+
+tests/fixtures/wiki/ holds small hand-made pages in the wiki's markup: the
+Mounts page and a few mount pages. index.json maps each wiki path (as
+wiki_fixtures.fixture_key returns it) to its file.
+
+`wiki_server` packs those pages into a fixture archive, serves it with
+wiki_fixtures.start_server and points the HTTP client at it, with the disk
+cache off and the pipeline's rate limiter opened up; `stand_in` does the
+same with a chosen FaultInjector. `fake_wiki` instead
+answers requests for the real wiki host from the same pages, in process.
+"""
+
+import io
+import json
+import os
+import sys
+from collections import OrderedDict
+from urllib.parse import urljoin, urlsplit
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+WIKI_DIR = os.path.join(HERE, "fixtures", "wiki")
+
+import http_cache  # noqa: E402
+import http_client  # noqa: E402
+import mount_pipeline  # noqa: E402
+from rate_limit import HostRateLimiter  # noqa: E402
+from wiki_fixtures import FixtureRecorder, fixture_key, start_server  # noqa: E402
+
+CONTENT_TYPES = {".html": "text/html; charset=UTF-8", ".json": "application/json; charset=utf-8"}
+
+
+class StoredResponse:
+    """What FixtureRecorder.record reads from a response"""
+
+    def __init__(self, content, content_type, status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+
+
+def load_wiki_pages():
+    """{wiki path: page bytes} for every page in the fixture index"""
+    with open(os.path.join(WIKI_DIR, "index.json"), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    pages = {}
+    for path, filename in index.items():
+        with open(os.path.join(WIKI_DIR, filename), 'rb') as f:
+            pages[path] = f.read()
+    return pages
+
+
+@pytest.fixture(scope="session")
+def wiki_pages():
+    return load_wiki_pages()
+
+
+@pytest.fixture(scope="session")
+def mounts_html(wiki_pages):
+    return wiki_pages["/wiki/Mounts"]
+
+
+@pytest.fixture(scope="session")
+def mount_pages(wiki_pages):
+    """{wiki path: bytes} of the mount pages (everything but the Mounts page)"""
+    return {path: body for path, body in wiki_pages.items() if path != "/wiki/Mounts"}
+
+
+@pytest.fixture(scope="session")
+def mount_urls(mounts_html):
+    """wiki_url of every mount in the fixture Mounts table, as the pipeline builds them"""
+    table = mount_pipeline.find_mount_table(mounts_html, mount_pipeline.MOUNT_TABLE_HEADERS)
+    urls = []
+    for row in table.find_all('tr')[1:]:
+        link = row.find_all('td')[1].find('a') if len(row.find_all('td')) >= 10 else None
+        if link is not None:
+            urls.append(urljoin(mount_pipeline.BASE_URL, link['href']))
+    return urls
+
+
+def build_archive(path, extra=None):
+    """Write every fixture page to an archive.
+
+    `extra` adds {url: (bytes, content type)} or {url: (bytes, content type, headers)}.
+    """
+    with open(os.path.join(WIKI_DIR, "index.json"), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    recorder = FixtureRecorder(path)
+    for wiki_path, filename in index.items():
+        with open(os.path.join(WIKI_DIR, filename), 'rb') as f:
+            body = f.read()
+        content_type = CONTENT_TYPES[os.path.splitext(filename)[1]]
+        recorder.record(urljoin(mount_pipeline.BASE_URL, wiki_path), StoredResponse(body, content_type))
+    for url, (body, content_type, *headers) in (extra or {}).items():
+        recorder.record(url, StoredResponse(body, content_type, headers=headers[0] if headers else None))
+    recorder.close()
+    return path
+
+
+@pytest.fixture
+def pipeline_state(monkeypatch):
+    """Fresh description caches, no disk cache, an unthrottled rate limiter"""
+    mount_pipeline.DESCRIPTION_CACHE.clear()
+    mount_pipeline.REVISION_IDS.clear()
+    monkeypatch.setattr(mount_pipeline, "RATE_LIMITER", HostRateLimiter(1000, 50))
+    monkeypatch.setattr(http_cache, "CACHE_ENABLED", False)
+    yield
+    mount_pipeline.DESCRIPTION_CACHE.clear()
+    mount_pipeline.REVISION_IDS.clear()
+    http_client.use_stand_in(None)
+    http_client.set_recorder(None)
+
+
+@pytest.fixture
+def stand_in(tmp_path, pipeline_state):
+    """serve(faults=None, extra=None): serve the fixture pages, send every request there; returns the server"""
+    servers = []
+
+    def serve(faults=None, extra=None):
+        archive = build_archive(str(tmp_path / f"wiki_fixtures_{len(servers)}.zip"), extra)
+        server, url = start_server(archive, faults=faults)
+        server.url = url
+        servers.append(server)
+        http_client.use_stand_in(url)
+        return server
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def wiki_server(stand_in):
+    """Serve the fixture pages; every request goes there. Yields (server, base URL)"""
+    server = stand_in()
+    yield server, server.url
+
+
+class FixtureAdapter(requests.adapters.BaseAdapter):
+    """Fake transport for the wiki host: answers from the fixture pages, 404 otherwise"""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.sent = []
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.sent.append(request.url)
+        body = self.pages.get(fixture_key(request.url))
+        response = requests.Response()
+        response.status_code = 404 if body is None else 200
+        response.headers = CaseInsensitiveDict({"Content-Type": "text/html; charset=UTF-8"})
+        response.raw = io.BytesIO(body or b"")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_wiki(monkeypatch, pipeline_state, wiki_pages):
+    """Route requests for the wiki host to FixtureAdapter (on a copy of the session's adapters)"""
+    adapter = FixtureAdapter(wiki_pages)
+    monkeypatch.setattr(http_client.SESSION, "adapters", OrderedDict(http_client.SESSION.adapters))
+    parts = urlsplit(mount_pipeline.BASE_URL)
+    http_client.SESSION.mount(f"{parts.scheme}://{parts.netloc}/", adapter)
+    return adapter
@@ -0,0 +1,96 @@
+"""Author BGM overrides: validation and the compiled table round trip"""
+
+import json
+import os
+import struct
+
+import pytest
+
+from author_config_compiler import (FORMAT_VERSION, HEADER, AuthorBgmTable, build_table, load_mount_names,
+                                    validate_overrides, write_table)
+from bgm_catalog import load_bgm_csv
+from conftest import HERE
+
+SCRIPTS_DIR = os.path.dirname(HERE)
+
+TRACKS = [
+    {"id": 2, "title": "Prelude - Rebirth", "alt_title": "", "special_mode_title": "", "locations": "", "comments": ""},
+    {"id": 232, "title": "The Decisive Battle", "alt_title": "Decisive Battle", "special_mode_title": "",
+     "locations": "", "comments": ""},
+    {"id": 873, "title": "With Hearts Aligned", "alt_title": "", "special_mode_title": "", "locations": "",
+     "comments": ""},
+]
+MOUNT_NAMES = {"air-wheeler a9", "blackjack", "argos"}
+
+
+def override(mount_id, mount_name, bgm_id, bgm_name):
+    return {"mount_id": mount_id, "mount_name": mount_name, "bgm_id": bgm_id, "bgm_name": bgm_name}
+
+
+def test_round_trip(tmp_path):
+    table = {343: 873, 0: 2, 0xFFFFFFFF: 0xFFFF, 312: 232}
+    path = str(tmp_path / "author.bin")
+    write_table(table, path)
+    compiled = AuthorBgmTable.load(path)
+
+    assert compiled.count == len(table)
+    assert compiled.mount_ids == sorted(table)
+    assert {mount_id: compiled.get(mount_id) for mount_id in table} == table
+    assert compiled.get(1) is None
+
+
+def test_valid_overrides_compile():
+    overrides = [override(343, "air-wheeler A9", 873, "With Hearts Aligned"),
+                 override(312, "Blackjack", 232, "decisive  battle"),
+                 override(312, "Blackjack", 232, "The Decisive Battle")]
+    table, errors, warnings = validate_overrides(overrides, TRACKS, MOUNT_NAMES)
+
+    assert table == {312: 232, 343: 873}
+    assert errors == []
+    assert warnings == ["#3 (Blackjack): duplicate override for mount_id 312, kept once"]
+
+
+def test_every_error_is_reported():
+    overrides = [
+        override(-1, "Argos", 2, "Prelude - Rebirth"),
+        override(263, "Argos", 70000, "Too big"),
+        override(263, "Argos", True, "Bool is not an int"),
+        override(264, "Argos", 999, "Missing"),
+        override(265, "Argos", 873, "Wrong Title"),
+        override(266, "Blackjack", 2, "Prelude - Rebirth"),
+        override(266, "Unknown Mount", 232, "The Decisive Battle"),
+    ]
+    table, errors, warnings = validate_overrides(overrides, TRACKS, MOUNT_NAMES)
+
+    assert errors == [
+        "#1 (Argos): mount_id -1 is not a uint",
+        "#2 (Argos): bgm_id 70000 is not a ushort",
+        "#3 (Argos): bgm_id True is not a ushort",
+        "#4 (Argos): bgm_id 999 is not in xiv_bgm_en.csv",
+        "#5 (Argos): bgm_name 'Wrong Title' does not match BGM 873 'With Hearts Aligned'",
+        "#5 (Argos): mount_name also used with mount_id 264",
+        "#7 (Unknown Mount): mount_id 266 already mapped to BGM 2",
+    ]
+    assert warnings == ["#7 (Unknown Mount): mount_name not found in mount_sources_complete.json"]
+
+
+def test_shipped_config_is_valid():
+    with open(os.path.join(SCRIPTS_DIR, "author_bgm_config.json"), 'r', encoding='utf-8') as f:
+        overrides = json.load(f)["mount_bgm_overrides"]
+    tracks, _ = load_bgm_csv(os.path.join(SCRIPTS_DIR, "xiv_bgm_en.csv"))
+    mount_names = load_mount_names(os.path.join(SCRIPTS_DIR, "mount_sources_complete.json"))
+
+    table, errors, _ = validate_overrides(overrides, tracks, mount_names)
+    assert errors == []
+    compiled = AuthorBgmTable(build_table(table))
+    assert {o["mount_id"]: compiled.get(o["mount_id"]) for o in overrides} == {
+        o["mount_id"]: o["bgm_id"] for o in overrides}
+
+
+def test_header_is_checked():
+    data = build_table({1: 2})
+    assert HEADER.unpack_from(data, 0)[:2] == (b"BMAC", FORMAT_VERSION)
+    with pytest.raises(ValueError):
+        AuthorBgmTable(b"BMDB" + data[4:])
+    with pytest.raises(ValueError):
+        AuthorBgmTable(data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:])
@@ -0,0 +1,76 @@
+"""BGM catalog: CSV validation and the binary round trip"""
+
+import os
+import struct
+
+import pytest
+
+from bgm_catalog import FORMAT_VERSION, HEADER, BgmCatalog, build_catalog, load_bgm_csv, write_catalog
+from conftest import HERE
+
+SHIPPED_CSV = os.path.join(os.path.dirname(HERE), "xiv_bgm_en.csv")
+
+SMALL_CSV = '''ID,Title,Alt Title,Special Mode Title,Locations,Comments
+7,Torn from the Heavens,,,"Leves, FC Workshop",
+2,Prelude: Discoveries,Prelude,,Title screen,"Plays on ""first"" login"
+65535,Last Slot,,,,
+'''
+
+
+def write_csv(tmp_path, text):
+    path = tmp_path / "bgm.csv"
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_quoted_commas_and_order(tmp_path):
+    tracks, problems = load_bgm_csv(write_csv(tmp_path, SMALL_CSV))
+
+    assert problems == []
+    assert [t["id"] for t in tracks] == [2, 7, 65535]
+    assert tracks[1]["locations"] == "Leves, FC Workshop"
+    assert tracks[0]["comments"] == 'Plays on "first" login'
+
+
+def test_validation_problems(tmp_path):
+    text = SMALL_CSV + "7,Duplicate,,,,\n70000,Too big,,,,\nabc,Not a number,,,,\n8,Too,few\n"
+    tracks, problems = load_bgm_csv(write_csv(tmp_path, text))
+
+    assert [t["id"] for t in tracks] == [2, 7, 65535]
+    assert problems == [
+        "line 5: duplicate ID 7",
+        "line 6: ID 70000 does not fit in a ushort",
+        "line 7: ID 'abc' is not a number",
+        "line 8: expected 6 columns, got 3",
+    ]
+
+
+def test_round_trip(tmp_path):
+    tracks, _ = load_bgm_csv(write_csv(tmp_path, SMALL_CSV))
+    path = str(tmp_path / "bgm.bin")
+    write_catalog(tracks, path)
+    catalog = BgmCatalog.load(path)
+
+    assert list(catalog) == tracks
+    assert catalog.get(7) == tracks[1]
+    assert catalog.get(3) is None and catalog.get(70000) is None
+
+
+def test_shipped_csv_round_trip():
+    tracks, problems = load_bgm_csv(SHIPPED_CSV)
+    catalog = BgmCatalog(build_catalog(tracks))
+
+    assert problems == []
+    assert list(catalog) == tracks
+
+
+def test_header_is_checked(tmp_path):
+    data = build_catalog(load_bgm_csv(write_csv(tmp_path, SMALL_CSV))[0])
+    assert HEADER.unpack_from(data, 0)[:3] == (b"BGMC", FORMAT_VERSION, 5)
+
+    with pytest.raises(ValueError):
+        BgmCatalog(b"BMDB" + data[4:])
+    with pytest.raises(ValueError):
+        BgmCatalog(data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:])
+    with pytest.raises(ValueError):
+        BgmCatalog(data[:6] + struct.pack("<H", 4) + data[8:])
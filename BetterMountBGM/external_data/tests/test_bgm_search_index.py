@@ -0,0 +1,72 @@
+"""BGM trigram index: postings read back as written, queries match a linear scan"""
+
+import os
+import struct
+
+import pytest
+
+from bgm_catalog import load_bgm_csv
+from bgm_search_index import (FORMAT_VERSION, HEADER, BgmSearchIndex, build_index, build_postings,
+                              decode_postings, encode_postings, search_texts, write_index)
+from conftest import HERE
+
+SHIPPED_CSV = os.path.join(os.path.dirname(HERE), "xiv_bgm_en.csv")
+
+TRACKS = [
+    {"id": 2, "title": "Prelude: Discoveries", "alt_title": "", "special_mode_title": "",
+     "locations": "Title screen", "comments": ""},
+    {"id": 7, "title": "Torn from the Heavens", "alt_title": "", "special_mode_title": "",
+     "locations": "Leves, FC Workshop", "comments": ""},
+    {"id": 300, "title": "Heavensward", "alt_title": "蒼天のイシュガルド", "special_mode_title": "",
+     "locations": "Ishgard", "comments": "Not indexed"},
+]
+
+
+def scan(tracks, text):
+    needle = text.lower()
+    return [t["id"] for t in tracks if any(needle in s for s in search_texts(t))]
+
+
+def test_varint_postings_round_trip():
+    ids = [0, 1, 2, 127, 128, 300, 16383, 16384, 65535]
+    assert decode_postings(encode_postings(ids), 0, len(ids)) == ids
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "search.bin")
+    write_index(TRACKS, path)
+    index = BgmSearchIndex.load(path, TRACKS)
+
+    postings = build_postings(TRACKS)
+    assert index.trigram_count == len(postings)
+    assert index.keys == sorted(index.keys)
+    assert {key.decode("utf-8"): index.postings(key.decode("utf-8")) for key in index.keys} == postings
+    assert index.postings("zzz") == []
+
+
+@pytest.mark.parametrize("text", ["heaven", "HEAVENS", "ves, f", "30", "7", "イシュ", "", "no such", "t"])
+def test_query_matches_scan(text):
+    index = BgmSearchIndex(build_index(TRACKS), TRACKS)
+    assert index.query(text) == scan(TRACKS, text)
+
+
+def test_comments_and_field_boundaries_are_not_indexed():
+    index = BgmSearchIndex(build_index(TRACKS), TRACKS)
+    assert index.query("not indexed") == []
+    assert index.query("heavensishgard") == []
+
+
+def test_shipped_csv_queries_match_scan():
+    tracks, _ = load_bgm_csv(SHIPPED_CSV)
+    index = BgmSearchIndex(build_index(tracks), tracks)
+    for text in ("the", "gridania", "battle", "10", "ff"):
+        assert index.query(text) == scan(tracks, text)
+
+
+def test_header_is_checked():
+    data = build_index(TRACKS)
+    assert HEADER.unpack_from(data, 0)[:2] == (b"BGMT", FORMAT_VERSION)
+    with pytest.raises(ValueError):
+        BgmSearchIndex(b"BGMC" + data[4:], TRACKS)
+    with pytest.raises(ValueError):
+        BgmSearchIndex(data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:], TRACKS)
@@ -0,0 +1,73 @@
+"""The legacy scraper scripts keep writing only what they always wrote, in the schema they always wrote"""
+
+import json
+
+import os
+import runpy
+import sys
+
+import pytest
+
+import mount_pipeline
+from conftest import HERE
+from run_metrics import METRICS_FILE
+
+SCRIPTS_DIR = os.path.dirname(HERE)
+
+LEGACY_OUTPUTS = {
+    "mount_web_scrap.py": {mount_pipeline.OUTPUT_FILE},
+    "mount_n_image_web_scrap.py": {mount_pipeline.OUTPUT_FILE, mount_pipeline.ICONS_FOLDER},
+    "mount_n_type_image_n_description_web_scrap.py": {mount_pipeline.OUTPUT_FILE},
+}
+BASE_FIELDS = {"name", "type", "acquired_by", "patch", "seats", "obtainable", "cash_shop", "market_board"}
+LEGACY_FIELDS = {
+    "mount_web_scrap.py": BASE_FIELDS,
+    "mount_n_image_web_scrap.py": BASE_FIELDS,
+    "mount_n_type_image_n_description_web_scrap.py": BASE_FIELDS | {"description", "wiki_url"},
+}
+
+
+def run_script(monkeypatch, directory, path, args=()):
+    monkeypatch.chdir(directory)
+    monkeypatch.setattr(sys, "argv", [path, "--parse-workers", "0"] + list(args))
+    runpy.run_path(path, run_name="__main__")
+    with open(os.path.join(directory, mount_pipeline.OUTPUT_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)["mounts"]
+
+
+@pytest.mark.parametrize("script", LEGACY_OUTPUTS)
+def test_entry_point_output_set(monkeypatch, tmp_path, fake_wiki, script):
+    mounts = run_script(monkeypatch, tmp_path, os.path.join(SCRIPTS_DIR, script))
+
+    assert set(os.listdir(tmp_path)) == LEGACY_OUTPUTS[script]
+    assert {field for mount in mounts.values() for field in mount} == LEGACY_FIELDS[script]
+
+
+@pytest.mark.parametrize("script", ["mount_web_scrap.py", "mount_n_type_image_n_description_web_scrap.py"])
+def test_scripts_folder_copies_are_wrappers(monkeypatch, tmp_path, fake_wiki, script):
+    (tmp_path / "top").mkdir()
+    (tmp_path / "copy").mkdir()
+    top = run_script(monkeypatch, tmp_path / "top", os.path.join(SCRIPTS_DIR, script))
+    copy = run_script(monkeypatch, tmp_path / "copy", os.path.join(SCRIPTS_DIR, "scripts", script))
+
+    assert copy == top
+
+
+def test_legacy_output_supports_incremental(monkeypatch, tmp_path, fake_wiki):
+    script = os.path.join(SCRIPTS_DIR, "mount_n_type_image_n_description_web_scrap.py")
+    first = run_script(monkeypatch, tmp_path, script)
+    sent = len(fake_wiki.sent)
+    mount_pipeline.DESCRIPTION_CACHE.clear()
+    second = run_script(monkeypatch, tmp_path, script, ["--incremental"])
+
+    assert second == first
+    assert len(fake_wiki.sent) == sent + 1     # Only the Mounts page: every row matched without row_hash
+
+
+def test_pipeline_writes_every_output(monkeypatch, tmp_path, fake_wiki):
+    monkeypatch.chdir(tmp_path)
+    mount_pipeline.main(["--no-descriptions"])
+
+    written = set(os.listdir(tmp_path))
+    assert {mount_pipeline.OUTPUT_FILE, mount_pipeline.BINARY_FILE, mount_pipeline.TEXT_INDEX_FILE,
+            mount_pipeline.TYPE_ICONS_FILE, METRICS_FILE} <= written
@@ -0,0 +1,24 @@
+"""Description fetching against the fixture pages served by a local stand-in"""
+
+from bs4 import BeautifulSoup
+
+import mount_pipeline
+from mount_pipeline import blockquote_description, fetch_and_parse_pages
+from wiki_fixtures import fixture_key
+
+
+def expected_descriptions(mount_urls, mount_pages):
+    return {
+        url: blockquote_description(BeautifulSoup(mount_pages[fixture_key(url)], 'html.parser').find('blockquote'))
+        for url in mount_urls
+    }
+
+
+def test_pool_and_inline_parsing_agree(wiki_server, mount_urls, mount_pages):
+    inline = fetch_and_parse_pages(mount_urls, parse_workers=0)
+    mount_pipeline.DESCRIPTION_CACHE.clear()
+    pooled = fetch_and_parse_pages(mount_urls, parse_workers=2)
+
+    assert pooled == inline
+    assert inline == expected_descriptions(mount_urls, mount_pages)
+    assert inline[mount_urls[0]].startswith("A sturdy chocobo")
@@ -0,0 +1,55 @@
+"""Parser backends must return exactly what a full html.parser tree does"""
+
+import json
+
+import pytest
+from bs4 import BeautifulSoup
+
+from html_backend import available_backends, find_description_blockquote, find_mount_table
+from mount_pipeline import MOUNT_TABLE_HEADERS, blockquote_description, extract_mount_data
+
+
+def baseline_mount_table(content):
+    """The original lookup: full tree, then every table's headers"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for table in soup.find_all('table'):
+        header_text = ' '.join(h.get_text() for h in table.find_all('th'))
+        if all(h in header_text for h in MOUNT_TABLE_HEADERS):
+            return table
+    return None
+
+
+def rows_to_records(table):
+    type_icons = {}
+    records = [extract_mount_data(row, type_icons) for row in table.find_all('tr')[1:]]
+    return json.dumps([r for r in records if r], ensure_ascii=False, sort_keys=True), type_icons
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_mount_table_matches_baseline(mounts_html, backend):
+    expected = rows_to_records(baseline_mount_table(mounts_html))
+    table = find_mount_table(mounts_html, MOUNT_TABLE_HEADERS, backend)
+
+    assert table is not None
+    assert rows_to_records(table) == expected
+
+
+def test_fixture_table_covers_the_tricky_rows(mounts_html):
+    records, type_icons = rows_to_records(baseline_mount_table(mounts_html))
+    records = json.loads(records)
+
+    assert [r["name"] for r in records] == [
+        "Company Chocobo", "Gabriel α", "Fat Black Chocobo", "Magitek Armor", "Sabotender Emperador",
+    ]
+    assert records[1]["obtainable"] is True                 # Check image
+    assert records[2]["cash_shop"] and records[2]["market_board"]
+    assert records[2]["seats"] == 2
+    assert records[3]["seats"] == 1                         # "?" falls back to one seat
+    assert type_icons["PvP"]["filename"] == "PvP_icon1.png"  # Not a thumbnail
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_description_matches_baseline(mount_pages, backend):
+    for path, page in mount_pages.items():
+        expected = blockquote_description(BeautifulSoup(page, 'html.parser').find('blockquote'))
+        assert blockquote_description(find_description_blockquote(page, backend)) == expected, path
@@ -0,0 +1,103 @@
+"""Disk cache: fresh hits, conditional revalidation and stale fallbacks"""
+
+import socket
+
+import pytest
+import requests
+
+import http_cache
+import http_client
+import mount_pipeline
+from wiki_fixtures import FaultInjector
+
+URL = mount_pipeline.BASE_URL + "/wiki/Cached_Page"
+BODY = b"<html><body><blockquote>Cached description</blockquote></body></html>"
+VALIDATORS = {"ETag": '"v1"', "Last-Modified": "Sat, 03 Jan 2026 10:00:00 GMT"}
+PAGE = {URL: (BODY, "text/html; charset=UTF-8", VALIDATORS)}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch, stand_in):
+    """Cache on, in a scratch directory; returns the request headers sent by each cached_get"""
+    monkeypatch.setattr(http_cache, "CACHE_DIR", str(tmp_path / "http_cache"))
+    monkeypatch.setattr(http_cache, "CACHE_ENABLED", True)
+    monkeypatch.setattr(http_client, "BACKOFF_BASE", 0.001)
+    sent = []
+
+    def spy(url, headers=None, **kwargs):
+        sent.append(dict(headers or {}))
+        return http_client.get(url, headers=headers, **kwargs)
+
+    monkeypatch.setattr(http_cache, "http_get", spy)
+    return sent
+
+
+def stats_since(before):
+    return {key: http_cache.CACHE_STATS[key] - before[key] for key in before}
+
+
+def test_fresh_entry_is_served_without_a_request(stand_in, cache):
+    server = stand_in(extra=PAGE)
+    before = dict(http_cache.CACHE_STATS)
+
+    first = http_cache.cached_get(URL)
+    second = http_cache.cached_get(URL)
+
+    assert (first.cache_status, second.cache_status) == ("miss", "hit")
+    assert first.content == second.content == BODY
+    assert cache == [{}]
+    assert server.faults.stats["served"] == 1
+    assert stats_since(before) == {"hits": 1, "revalidated": 0, "misses": 1, "stale": 0}
+
+
+def test_expired_entry_is_revalidated_with_its_validators(stand_in, cache):
+    server = stand_in(extra=PAGE)
+    http_cache.cached_get(URL)
+    meta, _ = http_cache.load_entry(URL)
+    before = dict(http_cache.CACHE_STATS)
+
+    response = http_cache.cached_get(URL, max_age=0)
+
+    assert cache[-1] == {"If-None-Match": '"v1"', "If-Modified-Since": VALIDATORS["Last-Modified"]}
+    assert server.faults.stats["not_modified"] == 1
+    assert (response.status_code, response.cache_status, response.content) == (200, "revalidated", BODY)
+    assert http_cache.load_entry(URL)[0]["fetched_at"] > meta["fetched_at"]
+    assert stats_since(before) == {"hits": 0, "revalidated": 1, "misses": 0, "stale": 0}
+
+
+def test_stale_copy_on_connection_error(stand_in, cache):
+    stand_in(extra=PAGE)
+    http_cache.cached_get(URL)
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    http_client.use_stand_in(f"http://127.0.0.1:{port}")
+    before = dict(http_cache.CACHE_STATS)
+
+    response = http_cache.cached_get(URL, max_age=0)
+
+    assert (response.status_code, response.cache_status, response.content) == (200, "stale", BODY)
+    assert stats_since(before) == {"hits": 0, "revalidated": 0, "misses": 0, "stale": 1}
+    with pytest.raises(requests.ConnectionError):
+        http_cache.cached_get(mount_pipeline.BASE_URL + "/wiki/Never_Cached")
+
+
+def test_stale_copy_on_server_error(stand_in, cache):
+    stand_in(extra=PAGE)
+    http_cache.cached_get(URL)
+    stand_in(FaultInjector(error_rate=1.0, error_status=503), extra=PAGE)
+    before = dict(http_cache.CACHE_STATS)
+
+    response = http_cache.cached_get(URL, max_age=0)
+
+    assert (response.status_code, response.cache_status, response.content) == (200, "stale", BODY)
+    assert stats_since(before) == {"hits": 0, "revalidated": 0, "misses": 0, "stale": 1}
+    assert http_cache.cached_get(mount_pipeline.BASE_URL + "/wiki/Never_Cached").status_code == 503
+
+
+def test_errors_are_not_cached(stand_in, cache):
+    stand_in()
+    missing = mount_pipeline.BASE_URL + "/wiki/Not_In_Archive"
+
+    assert http_cache.cached_get(missing).status_code == 404
+    assert http_cache.load_entry(missing) == (None, None)
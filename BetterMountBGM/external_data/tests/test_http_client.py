@@ -0,0 +1,124 @@
+"""Retries, Retry-After and backoff of the shared HTTP client against the stand-in server"""
+
+import random
+import socket
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+import http_client
+import mount_pipeline
+from wiki_fixtures import FaultInjector
+
+PAGE = mount_pipeline.BASE_URL + "/wiki/Company_Chocobo"
+
+
+@pytest.fixture
+def fast_backoff(monkeypatch):
+    """Tiny backoff; every computed delay is kept in the returned list"""
+    monkeypatch.setattr(http_client, "BACKOFF_BASE", 0.001)
+    delays = []
+    backoff_delay = http_client.backoff_delay
+
+    def recorded(attempt):
+        delays.append((attempt, backoff_delay(attempt)))
+        return delays[-1][1]
+
+    monkeypatch.setattr(http_client, "backoff_delay", recorded)
+    return delays
+
+
+def stats_since(before):
+    return {key: http_client.REQUEST_STATS[key] - before[key] for key in before}
+
+
+def response_with(retry_after):
+    response = requests.Response()
+    response.status_code = 429
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+# ==========================
+# RETRY LOOP
+# ==========================
+
+def test_last_429_is_returned_when_retries_run_out(stand_in, fast_backoff):
+    server = stand_in(FaultInjector(error_rate=1.0, error_status=429))
+    before = dict(http_client.REQUEST_STATS)
+
+    response = http_client.get(PAGE, max_retries=3)
+
+    assert response.status_code == 429
+    assert stats_since(before) == {"requests": 1, "attempts": 4, "retries": 3, "failures": 0, "bytes": 0}
+    assert [(outcome, attempt) for _, outcome, _, attempt in http_client.TIMINGS[-4:]] == [
+        (429, 0), (429, 1), (429, 2), (429, 3)]
+    assert server.faults.stats["errors"] == 4
+    assert fast_backoff == []           # Retry-After: 0 was sent with every error
+
+
+def test_503_without_retry_after_backs_off_until_success(stand_in, fast_backoff, wiki_pages):
+    server = stand_in(FaultInjector(error_rate=0.5, error_status=503, seed=4, retry_after=None))
+    before = dict(http_client.REQUEST_STATS)
+
+    response = http_client.get(PAGE, max_retries=6)
+
+    assert response.status_code == 200
+    assert response.content == wiki_pages["/wiki/Company_Chocobo"]
+    errors = server.faults.stats["errors"]
+    assert errors >= 1
+    assert stats_since(before) == {"requests": 1, "attempts": errors + 1, "retries": errors,
+                                   "failures": 0, "bytes": len(response.content)}
+    assert [attempt for attempt, _ in fast_backoff] == list(range(errors))
+    assert all(0 <= delay <= 0.001 * 2 ** attempt for attempt, delay in fast_backoff)
+
+
+def test_connection_errors_raise_after_the_last_retry(pipeline_state, fast_backoff):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]       # Closed again: nothing listens there
+    http_client.use_stand_in(f"http://127.0.0.1:{port}")
+    before = dict(http_client.REQUEST_STATS)
+
+    with pytest.raises(requests.ConnectionError):
+        http_client.get(PAGE, max_retries=2)
+
+    assert stats_since(before) == {"requests": 1, "attempts": 3, "retries": 2, "failures": 1, "bytes": 0}
+    assert [outcome for _, outcome, _, _ in http_client.TIMINGS[-3:]] == ["ConnectionError"] * 3
+    assert len(fast_backoff) == 2
+
+
+# ==========================
+# DELAYS
+# ==========================
+
+def test_retry_after_seconds():
+    assert http_client.retry_after_delay(response_with("7")) == 7.0
+    assert http_client.retry_after_delay(response_with(" 0 ")) == 0.0
+    assert http_client.retry_after_delay(response_with("99999")) == http_client.RETRY_AFTER_MAX
+
+
+def test_retry_after_http_date():
+    future = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+
+    assert 27 <= http_client.retry_after_delay(response_with(future)) <= 30
+    assert http_client.retry_after_delay(response_with(past)) == 0.0
+
+
+def test_retry_after_missing_or_garbage():
+    assert http_client.retry_after_delay(response_with(None)) is None
+    assert http_client.retry_after_delay(response_with("soon")) is None
+
+
+def test_backoff_is_full_jitter_and_capped(monkeypatch):
+    monkeypatch.setattr(http_client, "BACKOFF_BASE", 0.5)
+    random.seed(1)
+    for attempt in range(12):
+        delays = [http_client.backoff_delay(attempt) for _ in range(50)]
+        bound = min(http_client.BACKOFF_MAX, 0.5 * 2 ** attempt)
+        assert all(0 <= d <= bound for d in delays)
+        assert max(delays) > bound / 2       # Spread over the whole window, not a fixed step
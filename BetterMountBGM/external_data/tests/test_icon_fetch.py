@@ -0,0 +1,57 @@
+"""Type icon downloads: content-addressed files and a manifest that survives failed refetches"""
+
+import json
+import os
+
+import mount_pipeline
+from icon_fetch import MANIFEST_NAME, download_icons
+
+IMAGES = mount_pipeline.BASE_URL + "/mediawiki/images"
+GIL_PNG = b"\x89PNG\r\n\x1a\n" + b"gil icon" * 16
+QUEST_PNG = b"\x89PNG\r\n\x1a\n" + b"quest icon" * 16
+ICONS = {
+    f"{IMAGES}/Gil_icon1.png": (GIL_PNG, "image/png"),
+    f"{IMAGES}/Quest_icon1.png": (QUEST_PNG, "image/png"),
+    f"{IMAGES}/Same_as_gil.png": (GIL_PNG, "image/png"),
+}
+
+
+def icon(filename, thumb=False):
+    url = (f"{IMAGES}/thumb/{filename}/20px-{filename}" if thumb else f"{IMAGES}/{filename}")
+    return {"url": url, "filename": filename}
+
+
+def test_download_dedupes_and_skips_present_icons(stand_in, tmp_path):
+    server = stand_in(extra=ICONS)
+    folder = str(tmp_path / "type_icons")
+    type_icons = {"Gil": icon("Gil_icon1.png", thumb=True), "Quest": icon("Quest_icon1.png"),
+                  "Other": icon("Same_as_gil.png")}
+
+    manifest, downloaded, skipped = download_icons(type_icons, folder)
+
+    assert (downloaded, skipped) == (3, 0)
+    assert manifest["Gil"]["file"] == manifest["Other"]["file"] != manifest["Quest"]["file"]
+    assert manifest["Gil"]["source_url"] == f"{IMAGES}/Gil_icon1.png"
+    assert sorted(os.listdir(folder)) == sorted([MANIFEST_NAME, manifest["Gil"]["file"], manifest["Quest"]["file"]])
+
+    served = server.faults.stats["served"]
+    assert download_icons(type_icons, folder)[1:] == (0, 3)
+    assert server.faults.stats["served"] == served
+
+
+def test_failed_refetch_keeps_the_previous_entry(stand_in, tmp_path):
+    stand_in(extra=ICONS)
+    folder = str(tmp_path / "type_icons")
+    before, _, _ = download_icons({"Gil": icon("Gil_icon1.png"), "Quest": icon("Quest_icon1.png")}, folder)
+
+    # Both icons moved to URLs that fail; Quest's old file is gone as well
+    os.remove(os.path.join(folder, before["Quest"]["file"]))
+    failures = {}
+    manifest, downloaded, skipped = download_icons(
+        {"Gil": icon("Gil_icon2.png"), "Quest": icon("Quest_icon2.png")}, folder, failures=failures)
+
+    assert (downloaded, skipped) == (0, 0)
+    assert manifest == {"Gil": before["Gil"]}
+    assert sorted(failures) == ["Gil", "Quest"]
+    with open(os.path.join(folder, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+        assert json.load(f) == {"Gil": before["Gil"]}
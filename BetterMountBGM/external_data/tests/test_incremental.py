@@ -0,0 +1,107 @@
+"""Incremental rebuilds: which rows reuse the previous record and how they are reported"""
+
+import copy
+
+from incremental import merge_previous
+
+
+def record(name, row_hash, **fields):
+    mount = {"name": name, "type": "Quest", "acquired_by": "Quest", "patch": "2.0", "seats": 1,
+             "obtainable": True, "cash_shop": False, "market_board": False,
+             "wiki_url": f"https://ffxiv.consolegameswiki.com/wiki/{name.replace(' ', '_')}"}
+    mount.update(fields)
+    if row_hash is not None:
+        mount["row_hash"] = row_hash
+    return mount
+
+
+def build(*mounts):
+    return {str(i): m for i, m in enumerate(mounts, 1)}
+
+
+def test_classifies_added_changed_removed_unchanged():
+    previous = build(
+        record("Company Chocobo", "a1", description="Same as before."),
+        record("Magitek Armor", "b1", description="Old text."),
+        record("Goobbue", "c1", description="Gone from the table."),
+    )
+    mounts = build(
+        record("Company Chocobo", "a1"),
+        record("Magitek Armor", "b2", patch="2.1"),
+        record("Fat Black Chocobo", "d1"),
+    )
+
+    to_fetch, report = merge_previous(mounts, previous)
+
+    assert [m["name"] for m in to_fetch] == ["Magitek Armor", "Fat Black Chocobo"]
+    assert report == {"added": ["Fat Black Chocobo"], "changed": ["Magitek Armor"],
+                      "removed": ["Goobbue"], "unchanged": 1}
+    assert mounts["1"]["description"] == "Same as before."
+    assert "description" not in mounts["2"] and "description" not in mounts["3"]
+
+
+def test_renamed_mount_is_added_and_old_name_removed():
+    previous = build(record("Gabriel Alpha", "g1", description="Old name."))
+    mounts = build(record("Gabriel α", "g2"))
+
+    to_fetch, report = merge_previous(mounts, previous)
+
+    assert [m["name"] for m in to_fetch] == ["Gabriel α"]
+    assert report == {"added": ["Gabriel α"], "changed": [], "removed": ["Gabriel Alpha"], "unchanged": 0}
+    assert "description" not in mounts["1"]
+
+
+def test_name_match_is_case_insensitive():
+    previous = build(record("Fat black chocobo", "f1", description="Old."))
+    mounts = build(record("Fat Black Chocobo", "f2"))
+
+    _, report = merge_previous(mounts, previous)
+
+    assert report == {"added": [], "changed": ["Fat Black Chocobo"], "removed": [], "unchanged": 0}
+
+
+def test_legacy_records_without_row_hash_compare_table_fields():
+    previous = build(
+        record("Company Chocobo", None, description="Legacy, same fields."),
+        record("Magitek Armor", None, seats=2, description="Legacy, seats changed."),
+    )
+    mounts = build(record("Company Chocobo", "a1"), record("Magitek Armor", "b1"))
+
+    to_fetch, report = merge_previous(mounts, previous)
+
+    assert [m["name"] for m in to_fetch] == ["Magitek Armor"]
+    assert report == {"added": [], "changed": ["Magitek Armor"], "removed": [], "unchanged": 1}
+    assert mounts["1"]["description"] == "Legacy, same fields."
+
+
+def test_hashed_record_is_not_reused_by_name():
+    # Same table fields but a different fingerprint (e.g. the link changed): fetch again
+    previous = build(record("Company Chocobo", "a1", description="Old."))
+    mounts = build(record("Company Chocobo", "a2"))
+
+    to_fetch, report = merge_previous(mounts, previous)
+
+    assert [m["name"] for m in to_fetch] == ["Company Chocobo"]
+    assert report["changed"] == ["Company Chocobo"]
+
+
+def test_previous_record_without_description_is_fetched():
+    previous = build(record("Company Chocobo", "a1"))      # Built with --no-descriptions
+    mounts = build(record("Company Chocobo", "a1"))
+
+    to_fetch, report = merge_previous(mounts, previous)
+
+    assert [m["name"] for m in to_fetch] == ["Company Chocobo"]
+    assert report["unchanged"] == 0
+
+
+def test_empty_previous_build_fetches_everything():
+    mounts = build(record("Company Chocobo", "a1"), record("Magitek Armor", "b1"))
+    original = copy.deepcopy(mounts)
+
+    to_fetch, report = merge_previous(mounts, {})
+
+    assert len(to_fetch) == 2
+    assert report == {"added": ["Company Chocobo", "Magitek Armor"], "changed": [], "removed": [],
+                      "unchanged": 0}
+    assert mounts == original
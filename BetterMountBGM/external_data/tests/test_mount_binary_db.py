@@ -0,0 +1,64 @@
+"""Binary mount database: what is written reads back the same, lookups by name"""
+
+import struct
+
+import pytest
+
+import mount_pipeline
+from mount_binary_db import (FLAG_FIELDS, FORMAT_VERSION, HEADER, STRING_FIELDS, BinaryMountDB,
+                             build_binary_db, write_binary_db)
+
+
+@pytest.fixture
+def mounts(mounts_html):
+    table = mount_pipeline.find_mount_table(mounts_html, mount_pipeline.MOUNT_TABLE_HEADERS)
+    mounts = mount_pipeline.extract_rows(table)[0]
+    mounts["1"]["description"] = "A sturdy chocobo & loyal companion.\nSecond line."
+    return mounts
+
+
+def stored_fields(mount):
+    expected = {field: mount.get(field, "") or "" for field in STRING_FIELDS}
+    expected["seats"] = mount["seats"]
+    expected.update({field: bool(mount.get(field)) for field in FLAG_FIELDS})
+    return expected
+
+
+def test_round_trip(tmp_path, mounts):
+    path = str(tmp_path / "mounts.bin")
+    size = write_binary_db(mounts, path)
+    db = BinaryMountDB.load(path)
+
+    assert size == (tmp_path / "mounts.bin").stat().st_size
+    assert db.record_count == len(mounts)
+    assert [db.record(i) for i in range(db.record_count)] == [stored_fields(m) for m in mounts.values()]
+    for mount in mounts.values():
+        assert db.get(mount["name"]) == stored_fields(mount)
+        assert db.get("  " + mount["name"].upper() + " ") == stored_fields(mount)
+    assert db.get("Not A Mount") is None
+
+
+def test_duplicate_names_keep_the_first_record():
+    db = BinaryMountDB(build_binary_db({
+        "1": {"name": "Magitek Armor", "seats": 1, "patch": "2.0"},
+        "2": {"name": "magitek  armor", "seats": 2, "patch": "5.0"},
+    }))
+    assert db.get("Magitek Armor")["patch"] == "2.0"
+    assert db.record(1)["seats"] == 2
+
+
+def test_empty_database():
+    db = BinaryMountDB(build_binary_db({}))
+    assert db.record_count == 0
+    assert db.get("Company Chocobo") is None
+
+
+def test_header_is_checked(mounts):
+    data = build_binary_db(mounts)
+    magic, version = HEADER.unpack_from(data, 0)[:2]
+    assert (magic, version) == (b"BMDB", FORMAT_VERSION)
+
+    with pytest.raises(ValueError):
+        BinaryMountDB(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        BinaryMountDB(data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:])
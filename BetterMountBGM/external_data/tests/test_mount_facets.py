@@ -0,0 +1,48 @@
+"""Facet summary and type shards written from a mount database"""
+
+import json
+
+from mount_facets import build_facets, patch_bucket, write_facets
+
+HEADER = {"source": "fixture", "note": "dropped from the summary"}
+
+MOUNTS = {
+    "12": {"name": "Ahriman", "type": "Achievement", "patch": "2.0", "obtainable": True},
+    "3": {"name": "Company Chocobo", "type": "Quest", "patch": "2.0", "obtainable": True},
+    "100": {"name": "Air-wheeler A9", "type": "Gold Saucer", "patch": "10.05", "obtainable": True,
+            "market_board": True},
+    "7": {"name": "Argos", "type": "Achievement", "patch": "3.1", "obtainable": False},
+    "bonus": {"name": "Fat Black Chocobo", "type": "Cash Shop", "patch": "", "obtainable": True,
+              "cash_shop": True},
+}
+
+
+def test_patch_buckets():
+    assert patch_bucket("6.35") == "6.x"
+    assert patch_bucket(" 10.0") == "10.x"
+    assert patch_bucket("") == patch_bucket(None) == patch_bucket("Patch") == "Unknown"
+
+
+def test_patches_sort_by_version_with_unknown_last():
+    facets = build_facets(MOUNTS)
+    assert list(facets["patches"].items()) == [("2.x", 2), ("3.x", 1), ("10.x", 1), ("Unknown", 1)]
+
+
+def test_facets_round_trip(tmp_path):
+    facets_file = tmp_path / "mount_facets.json"
+    types_folder = tmp_path / "mount_types"
+    facets = write_facets(HEADER, MOUNTS, partition=True, facets_file=str(facets_file),
+                          types_folder=str(types_folder))
+
+    written = json.loads(facets_file.read_text(encoding='utf-8'))
+    assert written == dict({"source": "fixture"}, **facets)
+    assert list(written["patches"]) == ["2.x", "3.x", "10.x", "Unknown"]
+    assert written["members"]["Achievement"] == ["7", "12"]
+    assert written["flags"] == {"obtainable": 4, "cash_shop": 1, "market_board": 1, "unobtainable": 1}
+
+    for type_name, keys in written["members"].items():
+        with open(written["shards"][type_name], 'r', encoding='utf-8') as f:
+            shard = json.load(f)
+        assert shard["type"] == type_name
+        assert shard["total_mounts"] == len(keys)
+        assert shard["mounts"] == {key: MOUNTS[key] for key in keys}
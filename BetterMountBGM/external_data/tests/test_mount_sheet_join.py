@@ -0,0 +1,135 @@
+"""Wiki -> Mount sheet join: match order, aliases, report, fuzzy resolution"""
+
+import json
+import random
+
+import pytest
+
+from mount_fuzzy_match import BKTree, accepted_matches, fuzzy_key, levenshtein, resolve_unmatched
+from mount_sheet_join import join_key, join_mounts, load_aliases, load_mount_sheet
+
+SHEET_CSV = """key,0,1,2
+#,Singular,Order,RideBGM
+int32,str,int16,uint16
+0,,0,0
+1,Company Chocobo,1,62
+4,air-wheeler A9,40,0
+7,Magitek Armor,-1,0
+8,Magitek Armor,12,0
+9,Gabriel α,30,0
+11,Fat Black Chocobo,25,97
+"""
+
+
+@pytest.fixture
+def sheet(tmp_path):
+    path = tmp_path / "Mount.csv"
+    path.write_text(SHEET_CSV, encoding='utf-8')
+    return load_mount_sheet(str(path))
+
+
+def wiki(*names):
+    return {str(i): {"name": name, "type": "Quest"} for i, name in enumerate(names, 1)}
+
+
+def test_sheet_export_skips_type_and_empty_rows(sheet):
+    assert [(r["row_id"], r["singular"], r["order"], r["ride_bgm"]) for r in sheet] == [
+        (1, "Company Chocobo", 1, 62), (4, "air-wheeler A9", 40, 0), (7, "Magitek Armor", -1, 0),
+        (8, "Magitek Armor", 12, 0), (9, "Gabriel α", 30, 0), (11, "Fat Black Chocobo", 25, 97)]
+
+
+def test_exact_then_normalized(sheet):
+    mounts, report = join_mounts(wiki("Company Chocobo", "Air-wheeler  A9"), sheet)
+
+    assert {k: (m["name"], m["match"]) for k, m in mounts.items()} == {
+        "1": ("Company Chocobo", "exact"), "4": ("Air-wheeler  A9", "normalized")}
+    assert mounts["1"]["ride_bgm"] == 62
+    assert report["matched"] == {"exact": 1, "normalized": 1, "alias": 0}
+
+
+def test_alias_resolves_a_name_that_matches_nothing(sheet):
+    aliases = {join_key("Gabriel Alpha"): 9}
+    mounts, report = join_mounts(wiki("Gabriel Alpha"), sheet, aliases)
+
+    assert mounts["9"]["match"] == "alias"
+    assert report["dangling_aliases"] == report["stale_aliases"] == []
+
+
+def test_stale_alias_does_not_override_an_exact_match(sheet):
+    aliases = {join_key("Company Chocobo"): 11}
+    mounts, report = join_mounts(wiki("Company Chocobo"), sheet, aliases)
+
+    assert list(mounts) == ["1"]
+    assert mounts["1"]["match"] == "exact"
+    assert report["stale_aliases"] == [{"name": "Company Chocobo", "alias_row_id": 11, "matched_row_id": 1}]
+    assert report["unmatched_game"][-1] == {"row_id": 11, "name": "Fat Black Chocobo"}
+
+
+def test_dangling_alias_falls_back_and_is_reported(sheet):
+    aliases = {join_key("Air-wheeler A9"): 999, join_key("Unknown Mount"): 998}
+    mounts, report = join_mounts(wiki("Air-Wheeler A9", "Unknown Mount"), sheet, aliases)
+
+    assert mounts["4"]["match"] == "normalized"
+    assert report["unmatched_wiki"] == [{"key": "2", "name": "Unknown Mount"}]
+    assert report["dangling_aliases"] == [{"name": "air-wheeler a9", "row_id": 999},
+                                          {"name": "unknown mount", "row_id": 998}]
+
+
+def test_ambiguous_names_prefer_listed_rows_and_collisions_are_dropped(sheet):
+    mounts, report = join_mounts(wiki("Magitek Armor", "magitek armor"), sheet)
+
+    assert list(mounts) == ["8"]
+    assert report["ambiguous"][0] == {"name": "Magitek Armor", "row_ids": [7, 8], "chosen": 8}
+    assert report["collisions"] == [{"row_id": 8, "kept": "Magitek Armor", "dropped": "magitek armor"}]
+
+
+def test_alias_file_keys_are_normalized(tmp_path):
+    path = tmp_path / "mount_aliases.json"
+    path.write_text(json.dumps({"Gabriel  ALPHA": "9"}), encoding='utf-8')
+
+    assert load_aliases(str(path)) == {"gabriel alpha": 9}
+    assert load_aliases(str(tmp_path / "missing.json")) == {}
+
+
+# ==========================
+# FUZZY MATCHING
+# ==========================
+
+def test_fuzzy_key_drops_punctuation_and_articles():
+    assert fuzzy_key("The Magitek Armor!") == "magitek armor"
+    assert fuzzy_key("Air-wheeler A9") == "airwheeler a9"
+
+
+def test_bk_tree_search_matches_brute_force():
+    rng = random.Random(3)
+    words = ["".join(rng.choice("abcde") for _ in range(rng.randint(3, 8))) for _ in range(200)]
+    tree = BKTree()
+    for i, word in enumerate(words):
+        tree.add(word, i)
+
+    for query in words[:20] + ["abc", "eeeeeeee"]:
+        expected = sorted((levenshtein(query, w), i) for i, w in enumerate(words) if levenshtein(query, w) <= 2)
+        assert sorted(tree.search(query, 2)) == expected
+
+
+def test_tied_or_distant_candidates_are_not_accepted():
+    suggestions = [
+        {"name": "Fat Blak Chocobo", "candidates": [{"row_id": 11, "name": "Fat Black Chocobo", "distance": 1}]},
+        {"name": "Magitek Armr", "candidates": [{"row_id": 7, "distance": 1}, {"row_id": 8, "distance": 1}]},
+        {"name": "Company Chocobo II", "candidates": [{"row_id": 1, "distance": 3}]},
+        {"name": "Nothing", "candidates": []},
+    ]
+    assert accepted_matches(suggestions) == {"Fat Blak Chocobo": 11}
+
+
+def test_accepted_fuzzy_matches_apply_as_aliases(sheet, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    mounts = wiki("Company Chocobo", "Fat Blak Chocobo")
+    _, report = join_mounts(mounts, sheet)
+
+    accepted = resolve_unmatched(report, sheet, accept=True)
+    assert accepted == {"Fat Blak Chocobo": 11}
+
+    joined, report = join_mounts(mounts, sheet, load_aliases())
+    assert joined["11"]["match"] == "alias"
+    assert report["unmatched_wiki"] == []
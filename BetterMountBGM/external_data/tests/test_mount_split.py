@@ -0,0 +1,59 @@
+"""Core/details split: every record can be rebuilt from the core file and its detail shard"""
+
+import json
+
+from mount_split import (DETAILS_INDEX, MountDetails, shard_name, split_record, write_detail_shards,
+                         write_split)
+
+HEADER = {"version": "1.1.1", "source": "https://ffxiv.consolegameswiki.com/wiki/Mounts"}
+
+
+def make_mounts(count):
+    return {
+        str(i): {"name": f"Mount {i}", "type": "Quest", "acquired_by": "Quest", "patch": "2.0",
+                 "seats": 1, "obtainable": True, "cash_shop": False, "market_board": False,
+                 "wiki_url": f"https://ffxiv.consolegameswiki.com/wiki/Mount_{i}",
+                 "row_hash": f"{i:040x}", "description": f"Description of mount {i}. " * (i % 7 + 1)}
+        for i in range(1, count + 1)
+    }
+
+
+def test_split_round_trip(tmp_path):
+    mounts = make_mounts(40)
+    mounts["41"] = {"name": "Core only", "type": "Other", "seats": 1}      # No detail fields
+    core_file = tmp_path / "core.json"
+    folder = tmp_path / "details"
+
+    write_split(HEADER, mounts, str(core_file), str(folder))
+
+    core = json.loads(core_file.read_text(encoding='utf-8'))
+    assert {k: core[k] for k in HEADER} == HEADER
+    assert core["total_mounts"] == 41
+    assert core["details"] == f"{folder}/{DETAILS_INDEX}"
+    details = MountDetails(str(folder))
+    for key, mount in mounts.items():
+        rebuilt = dict(core["mounts"][key], **(details.get(key) or {}))
+        assert rebuilt == mount
+    assert details.get("41") is None
+    assert details.get("999") is None
+
+
+def test_split_record_keeps_render_fields_in_core():
+    core, detail = split_record(make_mounts(1)["1"])
+    assert set(core) == {"name", "type", "acquired_by", "patch", "seats", "obtainable", "cash_shop", "market_board"}
+    assert set(detail) == {"wiki_url", "row_hash", "description"}
+
+
+def test_shards_are_capped_and_leftovers_removed(tmp_path):
+    folder = str(tmp_path / "details")
+    big = {key: split_record(mount)[1] for key, mount in make_mounts(60).items()}
+
+    shards = write_detail_shards(big, folder, shard_max_bytes=1024)
+    assert shards > 1
+    assert all((tmp_path / "details" / shard_name(n)).stat().st_size <= 1024 for n in range(shards))
+    assert MountDetails(folder).get("60") == big["60"]
+
+    small = {key: split_record(mount)[1] for key, mount in make_mounts(2).items()}
+    assert write_detail_shards(small, folder, shard_max_bytes=1024) == 1
+    assert sorted(p.name for p in (tmp_path / "details").glob("shard_*.jsonl")) == [shard_name(0)]
+    assert MountDetails(folder).get("2") == small["2"]
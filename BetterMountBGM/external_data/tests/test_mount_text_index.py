@@ -0,0 +1,57 @@
+"""Mount text index: terms read back as built, queries match a scan of the records"""
+
+import struct
+
+import pytest
+
+from mount_text_index import (FORMAT_VERSION, HEADER, MountTextIndex, build_index, build_postings,
+                              mount_terms, tokenize, write_index)
+
+MOUNTS = {
+    "1": {"name": "Company Chocobo", "acquired_by": "Join a Grand Company.",
+          "description": "A sturdy chocobo trained by the Grand Company."},
+    "2": {"name": "Gilded Magitek Armor", "acquired_by": "Gold Saucer prize exchange for 2,000,000 MGP.",
+          "description": "Allagan-inspired armor, gilded for Ul’dah’s elite."},
+    "3": {"name": "Fat Black Chocobo", "acquired_by": "Online Store", "description": ""},
+    "12": {"name": "Sabotender Emperador", "acquired_by": "PvP: 20,000 Wolf Marks.",
+           "description": "The emperor of the Sagolii desert, and of the Gold Saucer."},
+}
+
+
+def scan(text):
+    terms = set(tokenize(text))
+    return [key for key in sorted(MOUNTS, key=int) if terms and terms <= mount_terms(MOUNTS[key])]
+
+
+def test_tokenizer():
+    assert tokenize("Ul’dah's Gold-Saucer: THE MGP, a b") == ["ul'dah's", "gold", "saucer", "mgp"]
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "index.bin")
+    write_index(MOUNTS, path)
+    index = MountTextIndex.load(path)
+
+    postings = build_postings(MOUNTS)
+    assert index.term_count == len(postings)
+    assert index.terms == sorted(index.terms)
+    assert {t.decode("utf-8"): index.postings(t.decode("utf-8")) for t in index.terms} == postings
+
+
+@pytest.mark.parametrize("text", ["gold saucer", "GRAND company", "ul'dah", "Ul’dah", "chocobo",
+                                  "allagan armor", "wolf marks 20", "the", "", "nothing here"])
+def test_query_matches_scan(text):
+    assert MountTextIndex(build_index(MOUNTS)).query(text) == scan(text)
+
+
+def test_names_are_not_indexed():
+    assert MountTextIndex(build_index(MOUNTS)).query("emperador") == []
+
+
+def test_header_is_checked():
+    data = build_index(MOUNTS)
+    assert HEADER.unpack_from(data, 0)[:2] == (b"BMTI", FORMAT_VERSION)
+    with pytest.raises(ValueError):
+        MountTextIndex(b"BGMT" + data[4:])
+    with pytest.raises(ValueError):
+        MountTextIndex(data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:])
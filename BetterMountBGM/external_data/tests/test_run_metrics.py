@@ -0,0 +1,56 @@
+"""Failure reasons and where they are recorded"""
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+import mount_pipeline
+from html_backend import find_mount_table
+from http_cache import CachedResponse
+from run_metrics import RunMetrics, error_reason
+
+
+def test_cached_http_error_keeps_its_status():
+    response = CachedResponse("https://example.org/wiki/Missing", 404, b"", {}, "hit")
+    with pytest.raises(requests.HTTPError) as caught:
+        response.raise_for_status()
+
+    assert caught.value.response is response
+    assert error_reason(caught.value) == "HTTPError 404"
+
+
+def test_network_http_error_reason():
+    response = requests.Response()
+    response.status_code = 503
+    assert error_reason(requests.HTTPError("503 Server Error", response=response)) == "HTTPError 503"
+
+
+def fixture_rows(mounts_html):
+    return find_mount_table(mounts_html, mount_pipeline.MOUNT_TABLE_HEADERS, "html.parser").find_all('tr')[1:]
+
+
+def test_section_and_spacer_rows_are_not_failures(mounts_html):
+    rows = fixture_rows(mounts_html)
+    assert any(row.get('class') == ['section'] for row in rows)
+    assert any(row.get('class') == ['spacer'] for row in rows)
+
+    metrics = RunMetrics()
+    mounts, _ = mount_pipeline.extract_rows(find_mount_table(
+        mounts_html, mount_pipeline.MOUNT_TABLE_HEADERS, "html.parser"), metrics)
+
+    assert len(mounts) == 5
+    assert metrics.failures == []
+
+
+def test_row_failures_go_to_the_given_sink_only():
+    broken = BeautifulSoup("<table><tr><td></td><td><a href='/wiki/X'></a></td>"
+                           + "<td></td>" * 8 + "</tr></table>", 'html.parser').find('tr')
+    before = len(mount_pipeline.METRICS.failures)
+
+    assert mount_pipeline.extract_mount_data(broken, {}) is None
+    assert len(mount_pipeline.METRICS.failures) == before
+
+    metrics = RunMetrics()
+    assert mount_pipeline.extract_mount_data(broken, {}, metrics) is None
+    assert [(f["stage"], f["reason"]) for f in metrics.failures] == [("extract_rows", "no name")]
+    assert len(mount_pipeline.METRICS.failures) == before
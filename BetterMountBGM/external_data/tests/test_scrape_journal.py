@@ -0,0 +1,53 @@
+"""The journal must survive a crash mid-write and keep every later entry"""
+
+import json
+
+from scrape_journal import ScrapeJournal, replay_journal, truncate_torn_line
+
+
+def write_torn_journal(path):
+    complete = [
+        {"url": "https://wiki/A", "status": "ok", "description": "Alpha"},
+        {"url": "https://wiki/B", "status": "failed", "error": "ConnectionError()"},
+    ]
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in complete:
+            f.write(json.dumps(entry) + "\n")
+        f.write('{"url": "https://wiki/C", "status": "ok", "descr')     # Crash mid-write
+
+
+def test_resume_after_torn_line_keeps_new_entries(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    write_torn_journal(path)
+
+    with ScrapeJournal(path, resume=True) as journal:
+        assert journal.completed("https://wiki/A")["description"] == "Alpha"
+        assert journal.failed_urls() == ["https://wiki/B"]
+        journal.record_ok("https://wiki/B", "Beta")
+        journal.record_ok("https://wiki/C", "Gamma")
+
+    entries = replay_journal(path)
+    assert {url: e["description"] for url, e in entries.items()} == {
+        "https://wiki/A": "Alpha", "https://wiki/B": "Beta", "https://wiki/C": "Gamma",
+    }
+    with open(path, 'r', encoding='utf-8') as f:
+        assert all(json.loads(line) for line in f)      # No glued or partial lines left
+
+
+def test_truncate_leaves_complete_journals_alone(tmp_path):
+    path = str(tmp_path / "run.journal.jsonl")
+    with ScrapeJournal(path) as journal:
+        journal.record_ok("https://wiki/A", "Alpha")
+    size = (tmp_path / "run.journal.jsonl").stat().st_size
+
+    assert truncate_torn_line(path) == 0
+    assert truncate_torn_line(str(tmp_path / "missing.jsonl")) == 0
+    assert (tmp_path / "run.journal.jsonl").stat().st_size == size
+
+
+def test_truncate_single_partial_line(tmp_path):
+    path = tmp_path / "run.journal.jsonl"
+    path.write_text('{"url": "https://wiki/A", "sta', encoding='utf-8')
+
+    assert truncate_torn_line(str(path)) == len('{"url": "https://wiki/A", "sta')
+    assert path.read_text(encoding='utf-8') == ""
@@ -0,0 +1,189 @@
+"""Streaming parsers must match the full html.parser tree, whatever the chunking"""
+
+import json
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+
+import mount_pipeline
+from mount_pipeline import MOUNT_TABLE_HEADERS, blockquote_description, extract_mount_data
+from stream_parse import find_blockquote_streamed, iter_table_rows
+
+CHUNK_SIZES = (1, 3, 7, 64, 4096)
+
+
+def chunks(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def records(rows):
+    type_icons = {}
+    found = [extract_mount_data(row, type_icons) for row in rows]
+    return json.dumps([r for r in found if r], ensure_ascii=False, sort_keys=True), type_icons
+
+
+def baseline_rows(html, headers):
+    soup = BeautifulSoup(html, 'html.parser')
+    for table in soup.find_all('table'):
+        header_text = ' '.join(th.get_text() for th in table.find_all('th'))
+        if all(h in header_text for h in headers):
+            return table.find_all('tr')[1:]
+    return []
+
+
+# ==========================
+# MOUNTS TABLE
+# ==========================
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_table_rows_match_full_parse(mounts_html, size):
+    html = mounts_html.decode("utf-8")
+    expected = records(baseline_rows(html, MOUNT_TABLE_HEADERS))
+    assert records(iter_table_rows(chunks(html, size), MOUNT_TABLE_HEADERS)) == expected
+
+
+def test_unclosed_last_row_is_kept():
+    html = ("<table><tr><th>Name</th><th>Seats</th></tr>"
+            "<tr><td>A</td><td>1</td></tr>"
+            "<tr><td>B</td><td>2</td></table><p>after <b>the</b> table</p>")
+    rows = list(iter_table_rows([html], ("Name", "Seats")))
+
+    assert [row.get_text(" ") for row in rows] == [
+        row.get_text(" ") for row in baseline_rows(html, ("Name", "Seats"))
+    ]
+    assert [row.get_text(" ") for row in rows] == ["A 1", "B 2"]
+
+
+def test_unclosed_rows_in_every_position():
+    html = ("<table><tr><th>Name</th><th>Seats</th>"
+            "<tr><td>A</td><td>1</td>"
+            "<tr><td>B</td><td>2</td></table>")
+    rows = list(iter_table_rows([html], ("Name", "Seats")))
+    assert [row.get_text(" ") for row in rows] == ["A 1", "B 2"]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_cell_text_split_across_chunks(size):
+    html = ("<table><tr><th>Name</th><th>Seats</th></tr>"
+            "<tr><td>Fat &amp; Black<!-- note --> Chocobo</td><td>2</td></tr></table>")
+    expected = [td.get_text() for row in baseline_rows(html, ("Name", "Seats")) for td in row.find_all('td')]
+    rows = list(iter_table_rows(chunks(html, size), ("Name", "Seats")))
+
+    assert [td.get_text() for row in rows for td in row.find_all('td')] == expected
+    assert [len(td.children) for td in rows[0].find_all('td')] == [2, 1]   # Strings merged, comment kept apart
+
+
+# ==========================
+# DESCRIPTION BLOCKQUOTE
+# ==========================
+
+TRICKY_PAGES = {
+    "entities": "<p>x</p><blockquote>Fish &amp; chips&#8212;caf&eacute; &quot;special&quot; &lt;3<br>"
+                "— In-game description</blockquote>",
+    "comments": "<blockquote>Half<!-- split -->way <!-- a --><!-- b -->there.<br/>"
+                "Next<!----> line.</blockquote>",
+    "line breaks": "<blockquote>One<br>Two<br/>Three<br />\nFour</blockquote><p>tail</p>",
+    "nested": "<blockquote>Outer <blockquote>inner <b>bold</b></blockquote> after inner.<br>"
+              "— In-game description</blockquote><blockquote>second</blockquote>",
+    "unclosed children": "<blockquote><p>First <i>italic<p>Second</blockquote><p>tail</p>",
+    "multibyte": "<blockquote>Gabriel α — “quoted” ✓ ニャー</blockquote>",
+    "no blockquote": "<html><body><p>Nothing to see here.</p></body></html>",
+    "unterminated": "<blockquote>Cut off before the end &amp; more",
+}
+
+
+def full_parse(page):
+    return blockquote_description(BeautifulSoup(page, 'html.parser').find('blockquote'))
+
+
+def streamed(page, size):
+    blockquote, read = find_blockquote_streamed(chunks(page, size))
+    return blockquote_description(blockquote), read
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("name", TRICKY_PAGES)
+def test_streamed_description_matches_full_parse(name, size):
+    page = TRICKY_PAGES[name].encode("utf-8")
+    assert streamed(page, size)[0] == full_parse(page)
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_streamed_fixture_pages_match_full_parse(mount_pages, size):
+    for path, page in mount_pages.items():
+        assert streamed(page, size)[0] == full_parse(page), path
+
+
+def test_streamed_read_stops_after_the_blockquote(mount_pages):
+    page = mount_pages["/wiki/Company_Chocobo"]
+    _, read = streamed(page, 7)
+    end = page.index(b"</blockquote>") + len(b"</blockquote>")
+
+    assert end <= read < end + 7
+    assert streamed(page, 7)[0] == full_parse(page)
+    assert "second quote" not in streamed(page, 7)[0]
+
+
+# ==========================
+# STREAMED OUTPUT
+# ==========================
+
+OLD_DATABASE = '{"mounts": {"1": {"name": "Previous build"}}, "total_mounts": 1}\n'
+
+
+@pytest.fixture
+def previous_build(tmp_path, monkeypatch):
+    """A working directory holding the output of an earlier run"""
+    monkeypatch.chdir(tmp_path)
+    for name in (mount_pipeline.OUTPUT_FILE, mount_pipeline.JSONL_FILE):
+        (tmp_path / name).write_text(OLD_DATABASE, encoding='utf-8')
+    return tmp_path
+
+
+def stream_args(*argv):
+    return mount_pipeline.parse_args(["--stream", "--json-only", *argv])
+
+
+@pytest.mark.parametrize("jsonl", [[], ["--jsonl"]])
+def test_missing_table_keeps_previous_output(previous_build, jsonl):
+    page = previous_build / "page.html"
+    page.write_text("<table><tr><th>Something else</th></tr><tr><td>x</td></tr></table>", encoding='utf-8')
+
+    with pytest.raises(RuntimeError, match="Mount table not found"):
+        mount_pipeline.run_streaming(stream_args("--from-file", str(page), *jsonl))
+
+    assert sorted(p.name for p in previous_build.iterdir()) == sorted(
+        ["page.html", mount_pipeline.OUTPUT_FILE, mount_pipeline.JSONL_FILE])
+    for name in (mount_pipeline.OUTPUT_FILE, mount_pipeline.JSONL_FILE):
+        assert (previous_build / name).read_text(encoding='utf-8') == OLD_DATABASE
+
+
+@pytest.mark.parametrize("jsonl", [[], ["--jsonl"]])
+def test_error_mid_stream_keeps_previous_output(previous_build, monkeypatch, mounts_html, jsonl):
+    html = mounts_html.decode("utf-8")
+    cut = html.index("Magitek Armor")     # Some rows are complete before the connection drops
+
+    def broken_stream(url):
+        yield html[:cut]
+        raise requests.ConnectionError("connection reset mid-download")
+
+    monkeypatch.setattr(mount_pipeline, "stream_url", broken_stream)
+    with pytest.raises(requests.ConnectionError):
+        mount_pipeline.run_streaming(stream_args(*jsonl))
+
+    assert sorted(p.name for p in previous_build.iterdir()) == sorted(
+        [mount_pipeline.OUTPUT_FILE, mount_pipeline.JSONL_FILE])
+    for name in (mount_pipeline.OUTPUT_FILE, mount_pipeline.JSONL_FILE):
+        assert (previous_build / name).read_text(encoding='utf-8') == OLD_DATABASE
+
+
+def test_finished_stream_replaces_previous_output(previous_build, mounts_html):
+    page = previous_build / "page.html"
+    page.write_bytes(mounts_html)
+
+    count = mount_pipeline.run_streaming(stream_args("--from-file", str(page)))
+
+    database = json.loads((previous_build / mount_pipeline.OUTPUT_FILE).read_text(encoding='utf-8'))
+    assert database["total_mounts"] == count == len(database["mounts"]) > 1
+    assert not list(previous_build.glob("*.tmp"))
@@ -0,0 +1,53 @@
+"""The api.php backend must produce the descriptions the HTML scraper stores"""
+
+import copy
+import os
+from urllib.parse import urlencode
+
+import pytest
+
+import http_client
+import mount_pipeline
+from conftest import WIKI_DIR, build_archive
+from mount_pipeline import enrich_descriptions, extract_rows, find_mount_table
+from wiki_api import API_URL, revisions_params, title_from_url
+from wiki_fixtures import start_server
+
+
+@pytest.fixture
+def api_wiki_server(tmp_path, pipeline_state, mount_urls):
+    """The fixture pages plus the recorded api.php answer for their one batch"""
+    titles = list(dict.fromkeys(title_from_url(url) for url in mount_urls))
+    with open(os.path.join(WIKI_DIR, "api_revisions.json"), 'rb') as f:
+        api_body = f.read()
+    api_url = f"{API_URL}?{urlencode(revisions_params(titles))}"
+    archive = build_archive(str(tmp_path / "wiki_fixtures.zip"),
+                            {api_url: (api_body, "application/json; charset=utf-8")})
+    server, url = start_server(archive)
+    http_client.use_stand_in(url)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def fixture_mounts(mounts_html):
+    table = find_mount_table(mounts_html, mount_pipeline.MOUNT_TABLE_HEADERS)
+    return extract_rows(table)[0]
+
+
+def test_api_descriptions_match_html(api_wiki_server, mounts_html):
+    mounts = fixture_mounts(mounts_html)
+    from_api = copy.deepcopy(mounts)
+    from_html = copy.deepcopy(mounts)
+
+    enrich_descriptions(from_api, backend="api", parse_workers=0)
+    answered_by_api = set(mount_pipeline.REVISION_IDS)
+    mount_pipeline.DESCRIPTION_CACHE.clear()
+    enrich_descriptions(from_html, backend="html", parse_workers=0)
+
+    assert api_wiki_server.faults.stats["missing"] == 0
+    assert len(answered_by_api) == 4                # Magitek Armor has no description: HTML fallback
+    for key, mount in from_html.items():
+        assert from_api[key]["description"] == mount["description"], mount["name"]
+    assert from_html["1"]["description"].startswith("A sturdy chocobo")
+    assert from_html["4"]["description"] == ""
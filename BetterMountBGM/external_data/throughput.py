@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Per-stage throughput counters.
+
+A StageCounter collects, for one stage of the pipeline, how many items it
+handled, how many bytes, and how long each item kept a worker busy. From
+that it derives the stage's rate and its utilization (busy time divided by
+wall time x workers): the stage whose workers are saturated is the
+bottleneck.
+
+Usage:
+    fetch = StageCounter("fetch", workers=8)
+    start = time.perf_counter()
+    ...
+    fetch.add(time.perf_counter() - start, nbytes=len(content), started=start)
+    print_stage_report([fetch, parse])
+"""
+
+import threading
+import time
+
+# ==========================
+# COUNTERS
+# ==========================
+
+class StageCounter:
+    """Thread-safe item / byte / busy-time counter for one stage"""
+
+    def __init__(self, name, workers=1):
+        self.name = name
+        self.workers = max(1, workers)
+        self.items = 0
+        self.bytes = 0
+        self.busy = 0.0
+        self.failures = 0
+        self.first = None
+        self.last = None
+        self.lock = threading.Lock()
+
+    def add(self, seconds, nbytes=0, started=None, failed=False):
+        """Record one item that kept a worker busy for `seconds`"""
+        now = time.perf_counter()
+        started = now - seconds if started is None else started
+        with self.lock:
+            self.items += 1
+            self.bytes += nbytes
+            self.busy += seconds
+            self.failures += failed
+            self.first = started if self.first is None else min(self.first, started)
+            self.last = now if self.last is None else max(self.last, now)
+
+    @property
+    def wall(self):
+        if self.first is None:
+            return 0.0
+        return max(self.last - self.first, 1e-9)
+
+    @property
+    def rate(self):
+        return self.items / self.wall if self.items else 0.0
+
+    @property
+    def utilization(self):
+        return self.busy / (self.wall * self.workers) if self.items else 0.0
+
+    def as_dict(self):
+        return {
+            "items": self.items,
+            "failures": self.failures,
+            "bytes": self.bytes,
+            "workers": self.workers,
+            "wall_seconds": round(self.wall, 4),
+            "busy_seconds": round(self.busy, 4),
+            "items_per_second": round(self.rate, 2),
+            "utilization": round(self.utilization, 3),
+        }
+
+
+def print_stage_report(counters):
+    """One line per stage plus the likely bottleneck"""
+    active = [c for c in counters if c.items]
+    if not active:
+        return
+    print("\n⏱️  Stage throughput:")
+    for c in active:
+        size = f", {c.bytes / 1024:,.0f} KiB" if c.bytes else ""
+        failed = f", {c.failures} failed" if c.failures else ""
+        print(f"   {c.name:<8} {c.items:>5} items in {c.wall:6.2f}s = {c.rate:8.1f}/s "
+              f"({c.workers} workers, {c.utilization:4.0%} busy{size}{failed})")
+    if len(active) > 1:
+        bottleneck = max(active, key=lambda c: c.utilization)
+        print(f"   Bottleneck: {bottleneck.name}")
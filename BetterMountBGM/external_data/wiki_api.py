@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+MediaWiki API backend for mount descriptions.
+
+Instead of downloading and parsing the HTML of every mount page, titles taken
+from the `wiki_url` values are batched (up to 50 per request) into
+`api.php?action=query&prop=revisions` calls that return the wikitext and
+revision ID of each page. ~330 mounts therefore cost about seven requests.
+
+Pages whose wikitext holds no recognisable description are reported back as
+missing so the caller can fall back to the HTML scraper for just those URLs.
+
+API_URL can be pointed at any local stand-in server that answers with
+recorded api.php responses.
+"""
+
+import html
+import re
+from urllib.parse import urlencode, urlparse, unquote
+
+from http_cache import cached_get
+
+# ==========================
+# CONFIG
+# ==========================
+API_URL = "https://ffxiv.consolegameswiki.com/mediawiki/api.php"
+BATCH_SIZE = 50             # MediaWiki's per-request title limit for normal users
+
+# ==========================
+# HELPERS
+# ==========================
+
+def title_from_url(wiki_url):
+    """'https://.../wiki/Air-wheeler_A9' -> 'Air-wheeler A9'"""
+    path = urlparse(wiki_url).path
+    if '/wiki/' in path:
+        path = path.split('/wiki/', 1)[1]
+    else:
+        path = path.rsplit('/', 1)[-1]
+    return unquote(path).replace('_', ' ').strip()
+
+
+def strip_wikitext(text):
+    """Reduce a wikitext fragment to the text the HTML scraper would read.
+
+    Markup that renders as an element (tags, links, bold / italics) becomes a
+    line break, like the text-node boundaries get_text(separator="\n") sees
+    in the rendered page, and entities are decoded.
+    """
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+    text = re.sub(r'<ref[^>]*/>|<ref[^>]*>.*?</ref>', '', text, flags=re.S | re.I)
+    text = re.sub(r'<[^>]+>', '\n', text)
+    # [[Link|Label]] -> Label, [[Link]] -> Link
+    text = re.sub(r'\[\[(?:[^\]|]*\|)?([^\]]*)\]\]', '\n\\1\n', text)
+    # [http://url Label] -> Label
+    text = re.sub(r'\[https?://\S+\s+([^\]]*)\]', '\n\\1\n', text)
+    text = re.sub(r"'{2,}", '\n', text)
+    # Drop any remaining inline templates
+    while True:
+        stripped = re.sub(r'\{\{[^{}]*\}\}', '', text)
+        if stripped == text:
+            break
+        text = stripped
+    return html.unescape(text)
+
+
+def _template_args(wikitext, start):
+    """Return the body of the template opening at `start` (balanced braces)"""
+    depth = 0
+    i = start
+    while i < len(wikitext) - 1:
+        pair = wikitext[i:i + 2]
+        if pair == '{{':
+            depth += 1
+            i += 2
+            continue
+        if pair == '}}':
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return wikitext[start + 2:i - 2]
+            continue
+        i += 1
+    return None
+
+
+def extract_description(wikitext):
+    """Find the in-game description in a mount page's wikitext, or None"""
+    if not wikitext:
+        return None
+
+    # Literal <blockquote> - the same element the HTML scraper reads
+    match = re.search(r'<blockquote[^>]*>(.*?)</blockquote>', wikitext, flags=re.S | re.I)
+    if match:
+        return match.group(1)
+
+    # {{Quote|...}} / {{Description|...}} style templates
+    match = re.search(r'\{\{\s*(?:quote|blockquote|description)\s*\|', wikitext, flags=re.I)
+    if match:
+        body = _template_args(wikitext, match.start())
+        if body is not None:
+            first_arg = body.split('|', 1)[1] if '|' in body else ''
+            return first_arg.split('|')[0]
+
+    # Infobox parameter: | description = ...
+    match = re.search(r'^\s*\|\s*(?:description|quote)\s*=\s*(.+?)\s*$',
+                      wikitext, flags=re.M | re.I)
+    if match:
+        return match.group(1)
+
+    return None
+
+
+# ==========================
+# API
+# ==========================
+
+def revisions_params(titles):
+    """api.php query parameters for one batch of titles (before any continuation)"""
+    return {
+        "action": "query",
+        "prop": "revisions",
+        "rvprop": "content|ids",
+        "rvslots": "main",
+        "redirects": "1",
+        "format": "json",
+        "formatversion": "2",
+        "titles": "|".join(titles),
+    }
+
+
+def query_revisions(titles, api_url=None, rate_limiter=None):
+    """Fetch wikitext + revision ID for up to BATCH_SIZE titles.
+
+    Returns {requested_title: {"wikitext": str, "revid": int}} for every title
+    that resolved to an existing page.
+    """
+    api_url = api_url or API_URL
+    params = revisions_params(titles)
+    pages = {}
+    resolved = {t: t for t in titles}
+
+    while True:
+        url = f"{api_url}?{urlencode(params)}"
+        response = cached_get(url, timeout=30, rate_limiter=rate_limiter)
+        response.raise_for_status()
+        data = response.json()
+
+        query = data.get("query", {})
+        # Follow normalisation ("air-wheeler A9" -> "Air-wheeler A9") and redirects
+        for step in ("normalized", "redirects"):
+            mapping = {m["from"]: m["to"] for m in query.get(step, [])}
+            for original, current in resolved.items():
+                resolved[original] = mapping.get(current, current)
+
+        for page in query.get("pages", []):
+            if page.get("missing") or not page.get("revisions"):
+                continue
+            revision = page["revisions"][0]
+            slot = revision.get("slots", {}).get("main", revision)
+            pages[page["title"]] = {
+                "wikitext": slot.get("content", ""),
+                "revid": revision.get("revid"),
+            }
+
+        if "continue" not in data:
+            break
+        params.update(data["continue"])
+
+    return {
+        original: pages[final]
+        for original, final in resolved.items()
+        if final in pages
+    }
+
+
+def fetch_descriptions_api(mount_urls, clean, api_url=None,
+                           batch_size=BATCH_SIZE, rate_limiter=None):
+    """Fetch descriptions for many mount URLs through api.php.
+
+    `clean` is the scraper's clean_text. Returns (found, missing): `found`
+    maps url -> {"description", "revid"}; `missing` lists URLs the API could
+    not answer and that should go through the HTML path instead.
+    """
+    urls = list(dict.fromkeys(mount_urls))
+    titles = {url: title_from_url(url) for url in urls}
+    found = {}
+    missing = []
+
+    unique_titles = list(dict.fromkeys(titles.values()))
+    batches = [unique_titles[i:i + batch_size] for i in range(0, len(unique_titles), batch_size)]
+    print(f"Fetching {len(unique_titles)} pages through the wiki API ({len(batches)} requests)...")
+
+    pages = {}
+    for batch in batches:
+        try:
+            pages.update(query_revisions(batch, api_url, rate_limiter))
+        except Exception as e:
+            print(f"  ⚠️  API batch failed ({batch[0]} ... {batch[-1]}): {e}")
+
+    for url in urls:
+        page = pages.get(titles[url])
+        raw = extract_description(page["wikitext"]) if page else None
+        if raw is None:
+            missing.append(url)
+            continue
+        text = strip_wikitext(raw)
+        text = re.sub(r'—\s*In-game description.*$', '', text, flags=re.I)
+        found[url] = {"description": clean(text), "revid": page["revid"]}
+
+    return found, missing
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Record / replay of the wiki traffic for offline runs.
+
+Record: `mount_pipeline.py --record fixtures.zip` saves every response the
+pipeline receives (Mounts page, mount pages, api.php batches, icons) into a
+deflate-compressed zip:
+
+    index.json          "/path?query" (unquoted) -> {"url", "status", "headers", "body"}
+    bodies/<sha256>     response bodies, stored once per distinct content
+
+Recording reads every body in full, so while recording `--backend stream`
+downloads whole mount pages, not just the part up to the description.
+
+Replay: this script serves an archive as a local stand-in for the wiki,
+with optional latency and error injection, and `mount_pipeline.py --replay
+http://127.0.0.1:8765` sends every request there instead of to the real
+host. Output records keep the original URLs, so a replayed build matches a
+live one.
+
+Usage:
+    python3 wiki_fixtures.py serve fixtures.zip [--port 8765] [--latency-ms 50]
+                             [--jitter-ms 20] [--error-rate 0.05]
+                             [--error-status 503] [--retry-after 0] [--seed 1]
+    python3 wiki_fixtures.py list fixtures.zip
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+# ==========================
+# CONFIG
+# ==========================
+FIXTURES_FILE = "wiki_fixtures.zip"
+INDEX_NAME = "index.json"
+DEFAULT_PORT = 8765
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+# ==========================
+# ARCHIVE
+# ==========================
+
+def fixture_key(url):
+    """Archive key of a URL: unquoted path plus query string, host ignored"""
+    parts = urlsplit(url)
+    return unquote(parts.path or "/") + (f"?{unquote(parts.query)}" if parts.query else "")
+
+
+class FixtureRecorder:
+    """Writes responses into the archive as they arrive (thread-safe)"""
+
+    def __init__(self, path=FIXTURES_FILE):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.zip = zipfile.ZipFile(self.tmp_path, 'w', zipfile.ZIP_DEFLATED)
+        self.index = {}
+        self.bodies = set()
+        self.lock = threading.Lock()
+
+    def record(self, url, response):
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        entry = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {k: response.headers[k] for k in KEPT_HEADERS if k in response.headers},
+            "body": digest,
+        }
+        with self.lock:
+            if digest not in self.bodies:
+                self.zip.writestr(f"bodies/{digest}", body)
+                self.bodies.add(digest)
+            self.index[fixture_key(url)] = entry
+
+    def close(self):
+        with self.lock:
+            self.zip.writestr(INDEX_NAME, json.dumps(self.index, indent=1, sort_keys=True))
+            self.zip.close()
+        os.replace(self.tmp_path, self.path)
+        return len(self.index), len(self.bodies)
+
+
+def load_fixtures(path=FIXTURES_FILE):
+    """{key: entry with "content" bytes} from an archive"""
+    with zipfile.ZipFile(path) as z:
+        index = json.loads(z.read(INDEX_NAME))
+        bodies = {}
+        for entry in index.values():
+            digest = entry["body"]
+            if digest not in bodies:
+                bodies[digest] = z.read(f"bodies/{digest}")
+            entry["content"] = bodies[digest]
+    return index
+
+
+# ==========================
+# STAND-IN SERVER
+# ==========================
+
+class FaultInjector:
+    """Seeded latency / error decisions shared by the handler threads"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, error_status=503, seed=None,
+                 retry_after="0"):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after      # Retry-After sent with injected errors (None: no header)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"served": 0, "errors": 0, "not_modified": 0, "missing": 0}
+
+    def next(self):
+        """(delay seconds, inject error?) for one request"""
+        with self.lock:
+            delay = max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+            return delay, self.rng.random() < self.error_rate
+
+    def count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+
+def make_handler(fixtures, faults):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"       # Keep-alive, like the real site
+
+        def _send(self, status, headers=None, body=b""):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            delay, fail = faults.next()
+            if delay:
+                time.sleep(delay)
+            if fail:
+                faults.count("errors")
+                headers = {"Retry-After": faults.retry_after} if faults.retry_after is not None else {}
+                self._send(faults.error_status, headers)
+                return
+
+            entry = fixtures.get(fixture_key(self.path))
+            if entry is None:
+                faults.count("missing")
+                self._send(404, {"Content-Type": "text/plain"}, b"not in fixture archive")
+                return
+
+            headers = entry["headers"]
+            etag = headers.get("ETag")
+            if etag and self.headers.get("If-None-Match") == etag:
+                faults.count("not_modified")
+                self._send(304, {"ETag": etag})
+                return
+
+            faults.count("served")
+            self._send(entry["status"], headers, entry["content"])
+
+        def log_message(self, *args):
+            pass
+
+    return FixtureHandler
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Streamed reads hang up as soon as they have the description
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def start_server(path=FIXTURES_FILE, port=0, faults=None):
+    """Serve an archive on a background thread; returns (server, base URL)"""
+    faults = faults or FaultInjector()
+    server = FixtureServer(("127.0.0.1", port), make_handler(load_fixtures(path), faults))
+    server.faults = faults
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+# ==========================
+# MAIN
+# ==========================
+
+def main():
+    parser = argparse.ArgumentParser(description="Wiki fixture archive tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="serve an archive as a local wiki stand-in")
+    serve.add_argument("archive", nargs="?", default=FIXTURES_FILE)
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--latency-ms", type=float, default=0)
+    serve.add_argument("--jitter-ms", type=float, default=0)
+    serve.add_argument("--error-rate", type=float, default=0.0,
+                       help="fraction of requests answered with --error-status")
+    serve.add_argument("--error-status", type=int, default=503)
+    serve.add_argument("--retry-after", default="0",
+                       help="Retry-After value sent with injected errors, '' for none (default: %(default)s)")
+    serve.add_argument("--seed", type=int, default=None, help="make injected faults reproducible")
+
+    listing = sub.add_parser("list", help="summarize an archive")
+    listing.add_argument("archive", nargs="?", default=FIXTURES_FILE)
+    args = parser.parse_args()
+
+    if args.command == "list":
+        fixtures = load_fixtures(args.archive)
+        size = sum(len(e["content"]) for e in fixtures.values())
+        statuses = {}
+        for entry in fixtures.values():
+            statuses[entry["status"]] = statuses.get(entry["status"], 0) + 1
+        print(f"🗃️  {len(fixtures)} responses, {size:,} body bytes "
+              f"({os.path.getsize(args.archive):,} compressed), statuses {statuses}")
+        return
+
+    faults = FaultInjector(args.latency_ms, args.jitter_ms, args.error_rate, args.error_status, args.seed,
+                           args.retry_after or None)
+    server, url = start_server(args.archive, args.port, faults)
+    print(f"🛰️  Serving {args.archive} at {url} "
+          f"(latency {args.latency_ms:g}±{args.jitter_ms:g} ms, error rate {args.error_rate:g})")
+    print(f"   Run: python3 mount_pipeline.py --replay {url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.faults.stats}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()